@@ -3,10 +3,11 @@
 
 import msvcrt  # ESC 감지용 (Windows 전용)
 from boardka.loader_excel import load_games_from_excel
-from boardka.recommender import recommend_games
+from boardka.recommender import recommend_cursor
 
 
 DATA_PATH = "data/GameList.xlsx"
+PAGE_SIZE = 5  # 한 번에 보여줄 추천 개수
 
 
 def ask_int(prompt: str, default: int | None = None,
@@ -63,6 +64,27 @@ def wait_for_continue_or_escape() -> bool:
     return True
 
 
+def ask_more() -> bool:
+    """
+    다음 추천을 더 볼지 묻는다 (y → 더 보기, 그 외 → 그만)
+    """
+    raw = input(f"다음 {PAGE_SIZE}개를 더 볼까요? (y/엔터=아니오): ").strip().lower()
+    return raw in ("y", "yes", "ㅛ")
+
+
+def print_game(rank: int, game, score: float):
+    tags_str = ", ".join(game.tags) if game.tags else "(태그 없음)"
+    print(f"[{rank}] {game.name_ko}")
+    print(
+        f"    인원: {game.min_players}~{game.max_players}명, "
+        f"시간: {game.min_time}~{game.max_time}분, "
+        f"난이도: {game.difficulty}/5"
+    )
+    print(f"    태그: {tags_str}")
+    print(f"    점수: {score:.3f}")
+    print()
+
+
 def print_results(results: list[tuple], players: int, target_time: int | None):
     print("\n==============================")
 
@@ -79,16 +101,7 @@ def print_results(results: list[tuple], players: int, target_time: int | None):
         return
 
     for rank, (game, score) in enumerate(results, start=1):
-        tags_str = ", ".join(game.tags) if game.tags else "(태그 없음)"
-        print(f"[{rank}] {game.name_ko}")
-        print(
-            f"    인원: {game.min_players}~{game.max_players}명, "
-            f"시간: {game.min_time}~{game.max_time}분, "
-            f"난이도: {game.difficulty}/5"
-        )
-        print(f"    태그: {tags_str}")
-        print(f"    점수: {score:.3f}")
-        print()
+        print_game(rank, game, score)
 
 
 def main():
@@ -132,16 +145,21 @@ def main():
         )
         # scoring에서 None → 기본값 2
 
-        results = recommend_games(
+        # 결과 커서: 점수는 한 번만 계산하고, 더 볼 때마다 다음 순위만 정렬
+        cursor = recommend_cursor(
             games,
             players=players,
             target_time=target_time,
             desired_tags=tags,
             desired_difficulty=desired_difficulty,
-            top_k=5,
+            page_size=PAGE_SIZE,
         )
 
-        print_results(results, players, target_time)
+        print_results(cursor.next_page(), players, target_time)
+        while cursor.has_more and ask_more():
+            start = cursor.position + 1
+            for rank, (game, score) in enumerate(cursor.next_page(), start=start):
+                print_game(rank, game, score)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,2 @@
+# bench/__init__.py
+# 합성 카탈로그로 로더 / 추천기 성능을 재는 벤치마크 (실행: py -m bench)
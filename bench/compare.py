@@ -0,0 +1,60 @@
+# bench/compare.py
+# 두 벤치마크 결과 JSON을 비교해 느려진 항목을 찾는다
+#
+# 실행 예) py -m bench.compare before.json after.json --threshold 1.10
+
+import argparse
+import json
+import sys
+from typing import List, Tuple
+
+
+def _key(entry: dict) -> Tuple[str, int, str]:
+    return entry["case"], entry["size"], entry.get("mix") or ""
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    return {_key(e): e for e in report["results"] if "median_s" in e}
+
+
+def compare(before: dict, after: dict, threshold: float) -> List[tuple]:
+    """
+    양쪽에 모두 있는 항목마다 (키, 이전 중앙값, 이후 중앙값, 비율, 느려졌는지).
+    """
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        old = before[key]["median_s"]
+        new = after[key]["median_s"]
+        ratio = new / old if old > 0 else float("inf")
+        rows.append((key, old, new, ratio, ratio > threshold))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("before", help="기준 결과 JSON")
+    parser.add_argument("after", help="비교할 결과 JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.10,
+        help="중앙값이 이 배율보다 커지면 느려진 것으로 표시 (기본 1.10)",
+    )
+    args = parser.parse_args(argv)
+
+    rows = compare(load_results(args.before), load_results(args.after), args.threshold)
+    regressions = 0
+    for (case, size, mix), old, new, ratio, slower in rows:
+        label = f"{case} [{mix}]" if mix else case
+        mark = "  << 느려짐" if slower else ""
+        print(f"{label:<36} {size:>10}  {old * 1000:10.2f} ms → {new * 1000:10.2f} ms  x{ratio:.2f}{mark}")
+        regressions += slower
+
+    print(f"\n비교 {len(rows)}개 항목, 느려진 항목 {regressions}개")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+# bench/run.py
+# 크기별 합성 카탈로그로 로더 / 점수 계산 / 추천을 측정하고 결과를 JSON으로 출력
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from boardka.catalog import GameCatalog
+from boardka.loader_excel import load_games_from_excel
+from boardka.recommender import recommend_games, recommend_many
+from boardka.scoring import score_game
+
+from .synthetic import MAX_XLSX_ROWS, QUERY_MIXES, generate_games, make_queries, write_xlsx
+
+# 측정 항목 (--cases로 골라 실행)
+CASES = (
+    "generate",
+    "memory",
+    "load_games_from_excel",
+    "load_games_from_excel[snapshot]",
+    "score_game",
+    "GameCatalog",
+    "recommend_games[list]",
+    "recommend_games[catalog]",
+    "recommend_many",
+)
+
+# score_game은 게임 하나 단위라 이 개수까지만 표본으로 잰다
+SCORE_SAMPLE = 200_000
+
+
+def parse_size(text: str) -> int:
+    """
+    '1000', '10k', '1.5M' 같은 크기 표기를 정수로.
+    """
+    units = {"k": 1_000, "m": 1_000_000}
+    text = text.strip().lower().replace("_", "")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def measure(fn: Callable[[], object], repeat: int) -> dict:
+    """
+    fn을 repeat번 실행한 시간(초)의 최솟값 / 중앙값.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"repeat": repeat, "best_s": min(times), "median_s": statistics.median(times)}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _meta(args) -> dict:
+    import pandas as pd
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "seed": args.seed,
+        "queries": args.queries,
+        "repeat": args.repeat,
+    }
+
+
+class Runner:
+    """
+    크기 하나에 대해 고른 항목을 차례로 측정하고 결과 레코드를 모은다.
+    """
+
+    def __init__(self, args, workdir: str):
+        self.args = args
+        self.workdir = workdir
+        self.results: List[dict] = []
+
+    def record(self, case: str, size: int, timing: dict, ops: int = 1, mix: Optional[str] = None, **extra) -> None:
+        entry = {"case": case, "size": size, "mix": mix, "ops": ops, **timing}
+        if "median_s" in timing:
+            entry["per_op_us"] = timing["median_s"] / max(ops, 1) * 1e6
+        entry.update(extra)
+        self.results.append(entry)
+        if not self.args.quiet:
+            label = f"{case} [{mix}]" if mix else case
+            if "median_s" in timing:
+                detail = f"{timing['median_s'] * 1000:10.2f} ms  ({entry['per_op_us']:.2f} us/op)"
+            else:
+                detail = ", ".join(f"{k}={v}" for k, v in timing.items())
+            print(f"  {label:<36} {detail}", file=sys.stderr)
+
+    def wants(self, case: str) -> bool:
+        return case in self.args.cases
+
+    def run_size(self, size: int) -> None:
+        args = self.args
+        if not args.quiet:
+            print(f"== {size}개", file=sys.stderr)
+
+        if self.wants("generate"):
+            self.record("generate", size, measure(lambda: list(generate_games(size, args.seed)), 1), ops=size)
+
+        if self.wants("memory"):
+            gc.collect()
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            kept = list(generate_games(size, args.seed))
+            used = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del kept
+            self.record("memory", size, {"bytes": used, "bytes_per_game": round(used / max(size, 1), 1)})
+
+        games = list(generate_games(size, args.seed))
+        self._run_loader(size)
+
+        mixes = {mix: make_queries(mix, args.queries, seed=args.seed) for mix in args.mixes}
+
+        if self.wants("score_game"):
+            sample = games[:SCORE_SAMPLE]
+            for mix, queries in mixes.items():
+                q = queries[0]
+
+                def score_all(q=q):
+                    for g in sample:
+                        score_game(g, q["desired_tags"], q["preferred_tags"], q["desired_difficulty"])
+
+                self.record("score_game", size, measure(score_all, args.repeat), ops=len(sample), mix=mix)
+
+        if self.wants("recommend_games[list]"):
+            for mix, queries in mixes.items():
+                timing = measure(lambda: [recommend_games(games, **q) for q in queries], args.repeat)
+                self.record("recommend_games[list]", size, timing, ops=len(queries), mix=mix)
+
+        if self.wants("GameCatalog"):
+            self.record("GameCatalog", size, measure(lambda: GameCatalog(games), 1), ops=size)
+
+        if self.wants("recommend_games[catalog]") or self.wants("recommend_many"):
+            catalog = GameCatalog(games)
+            if self.wants("recommend_games[catalog]"):
+                for mix, queries in mixes.items():
+                    timing = measure(lambda: [recommend_games(catalog, **q) for q in queries], args.repeat)
+                    self.record("recommend_games[catalog]", size, timing, ops=len(queries), mix=mix)
+            if self.wants("recommend_many"):
+                for mix, queries in mixes.items():
+                    timing = measure(lambda: recommend_many(catalog, queries), args.repeat)
+                    self.record("recommend_many", size, timing, ops=len(queries), mix=mix)
+            catalog.close()
+
+    def _run_loader(self, size: int) -> None:
+        wants_parse = self.wants("load_games_from_excel")
+        wants_snapshot = self.wants("load_games_from_excel[snapshot]")
+        if not (self.args.xlsx and (wants_parse or wants_snapshot)):
+            return
+        if size > MAX_XLSX_ROWS:
+            print("  (엑셀 최대 행 수를 넘어 로더 측정은 건너뜀)", file=sys.stderr)
+            return
+
+        path = os.path.join(self.workdir, f"games_{size}.xlsx")
+        if not os.path.exists(path):
+            write_xlsx(path, size, self.args.seed)
+
+        if wants_parse:
+            timing = measure(lambda: load_games_from_excel(path, use_cache=False), self.args.repeat)
+            self.record("load_games_from_excel", size, timing, ops=size, file_bytes=os.path.getsize(path))
+
+        if wants_snapshot:
+            cache_path = path + ".snapshot"
+            load_games_from_excel(path, cache_path=cache_path, rebuild_cache=True)
+            timing = measure(lambda: load_games_from_excel(path, cache_path=cache_path), self.args.repeat)
+            self.record("load_games_from_excel[snapshot]", size, timing, ops=size)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="보드게임 추천기 벤치마크 (합성 카탈로그)")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=parse_size,
+        default=[1_000, 10_000, 100_000],
+        help="카탈로그 크기들 (예: 1k 100k 10M)",
+    )
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES), help="측정할 항목")
+    parser.add_argument("--mixes", nargs="+", choices=QUERY_MIXES, default=list(QUERY_MIXES), help="질의 유형")
+    parser.add_argument("--queries", type=int, default=20, help="질의 유형마다 실행할 질의 수")
+    parser.add_argument("--repeat", type=int, default=3, help="항목마다 반복 횟수 (중앙값 / 최솟값 기록)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 / 질의 난수 시드")
+    parser.add_argument(
+        "--xlsx",
+        action="store_true",
+        help="크기마다 엑셀 파일을 만들어 load_games_from_excel도 측정 (큰 크기는 파일 쓰기가 오래 걸림)",
+    )
+    parser.add_argument("--workdir", default=None, help="합성 엑셀을 둘 폴더 (기본: 임시 폴더, 끝나면 삭제)")
+    parser.add_argument("--out", default=None, help="결과 JSON 파일 (기본: 표준출력)")
+    parser.add_argument("--quiet", action="store_true", help="진행 상황을 출력하지 않음")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="boardka-bench-") as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+
+        runner = Runner(args, workdir)
+        for size in args.sizes:
+            runner.run_size(size)
+
+    report = {"meta": _meta(args), "results": runner.results}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
@@ -0,0 +1,106 @@
+# bench/startup.py
+# 스냅샷이 있을 때 CLI / GUI 시작 경로가 pandas를 읽지 않는지, CLI 한 번 실행이 목표 시간 안에 끝나는지 확인
+#
+# 실행 예) py -m bench.startup --repeat 5
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 스냅샷이 유효할 때 `recommend.py --players 4 --time 60` 한 번의 벽시계 시간 목표(중앙값, 초)
+# (pandas import만 0.2초 남짓이라, pandas를 읽으면 이 목표를 넘는다)
+STARTUP_TARGET_S = 0.35
+
+# 하위 프로세스에서 실행 후 무거운 모듈을 읽었는지 출력
+_CLI_CHECK = """
+import runpy, sys
+sys.argv = ["recommend.py"] + {argv!r}
+runpy.run_path("recommend.py", run_name="__main__")
+sys.stderr.write("MODULES " + " ".join(m for m in ("pandas", "openpyxl") if m in sys.modules) + "\\n")
+"""
+
+_GUI_CHECK = """
+import sys
+try:
+    import gui
+except ImportError as e:  # tkinter 없는 환경
+    sys.stderr.write("SKIP " + str(e) + "\\n")
+    raise SystemExit(0)
+live = gui.LiveCatalog({data!r}, interval=gui.RELOAD_INTERVAL)
+gui.RankingSession(live.catalog).update(players=4, target_time=60, desired_tags=[]).fetch(0, gui.PAGE_SIZE)
+sys.stderr.write("MODULES " + " ".join(m for m in ("pandas", "openpyxl") if m in sys.modules) + "\\n")
+"""
+
+
+def _run(code: str) -> str:
+    """
+    코드를 새 파이썬 프로세스에서 실행하고 표준에러의 MODULES / SKIP 줄을 돌려준다.
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    for line in out.stderr.splitlines():
+        if line.startswith(("MODULES", "SKIP")):
+            return line
+    raise RuntimeError(f"검사 결과를 찾을 수 없습니다:\n{out.stderr}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="시작 시간 / 지연 import 확인")
+    parser.add_argument("--data", default="data/GameList.xlsx", help="엑셀 파일 경로 (저장소 기준)")
+    parser.add_argument("--repeat", type=int, default=5, help="CLI 실행 횟수 (중앙값 기록)")
+    parser.add_argument("--target", type=float, default=STARTUP_TARGET_S, help="CLI 시작 목표 시간(초)")
+    args = parser.parse_args(argv)
+
+    # 스냅샷 준비 (이 프로세스는 pandas를 읽어도 상관없음)
+    sys.path.insert(0, ROOT)
+    from boardka.loader_excel import load_games_from_excel
+
+    load_games_from_excel(os.path.join(ROOT, args.data))
+
+    cli_argv = ["--data", args.data, "--players", "4", "--time", "60"]
+    failures = []
+
+    cli_modules = _run(_CLI_CHECK.format(argv=cli_argv)).split()[1:]
+    if cli_modules:
+        failures.append(f"CLI가 {', '.join(cli_modules)}를 import했습니다.")
+
+    gui_line = _run(_GUI_CHECK.format(data=args.data))
+    gui_modules = gui_line.split()[1:] if gui_line.startswith("MODULES") else None
+    if gui_modules:
+        failures.append(f"GUI 로딩이 {', '.join(gui_modules)}를 import했습니다.")
+
+    times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "recommend.py", *cli_argv],
+            cwd=ROOT, stdout=subprocess.DEVNULL, check=True,
+        )
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    if median > args.target:
+        failures.append(f"CLI 시작 시간 {median:.3f}초가 목표 {args.target:.3f}초를 넘었습니다.")
+
+    report = {
+        "cli_median_s": round(median, 4),
+        "cli_best_s": round(min(times), 4),
+        "target_s": args.target,
+        "cli_heavy_modules": cli_modules,
+        "gui_heavy_modules": gui_modules if gui_modules is not None else gui_line,
+        "ok": not failures,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    for msg in failures:
+        print(msg, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
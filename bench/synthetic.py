@@ -0,0 +1,163 @@
+# bench/synthetic.py
+# 동아리 GameList.xlsx와 비슷한 분포의 합성 게임 목록 / 질의 생성기
+
+import sys
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from boardka.models import Game
+
+# 엑셀 한 시트에 넣을 수 있는 최대 데이터 행 수 (헤더 한 줄 제외)
+MAX_XLSX_ROWS = 1_048_575
+
+# 한 번에 만드는 게임 수 (메모리를 일정하게 유지)
+CHUNK = 100_000
+
+# 태그 → 가중치 (GameList.xlsx의 태그별 게임 수를 그대로 사용, 자주 쓰는 태그일수록 많이 뽑힌다)
+TAG_WEIGHTS = {
+    "전략": 95, "파티": 72, "협력": 64, "카드": 63, "스토리": 57, "추론": 52, "퍼즐": 51,
+    "주사위": 27, "유로게임": 27, "롤플레잉": 24, "미스터리": 24, "엔진빌딩": 23, "블러핑": 21,
+    "영향력": 20, "모험": 18, "sf": 16, "경제": 16, "추상전략": 14, "행동": 13, "타일놓기": 12,
+    "비대칭": 12, "덱빌딩": 10, "반응": 6, "일꾼놓기": 6, "트릭테이킹": 6, "전투": 6,
+    "드래프팅": 4, "세트컬렉션": 4, "클라이밍": 4, "가족게임": 4, "베팅": 3, "생존": 3,
+    "공포": 3, "전쟁": 3, "역사": 3, "푸시유어럭": 2, "경매": 2, "판타지": 2, "네트워크구축": 2,
+    "레이싱": 2, "단어": 2, "영역장악": 2, "액션선택": 2, "레거시": 1, "불완전정보": 1,
+    "액션포인트": 1, "배신": 1, "시나리오": 1, "기억력": 1, "심리전": 1, "협상": 1, "자원관리": 1,
+}
+TAGS = [sys.intern(t) for t in TAG_WEIGHTS]
+
+# (값, 비율) 분포 — GameList.xlsx에서 센 값을 반올림
+MIN_PLAYERS = ([1, 2, 3, 4, 5, 6, 7, 8], [22, 55, 12, 6, 2, 2, 0.5, 0.5])
+MAX_PLAYERS = ([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 100], [2, 11, 1, 32, 16, 21, 3, 9, 2, 2, 0.5, 2])
+MIN_TIME = ([5, 10, 15, 20, 30, 40, 45, 60, 90, 120, 180], [2, 3, 16, 12, 20, 4, 4, 18, 7, 10, 4])
+TIME_STRETCH = ([1.0, 1.5, 2.0, 3.0], [55, 20, 20, 5])  # 최대 시간 = 최소 시간 × 배율
+DIFFICULTY = ([1, 2, 3, 4, 5], [27, 44, 18, 7, 4])
+TAG_COUNT = ([1, 2, 3, 4, 5, 6], [6, 10, 25, 31, 21, 7])
+
+
+def _pick(rng: np.random.Generator, dist, size: int) -> np.ndarray:
+    values, weights = dist
+    p = np.asarray(weights, dtype=np.float64)
+    return rng.choice(np.asarray(values), size=size, p=p / p.sum())
+
+
+def _sample_tags(rng: np.random.Generator, size: int) -> List[List[str]]:
+    """
+    게임마다 1~6개의 서로 다른 태그를 가중치대로 뽑는다.
+    (Gumbel top-k: 가중치 로그에 노이즈를 더해 큰 순서로 k개 = 비복원 가중 추출)
+    """
+    logw = np.log(np.fromiter(TAG_WEIGHTS.values(), dtype=np.float64))
+    keys = logw + rng.gumbel(size=(size, len(TAGS)))
+    order = np.argsort(-keys, axis=1)[:, : max(TAG_COUNT[0])]
+    counts = _pick(rng, TAG_COUNT, size)
+    return [[TAGS[c] for c in row[:k]] for row, k in zip(order.tolist(), counts.tolist())]
+
+
+def generate_games(n: int, seed: int = 0) -> Iterator[Game]:
+    """
+    합성 게임 n개를 CHUNK개씩 만들어 yield. 같은 seed면 항상 같은 목록이 나온다.
+    id는 1부터 n까지.
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, CHUNK):
+        size = min(CHUNK, n - start)
+
+        min_p = _pick(rng, MIN_PLAYERS, size)
+        max_p = np.maximum(min_p, _pick(rng, MAX_PLAYERS, size))
+        min_t = _pick(rng, MIN_TIME, size)
+        max_t = (min_t * _pick(rng, TIME_STRETCH, size)).astype(np.int64)
+        diff = _pick(rng, DIFFICULTY, size)
+        tags = _sample_tags(rng, size)
+
+        for i, (a, b, c, d, e, t) in enumerate(
+            zip(min_p.tolist(), max_p.tolist(), min_t.tolist(), max_t.tolist(), diff.tolist(), tags)
+        ):
+            gid = start + i + 1
+            yield Game(
+                id=gid,
+                name_ko=f"합성게임 {gid}",
+                min_players=a,
+                max_players=b,
+                min_time=c,
+                max_time=d,
+                difficulty=e,
+                tags=t,
+            )
+
+
+def write_xlsx(path: str, n: int, seed: int = 0) -> None:
+    """
+    합성 게임 n개를 GameList.xlsx와 같은 컬럼으로 저장 (쓰기 전용 모드라 메모리는 일정).
+    """
+    if n > MAX_XLSX_ROWS:
+        raise ValueError(f"엑셀 시트에는 최대 {MAX_XLSX_ROWS}행까지만 쓸 수 있습니다: {n}")
+
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["이름", "최소인원", "최대인원", "최소 플레이타임", "최대 플레이타임", "난이도", "tags", "id"])
+    for g in generate_games(n, seed):
+        ws.append([
+            g.name_ko, g.min_players, g.max_players, g.min_time, g.max_time,
+            g.difficulty, ", ".join(g.tags), g.id,
+        ])
+    wb.save(path)
+
+
+# ----------------- 질의 묶음 -----------------
+
+# 프런트엔드별 대표 질의 유형
+#  cli   : recommend.py처럼 인원 + 시간 + 태그 1~3개 + 난이도
+#  gui   : 체크박스 태그 0~4개, 시간 / 난이도는 비울 때가 많고 선호 태그 상위 5개가 붙는다
+#  broad : 인원만 지정 (후보가 가장 많고 점수가 거의 다 같은 최악의 경우)
+QUERY_MIXES = ("cli", "gui", "broad")
+
+
+def make_queries(mix: str, count: int, seed: int = 0, top_k: int = 5) -> List[dict]:
+    """
+    recommend_games 키워드 인자 dict 목록을 만든다.
+    """
+    if mix not in QUERY_MIXES:
+        raise ValueError(f"알 수 없는 질의 유형입니다: {mix}")
+
+    rng = np.random.default_rng(seed)
+    tag_p = np.fromiter(TAG_WEIGHTS.values(), dtype=np.float64)
+    tag_p /= tag_p.sum()
+
+    def tags(k: int) -> List[str]:
+        return [TAGS[i] for i in rng.choice(len(TAGS), size=k, replace=False, p=tag_p)]
+
+    queries = []
+    for _ in range(count):
+        players = int(rng.integers(2, 7))
+        target_time: Optional[int] = None
+        difficulty: Optional[int] = None
+
+        if mix == "cli":
+            target_time = int(rng.choice([30, 45, 60, 90, 120]))
+            desired = tags(int(rng.integers(1, 4)))
+            difficulty = int(rng.integers(1, 6))
+            preferred: List[str] = []
+        elif mix == "gui":
+            if rng.random() < 0.5:
+                target_time = int(rng.choice([30, 60, 90]))
+            if rng.random() < 0.5:
+                difficulty = int(rng.integers(1, 6))
+            desired = tags(int(rng.integers(0, 5)))
+            preferred = tags(5)
+        else:
+            desired, preferred = [], []
+
+        queries.append(
+            {
+                "players": players,
+                "target_time": target_time,
+                "desired_tags": desired,
+                "desired_difficulty": difficulty,
+                "top_k": top_k,
+                "preferred_tags": preferred,
+            }
+        )
+    return queries
@@ -0,0 +1,76 @@
+# boardka/api.py
+# 배치 / HTTP 등 외부 입력(dict)과 추천 결과(JSON용 dict) 사이 변환
+
+from typing import Any, List, Tuple
+
+from .models import Game
+
+
+def _tag_list(value: Any) -> List[str]:
+    # "전략,카드" 같은 문자열도 받는다
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [t.strip() for t in value.split(",") if t.strip()]
+    return [str(t) for t in value]
+
+
+def _opt_int(value: Any):
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def query_from_dict(raw: dict) -> dict:
+    """
+    질의 dict를 recommend_games 키워드 인자로 변환.
+    CLI 옵션 이름(time, tags, difficulty)도 같이 받는다.
+    값이 잘못되면 ValueError.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("질의는 JSON 객체여야 합니다.")
+    if raw.get("players") in (None, ""):
+        raise ValueError("players가 없습니다.")
+
+    try:
+        return {
+            "players": int(raw["players"]),
+            "target_time": _opt_int(raw.get("target_time", raw.get("time"))),
+            "desired_tags": _tag_list(raw.get("desired_tags", raw.get("tags"))),
+            "desired_difficulty": _opt_int(raw.get("desired_difficulty", raw.get("difficulty"))),
+            "top_k": int(raw.get("top_k", 5)),
+            "preferred_tags": _tag_list(raw.get("preferred_tags")),
+        }
+    except TypeError as e:
+        raise ValueError(str(e)) from e
+
+
+def result_to_dict(game: Game, score: float) -> dict:
+    return {
+        "id": game.id,
+        "name_ko": game.name_ko,
+        "min_players": game.min_players,
+        "max_players": game.max_players,
+        "min_time": game.min_time,
+        "max_time": game.max_time,
+        "difficulty": game.difficulty,
+        "tags": list(game.tags),
+        "score": score,
+    }
+
+
+def result_from_dict(raw: dict) -> Tuple[Game, float]:
+    """
+    result_to_dict의 반대 (데몬 응답을 CLI 출력용 (Game, 점수)로 되돌릴 때 사용).
+    """
+    game = Game(
+        id=raw["id"],
+        name_ko=raw["name_ko"],
+        min_players=raw["min_players"],
+        max_players=raw["max_players"],
+        min_time=raw["min_time"],
+        max_time=raw["max_time"],
+        difficulty=raw["difficulty"],
+        tags=list(raw["tags"]),
+    )
+    return game, raw["score"]
@@ -0,0 +1,156 @@
+# boardka/cache.py
+# 같은 질의가 반복될 때 recommend_games 결과를 재사용하는 LRU 캐시
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from .cursor import ResultCursor
+from .models import Game
+from .recommender import recommend_cursor, recommend_games
+
+
+def _tag_key(tags: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    # 점수는 공백 정리 후 중복 없는 태그 집합에만 의존하므로 정렬해서 키로 사용
+    return tuple(sorted({t.strip() for t in (tags or []) if t.strip()}))
+
+
+def query_key(
+    players: int,
+    target_time: Optional[int],
+    desired_tags: List[str],
+    desired_difficulty: Optional[int] = None,
+    top_k: int = 5,
+    preferred_tags: Optional[List[str]] = None,
+) -> tuple:
+    """
+    결과가 같은 질의끼리 같은 키가 되도록 정규화.
+    """
+    return (
+        players,
+        target_time,
+        _tag_key(desired_tags),
+        desired_difficulty,
+        top_k,
+        _tag_key(preferred_tags),
+    )
+
+
+class RecommendationCache:
+    """
+    recommend_games 앞에 두는 크기 제한 LRU 캐시.
+    - 다른 카탈로그(게임 목록 객체)가 들어오면 자동으로 비운다 (다시 로딩한 경우)
+    - 선호 태그가 바뀌면 invalidate()로 비운다
+    - hits / misses로 적중 횟수를 확인할 수 있다
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # 값: top_k개 결과 목록, 또는 cursor()로 만든 ResultCursor
+        self._entries: "OrderedDict[tuple, object]" = OrderedDict()
+        self._games = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self) -> None:
+        """
+        저장된 결과 전부 삭제 (카운터는 유지).
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+    def recommend(
+        self,
+        games,
+        players: int,
+        target_time: Optional[int],
+        desired_tags: List[str],
+        desired_difficulty: Optional[int] = None,
+        top_k: int = 5,
+        preferred_tags: Optional[List[str]] = None,
+        **kwargs,
+    ) -> List[Tuple[Game, float]]:
+        """
+        recommend_games와 같은 인자 / 결과. 나머지 kwargs(workers 등)는 그대로 전달.
+        """
+        key = query_key(players, target_time, desired_tags, desired_difficulty, top_k, preferred_tags)
+
+        cached = self._lookup(games, key)
+        if cached is not None:
+            return list(cached)
+
+        results = recommend_games(
+            games,
+            players=players,
+            target_time=target_time,
+            desired_tags=desired_tags,
+            desired_difficulty=desired_difficulty,
+            top_k=top_k,
+            preferred_tags=preferred_tags,
+            **kwargs,
+        )
+
+        self._store(games, key, list(results))
+        return results
+
+    def cursor(
+        self,
+        games,
+        players: int,
+        target_time: Optional[int],
+        desired_tags: List[str],
+        desired_difficulty: Optional[int] = None,
+        preferred_tags: Optional[List[str]] = None,
+        **kwargs,
+    ) -> ResultCursor:
+        """
+        recommend_cursor와 같은 인자. 같은 질의면 이미 정렬해 둔 앞부분을 가진 커서를 재사용한다.
+        커서는 여러 곳에서 같이 쓰므로 읽을 때는 위치를 바꾸지 않는 fetch(offset, limit)를 쓴다.
+        """
+        key = query_key(players, target_time, desired_tags, desired_difficulty, None, preferred_tags) + ("cursor",)
+
+        cached = self._lookup(games, key)
+        if cached is not None:
+            return cached
+
+        cursor = recommend_cursor(
+            games,
+            players=players,
+            target_time=target_time,
+            desired_tags=desired_tags,
+            desired_difficulty=desired_difficulty,
+            preferred_tags=preferred_tags,
+            **kwargs,
+        )
+        self._store(games, key, cursor)
+        return cursor
+
+    def _lookup(self, games, key: tuple):
+        with self._lock:
+            if games is not self._games:
+                # 카탈로그가 바뀌었으면 예전 결과는 모두 무효
+                self._entries.clear()
+                self._games = games
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+            return None
+
+    def _store(self, games, key: tuple, value) -> None:
+        with self._lock:
+            # 계산하는 동안 카탈로그가 바뀌었으면 저장하지 않는다
+            if games is self._games and self.maxsize > 0:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
@@ -0,0 +1,446 @@
+# boardka/catalog.py
+
+import threading
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .index import CandidateIndex, TIME_TOLERANCE
+from .metrics import Metrics
+from .models import Game
+from .scoring import MAX_TAG_SCORE, MAX_DIFF_SCORE
+from .tags import TagVocabulary
+
+
+class GameCatalog:
+    """
+    게임 목록을 컬럼(NumPy 배열) 형태로 들고 있는 카탈로그.
+    인원 필터 / 시간 페널티 / 태그·난이도 점수를 배열 연산으로 한 번에 계산한다.
+    """
+
+    # 점수 계산에 필요한 배열 컬럼 (공유 메모리로 넘길 때 사용)
+    ARRAY_COLUMNS = (
+        "min_players", "max_players", "min_time", "max_time",
+        "difficulty", "id_rank", "tag_matrix",
+    )
+
+    # Game 속성 → 정수 배열 컬럼
+    INT_COLUMNS = ("min_players", "max_players", "min_time", "max_time", "difficulty")
+
+    def __init__(self, games: Iterable[Game], columns: Optional[dict] = None):
+        """
+        columns: games와 같은 순서의 INT_COLUMNS 정수 배열 (Arrow 로더처럼 이미 배열이 있으면
+        Game 속성을 하나씩 다시 읽지 않고 그대로 쓴다)
+        """
+        self.games: List[Game] = list(games)
+        n = len(self.games)
+
+        for name in self.INT_COLUMNS:
+            if columns is not None:
+                arr = np.asarray(columns[name], dtype=np.int64)
+                if arr.shape != (n,):
+                    raise ValueError(f"{name} 컬럼 길이({arr.shape})가 게임 수({n})와 다릅니다.")
+            else:
+                arr = np.fromiter((int(getattr(g, name)) for g in self.games), dtype=np.int64, count=n)
+            setattr(self, name, arr)
+
+        # 태그 사전(태그 → 열 번호), 게임 × 태그 소속 행렬 (행 = 게임 태그 비트마스크)
+        self.vocab = TagVocabulary()
+        masks = [self.vocab.add_game(g) for g in self.games]
+        self.tag_matrix = np.zeros((n, len(self.vocab)), dtype=bool)
+        self._fill_tags(range(n), masks)
+
+        self._build_indexes()
+
+    def _fill_tags(self, positions: Iterable[int], masks: Iterable[int]) -> None:
+        """
+        주어진 위치의 게임 태그 비트마스크(이 카탈로그 사전 기준, positions와 같은 순서)를 태그 행렬 행에 기록.
+        """
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, mask in zip(positions, masks):
+            while mask:
+                low = mask & -mask
+                rows.append(i)
+                cols.append(low.bit_length() - 1)
+                mask ^= low
+        self.tag_matrix[rows, cols] = True
+
+    def _build_indexes(self) -> None:
+        n = len(self.games)
+        self.tag_index = self.vocab.ids
+
+        # 동점 정렬용: id 오름차순 순위 (id가 같으면 원래 순서)
+        self.id_rank = np.empty(n, dtype=np.int64)
+        self.id_rank[sorted(range(n), key=lambda i: self.games[i].id)] = np.arange(n)
+
+        # 인원 / 시간 후보 인덱스
+        self.index = CandidateIndex(self.min_players, self.max_players, self.min_time, self.max_time)
+        self._sharded: dict = {}
+        self._similarity = None
+        self._similarity_lock = threading.Lock()
+
+    def with_changes(self, upserts: Iterable[Game], removed_ids: Iterable = ()) -> "GameCatalog":
+        """
+        일부 게임만 추가 / 수정(upserts, id 기준) / 삭제(removed_ids)한 새 카탈로그를 만든다.
+        기존 카탈로그는 건드리지 않으므로, 새 카탈로그로 참조만 바꾸면 교체가 원자적으로 끝난다.
+        바뀌지 않은 게임은 Game 객체, 배열 행(태그 행렬 행 포함)을 그대로 재사용한다.
+        """
+        pending = {g.id: g for g in upserts}
+        removed = set(removed_ids)
+        vocab = self.vocab.copy()
+
+        games: List[Game] = []
+        keep_rows: List[int] = []
+        changed: List[int] = []  # 새 카탈로그에서 다시 채워야 하는 위치
+        for i, g in enumerate(self.games):
+            if g.id in removed:
+                vocab.remove_game(g)
+                continue
+            new = pending.pop(g.id, None)
+            if new is not None:
+                vocab.remove_game(g)
+                changed.append(len(games))
+                g = new
+            keep_rows.append(i)
+            games.append(g)
+
+        # 남은 것은 새로 추가된 게임
+        changed.extend(range(len(games), len(games) + len(pending)))
+        games.extend(pending.values())
+        masks = [vocab.add_game(games[pos]) for pos in changed]
+
+        catalog = GameCatalog.__new__(GameCatalog)
+        catalog.games = games
+        catalog.vocab = vocab
+
+        rows = np.asarray(keep_rows, dtype=np.int64)
+        extra = len(games) - len(keep_rows)
+        for name in self.INT_COLUMNS:
+            arr = np.concatenate([getattr(self, name)[rows], np.zeros(extra, dtype=np.int64)])
+            arr[changed] = [int(getattr(games[pos], name)) for pos in changed]
+            setattr(catalog, name, arr)
+
+        matrix = np.zeros((len(games), len(vocab)), dtype=bool)
+        matrix[: len(rows), : self.tag_matrix.shape[1]] = self.tag_matrix[rows]
+        matrix[changed] = False
+        catalog.tag_matrix = matrix
+        catalog._fill_tags(changed, masks)
+
+        catalog._build_indexes()
+        return catalog
+
+    @classmethod
+    def from_arrays(cls, arrays: dict, tag_index: dict) -> "GameCatalog":
+        """
+        Game 객체 없이 배열 컬럼만으로 카탈로그를 만든다 (샤드 워커용).
+        결과는 게임 번호로만 다룰 수 있다 (top_indices).
+        """
+        catalog = cls.__new__(cls)
+        catalog.games = None
+        catalog.vocab = None
+        catalog.tag_index = tag_index
+        for name in cls.ARRAY_COLUMNS:
+            setattr(catalog, name, arrays[name])
+        catalog.index = CandidateIndex(
+            catalog.min_players, catalog.max_players, catalog.min_time, catalog.max_time
+        )
+        catalog._sharded = {}
+        catalog._similarity = None
+        catalog._similarity_lock = threading.Lock()
+        return catalog
+
+    def sharded(self, workers: int):
+        """
+        workers개 프로세스로 나눈 ShardedCatalog (처음 요청할 때 만들고 재사용).
+        """
+        from .parallel import ShardedCatalog
+
+        shards = self._sharded.get(workers)
+        if shards is None or shards.closed:
+            shards = ShardedCatalog(self, workers)
+            self._sharded[workers] = shards
+        return shards
+
+    def similarity_index(self):
+        """
+        "비슷한 게임" 검색용 MinHash / LSH 인덱스 (처음 요청할 때 만들고 재사용).
+        여러 스레드(데몬 / 서버)에서 동시에 불러도 인덱스는 한 번만 만든다.
+        """
+        from .similar import SimilarityIndex
+
+        if self._similarity is None:
+            with self._similarity_lock:
+                if self._similarity is None:
+                    self._similarity = SimilarityIndex(self.games)
+        return self._similarity
+
+    def close(self) -> None:
+        """
+        샤드 워커 프로세스 / 공유 메모리 정리.
+        """
+        for shards in self._sharded.values():
+            shards.close()
+        self._sharded.clear()
+
+    def __len__(self) -> int:
+        return len(self.min_players)
+
+    def __iter__(self):
+        return iter(self.games)
+
+    def __getitem__(self, idx: int) -> Game:
+        return self.games[idx]
+
+    # ----------------- 점수 계산 -----------------
+
+    def _rows(self, idx: Optional[np.ndarray]) -> np.ndarray:
+        if idx is None:
+            return np.arange(len(self))
+        return idx
+
+    def _overlap(self, tags: List[str], idx: np.ndarray) -> Tuple[np.ndarray, int]:
+        """
+        주어진 태그 목록과 각 게임 태그의 겹치는 개수, 정리된 태그 개수를 반환.
+        """
+        wanted = {t.strip() for t in tags if t.strip()}
+        cols = [self.tag_index[t] for t in wanted if t in self.tag_index]
+        if not cols:
+            return np.zeros(len(idx), dtype=np.int64), len(wanted)
+        overlap = self.tag_matrix[np.ix_(idx, cols)].sum(axis=1, dtype=np.int64)
+        return overlap, len(wanted)
+
+    def _difficulty_score(self, desired_difficulty: Optional[int], idx: np.ndarray) -> np.ndarray:
+        if desired_difficulty is None:
+            return np.zeros(len(idx), dtype=np.float64)
+        diff = np.abs(self.difficulty[idx] - int(desired_difficulty))
+        return np.where(diff == 0, MAX_DIFF_SCORE, np.where(diff == 1, MAX_DIFF_SCORE * 0.4, 0.0))
+
+    def score(
+        self,
+        selected_tags: List[str],
+        preferred_tags: List[str],
+        desired_difficulty: Optional[int],
+        idx: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        scoring.score_game과 같은 규칙으로 기본 점수를 배열로 계산.
+        idx를 주면 그 게임들만 계산한다.
+        """
+        idx = self._rows(idx)
+        n = len(idx)
+
+        tag_score = np.zeros(n, dtype=np.float64)
+        if selected_tags:
+            overlap, size = self._overlap(selected_tags, idx)
+            if size:
+                tag_score = MAX_TAG_SCORE * (overlap / size)
+
+        pref_score = np.zeros(n, dtype=np.float64)
+        if preferred_tags:
+            overlap, size = self._overlap(preferred_tags, idx)
+            if size:
+                pref_score = (MAX_TAG_SCORE * (overlap / size)) * 0.3   # 0.3배 반영
+
+        diff_score = self._difficulty_score(desired_difficulty, idx)
+
+        return tag_score + pref_score + diff_score
+
+    def preference_matrix(self, profiles: Sequence[Iterable[str]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        사용자별 선호 태그 목록을 사용자 × 태그 행렬로 변환.
+        반환: (태그 열 번호, 행렬[사용자, 열] = 0/1, 사용자별 정리된 선호 태그 수)
+        열은 누군가의 선호 태그에 들어 있는 카탈로그 태그만 남긴다 (없는 태그는 개수에만 포함, _overlap과 같은 규칙).
+        """
+        wanted = [{t.strip() for t in tags if t.strip()} for tags in profiles]
+        sizes = np.fromiter((len(w) for w in wanted), dtype=np.int64, count=len(wanted))
+
+        cols = sorted({self.tag_index[t] for w in wanted for t in w if t in self.tag_index})
+        position = {c: j for j, c in enumerate(cols)}
+        matrix = np.zeros((len(wanted), len(cols)), dtype=np.float32)
+        for u, w in enumerate(wanted):
+            for t in w:
+                c = self.tag_index.get(t)
+                if c is not None:
+                    matrix[u, position[c]] = 1.0
+        return np.asarray(cols, dtype=np.int64), matrix, sizes
+
+    def score_users(
+        self,
+        selected_tags: List[str],
+        profiles: Sequence[Iterable[str]],
+        desired_difficulty: Optional[int],
+        idx: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        선호 태그만 다른 여러 사용자의 기본 점수를 한 번에 계산 (게임 × 사용자 배열).
+        선호 태그 겹침 수는 (게임 × 태그) @ (태그 × 사용자) 행렬곱 한 번으로 구하고,
+        열마다 score(selected_tags, profiles[u], desired_difficulty, idx)와 같은 값이 된다.
+        """
+        idx = self._rows(idx)
+        n = len(idx)
+
+        tag_score = np.zeros(n, dtype=np.float64)
+        if selected_tags:
+            overlap, size = self._overlap(selected_tags, idx)
+            if size:
+                tag_score = MAX_TAG_SCORE * (overlap / size)
+
+        cols, matrix, sizes = self.preference_matrix(profiles)
+        if cols.size:
+            # 0/1 행렬곱이라 float32로도 겹침 수가 정확히 나온다
+            overlap = self.tag_matrix[np.ix_(idx, cols)].astype(np.float32) @ matrix.T
+            pref_score = (MAX_TAG_SCORE * (overlap / np.maximum(sizes, 1))) * 0.3   # 0.3배 반영
+        else:
+            pref_score = np.zeros((n, len(sizes)), dtype=np.float64)
+
+        diff_score = self._difficulty_score(desired_difficulty, idx)
+
+        return (tag_score[:, None] + pref_score) + diff_score[:, None]
+
+    def time_penalty(self, target_time: Optional[int], idx: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        시간 페널티 배열: 범위 안 1.0, 30분 이내 0.7, 그 이상이면 0.0(제외).
+        idx를 주면 그 게임들만 계산한다.
+        """
+        idx = self._rows(idx)
+        if target_time is None:
+            return np.ones(len(idx), dtype=np.float64)
+
+        min_time = self.min_time[idx]
+        max_time = self.max_time[idx]
+        diff = np.where(
+            target_time < min_time,
+            min_time - target_time,
+            np.where(target_time > max_time, target_time - max_time, 0),
+        )
+        return np.where(diff == 0, 1.0, np.where(diff <= TIME_TOLERANCE, 0.7, 0.0))
+
+    def candidates(self, players: int, target_time: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        인원 / 시간 조건을 통과한 게임 번호(오름차순)와 각 게임의 시간 페널티.
+        태그·난이도와 무관하므로 같은 인원/시간 질의끼리 재사용할 수 있다.
+        """
+        idx = self.index.candidates(players, target_time)
+        penalty = self.time_penalty(target_time, idx)
+        keep = penalty > 0.0
+        return idx[keep], penalty[keep]
+
+    def top_indices(
+        self,
+        idx: np.ndarray,
+        penalty: np.ndarray,
+        desired_tags: List[str],
+        desired_difficulty: Optional[int] = None,
+        top_k: int = 5,
+        preferred_tags: Optional[List[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        candidates()로 고른 후보에 점수를 매기고 상위 top_k개의 (게임 번호, 점수)를 반환.
+        점수 내림차순, 동점이면 id 오름차순.
+        """
+        if top_k <= 0 or idx.size == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        if preferred_tags is None:
+            preferred_tags = []
+
+        scores = self.score(desired_tags, preferred_tags, desired_difficulty, idx) * penalty
+        return self.select_top(idx, scores, top_k)
+
+    def select_top(self, idx: np.ndarray, scores: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (게임 번호, 점수) 배열에서 상위 top_k개를 순서대로 고른다.
+        """
+        # 상위 top_k만 부분 선택 (경계 동점은 모두 남긴 뒤 id 순으로 정렬)
+        if top_k < idx.size:
+            kth = np.partition(-scores, top_k - 1)[top_k - 1]
+            keep = np.flatnonzero(-scores <= kth)
+            idx, scores = idx[keep], scores[keep]
+
+        order = np.lexsort((self.id_rank[idx], -scores))[:top_k]
+        return idx[order], scores[order]
+
+    def rank(
+        self,
+        idx: np.ndarray,
+        penalty: np.ndarray,
+        desired_tags: List[str],
+        desired_difficulty: Optional[int] = None,
+        top_k: int = 5,
+        preferred_tags: Optional[List[str]] = None,
+    ) -> List[Tuple[Game, float]]:
+        """
+        top_indices 결과를 (Game, 점수) 목록으로 변환.
+        """
+        top, scores = self.top_indices(idx, penalty, desired_tags, desired_difficulty, top_k, preferred_tags)
+        return self.to_results(top, scores)
+
+    def to_results(self, idx: np.ndarray, scores: np.ndarray) -> List[Tuple[Game, float]]:
+        return [(self.games[i], float(s)) for i, s in zip(idx.tolist(), scores.tolist())]
+
+    def recommend(
+        self,
+        players: int,
+        target_time: Optional[int],
+        desired_tags: List[str],
+        desired_difficulty: Optional[int] = None,
+        top_k: int = 5,
+        preferred_tags: Optional[List[str]] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> List[Tuple[Game, float]]:
+        """
+        recommend_games와 같은 결과를 배열 연산으로 계산.
+        metrics를 넘기면 단계별 시간 / 개수를 기록한다.
+        """
+        if top_k <= 0:
+            return []
+        if metrics is not None:
+            return self._recommend_profiled(
+                players, target_time, desired_tags, desired_difficulty, top_k, preferred_tags, metrics
+            )
+        idx, penalty = self.candidates(players, target_time)
+        return self.rank(idx, penalty, desired_tags, desired_difficulty, top_k, preferred_tags)
+
+    def _recommend_profiled(
+        self,
+        players: int,
+        target_time: Optional[int],
+        desired_tags: List[str],
+        desired_difficulty: Optional[int],
+        top_k: int,
+        preferred_tags: Optional[List[str]],
+        metrics: Metrics,
+    ) -> List[Tuple[Game, float]]:
+        """
+        candidates + rank와 같은 계산을 단계별로 나눠 시간과 걸러진 게임 수를 기록.
+        """
+        n = len(self)
+        metrics.count("games", n)
+
+        with metrics.stage("players"):
+            by_players = self.index.players(players)
+        metrics.count("rejected_players", n - by_players.size)
+
+        with metrics.stage("time_penalty"):
+            idx = by_players
+            if target_time is not None:
+                idx = np.intersect1d(by_players, self.index.time_tree.query(target_time), assume_unique=True)
+            penalty = self.time_penalty(target_time, idx)
+            keep = penalty > 0.0
+            idx, penalty = idx[keep], penalty[keep]
+        metrics.count("rejected_time", by_players.size - idx.size)
+
+        if idx.size == 0:
+            metrics.count("returned", 0)
+            return []
+
+        with metrics.stage("score"):
+            scores = self.score(desired_tags, preferred_tags or [], desired_difficulty, idx) * penalty
+        metrics.count("scored", idx.size)
+
+        with metrics.stage("sort"):
+            top, scores = self.select_top(idx, scores, top_k)
+
+        results = self.to_results(top, scores)
+        metrics.count("returned", len(results))
+        return results
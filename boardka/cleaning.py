@@ -0,0 +1,110 @@
+# boardka/cleaning.py
+# 엑셀 한 행(row)을 Game으로 정리하는 공통 규칙 (pandas 없이 동작)
+
+import sys
+from typing import Any, Callable, Optional
+
+from .models import Game
+
+# 카탈로그 파일(엑셀 / CSV / Parquet / Arrow) 공통 컬럼. 태그는 쉼표로 구분한 문자열 하나.
+CATALOG_COLUMNS = ("id", "이름", "난이도", "최소인원", "최대인원", "최소 플레이타임", "최대 플레이타임", "tags")
+
+
+def is_missing(value: Any) -> bool:
+    """
+    None / NaN / pd.NA 같은 '빈 칸' 값인지 확인.
+    """
+    if value is None:
+        return True
+    try:
+        return bool(value != value)  # NaN은 자기 자신과 같지 않음
+    except TypeError:
+        # pd.NA는 비교 결과를 bool로 바꿀 수 없음
+        return True
+
+
+def to_int(value: Any) -> Optional[int]:
+    """
+    int()로 바꿀 수 있으면 정수, 빈 칸이거나 바꿀 수 없으면 None.
+    """
+    if is_missing(value):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def clean_row(get: Callable[[str, Any], Any], idx: int) -> Optional[Game]:
+    """
+    get(컬럼명, 기본값)으로 값을 꺼내 Game 하나를 만든다.
+    idx는 데이터 행 번호(0부터, 헤더 제외)이며 id가 없을 때 idx + 1을 쓴다.
+    조건을 만족하지 못하는 행이면 None.
+    """
+    # 1) 이름 없으면 스킵
+    raw_name = get("이름", None)
+    name_ko = "" if is_missing(raw_name) else str(raw_name).strip()
+    if not name_ko:
+        return None
+
+    # 2) 난이도 없는(또는 이상한) 게임은 로딩 단계에서 제외
+    difficulty = to_int(get("난이도", None))
+    if difficulty is None:
+        return None
+
+    # 3) 인원 정보 (최소 없으면 1, 최대 없으면 최소와 같게)
+    min_players = to_int(get("최소인원", 1))
+    if min_players is None:
+        min_players = 1
+    max_players = to_int(get("최대인원", None))
+    if max_players is None:
+        max_players = min_players
+
+    # 4) 시간 정보 (최소 없으면 0, 최대 없으면 최소와 같게)
+    min_time = to_int(get("최소 플레이타임", 0))
+    if min_time is None:
+        min_time = 0
+    max_time = to_int(get("최대 플레이타임", None))
+    if max_time is None:
+        max_time = min_time
+
+    # 5) 태그
+    raw_tags = get("tags", None)
+    if is_missing(raw_tags):
+        tags: list[str] = []
+    else:
+        # 같은 태그 문자열은 모든 게임이 한 객체를 공유하도록 intern
+        tags = [sys.intern(t.strip()) for t in str(raw_tags).split(",") if t.strip()]
+
+    # 6) id: 'id' 컬럼 값이 있으면 사용, 없으면 행 번호 기반으로 1부터
+    game_id = to_int(get("id", None))
+    if game_id is None:
+        game_id = idx + 1
+
+    return Game(
+        id=game_id,
+        name_ko=name_ko,
+        min_players=min_players,
+        max_players=max_players,
+        min_time=min_time,
+        max_time=max_time,
+        difficulty=difficulty,
+        tags=tags,
+    )
+
+
+def game_to_record(game: Game) -> dict:
+    """
+    Game을 CATALOG_COLUMNS 한 행으로 변환 (변환 명령이 다른 형식으로 내보낼 때 사용).
+    다시 읽으면 clean_row와 같은 규칙으로 같은 Game이 된다.
+    """
+    return {
+        "id": game.id,
+        "이름": game.name_ko,
+        "난이도": game.difficulty,
+        "최소인원": game.min_players,
+        "최대인원": game.max_players,
+        "최소 플레이타임": game.min_time,
+        "최대 플레이타임": game.max_time,
+        "tags": ", ".join(game.tags),
+    }
@@ -0,0 +1,53 @@
+# boardka/convert.py
+# 카탈로그 변환 명령: 엑셀(등)을 정리 규칙을 적용한 뒤 빠른 형식(Parquet / Arrow / CSV)으로 내보낸다
+#
+# 실행 예) py -m boardka.convert --data data/GameList.xlsx data/GameList.parquet data/GameList.arrow
+# 이후 recommend.py --data data/GameList.parquet 처럼 확장자만 바꿔 쓰면 된다.
+
+import argparse
+import os
+import sys
+import time
+
+from .loaders import format_for, load_games, write_games
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="보드게임 카탈로그 형식 변환")
+    parser.add_argument("--data", default="data/GameList.xlsx", help="원본 카탈로그 파일 경로")
+    parser.add_argument(
+        "outputs",
+        nargs="+",
+        metavar="OUT",
+        help="저장할 파일 경로들 (확장자로 형식 결정: .parquet / .arrow / .feather / .csv)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        for out in args.outputs:
+            fmt = format_for(out)  # 모르는 확장자면 여기서 ValueError
+            if fmt.write is None:
+                raise ValueError(f"{fmt.name} 형식으로는 내보낼 수 없습니다: {out}")
+        games = load_games(args.data)
+    except (ValueError, ImportError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{args.data}: 게임 {len(games)}개")
+
+    for out in args.outputs:
+        start = time.perf_counter()
+        try:
+            write_games(out, games)
+        except (ImportError, OSError) as e:
+            print(e, file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - start
+        print(f"  → {out} ({os.path.getsize(out):,} bytes, {elapsed * 1000:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# boardka/cursor.py
+# 추천 결과를 페이지 단위로 조금씩 꺼내는 커서 (점수는 한 번만, 정렬은 필요한 만큼만)
+
+import heapq
+import threading
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from .models import Game
+
+
+class HeapSource:
+    """
+    (게임, 점수) 목록을 힙으로 만들어 두고 순위대로 필요한 개수만 꺼낸다.
+    힙 만들기 O(n), 꺼낼 때마다 O(log n)이라 앞 페이지 결과를 다시 정렬하지 않는다.
+    순서는 rank_key와 같다 (점수 내림차순, 동점이면 id 오름차순, 그래도 같으면 들어온 순서).
+    """
+
+    def __init__(self, scored: Iterable[Tuple[Game, float]]):
+        self._heap = [(-score, game.id, seq, game, score) for seq, (game, score) in enumerate(scored)]
+        heapq.heapify(self._heap)
+        self.total = len(self._heap)
+
+    def take(self, n: int) -> List[Tuple[Game, float]]:
+        heap = self._heap
+        out = []
+        for _ in range(min(n, len(heap))):
+            _, _, _, game, score = heapq.heappop(heap)
+            out.append((game, score))
+        return out
+
+
+class ArraySource:
+    """
+    GameCatalog 후보(게임 번호 오름차순)와 점수 배열에서 다음 순위 묶음만 부분 선택한다.
+    꺼낸 게임은 남은 후보에서 빼므로, 다음 묶음은 남은 후보만 다시 본다.
+    """
+
+    def __init__(self, catalog, idx: np.ndarray, scores: np.ndarray):
+        self.catalog = catalog
+        self._idx = idx
+        self._scores = scores
+        self.total = int(idx.size)
+
+    def take(self, n: int) -> List[Tuple[Game, float]]:
+        if n <= 0 or self._idx.size == 0:
+            return []
+        top, scores = self.catalog.select_top(self._idx, self._scores, n)
+
+        # 꺼낸 것 제외 (후보 번호가 오름차순이라 searchsorted로 위치를 찾는다)
+        keep = np.ones(self._idx.size, dtype=bool)
+        keep[np.searchsorted(self._idx, top)] = False
+        self._idx, self._scores = self._idx[keep], self._scores[keep]
+        return self.catalog.to_results(top, scores)
+
+
+class ResultCursor:
+    """
+    순위대로 정렬된 추천 결과를 필요한 만큼만 만들어 가며 돌려주는 커서.
+    - 지금까지 정렬한 앞부분(prefix)은 저장해 두고, 더 필요할 때만 source에서 다음 묶음을 꺼낸다
+    - 묶음 크기는 page_size에서 시작해 두 배씩 늘린다 (뒤 페이지로 갈수록 꺼내는 횟수가 줄어든다)
+    - fetch(offset, limit)는 위치를 바꾸지 않고, next_page()는 읽은 위치를 앞으로 옮긴다
+    같은 커서를 여러 스레드에서 같이 써도 된다 (prefix 확장은 잠금 안에서).
+    """
+
+    def __init__(self, source, page_size: int = 5):
+        if page_size <= 0:
+            raise ValueError("page_size는 1 이상이어야 합니다.")
+        self.page_size = page_size
+        self.position = 0
+        self._source = source
+        self._ranked: List[Tuple[Game, float]] = []
+        self._chunk = page_size
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        """
+        조건(인원 / 시간)을 통과한 전체 결과 수
+        """
+        return self._source.total
+
+    @property
+    def has_more(self) -> bool:
+        return self.position < self.total
+
+    def _ensure(self, count: int) -> None:
+        with self._lock:
+            while len(self._ranked) < min(count, self.total):
+                want = max(count - len(self._ranked), self._chunk)
+                self._chunk *= 2
+                taken = self._source.take(want)
+                if not taken:
+                    break
+                self._ranked.extend(taken)
+
+    def fetch(self, offset: int, limit: int) -> List[Tuple[Game, float]]:
+        """
+        offset번째(0부터)부터 limit개
+        """
+        if offset < 0 or limit <= 0:
+            return []
+        self._ensure(offset + limit)
+        return self._ranked[offset: offset + limit]
+
+    def page(self, number: int) -> List[Tuple[Game, float]]:
+        """
+        number번째 페이지 (0부터)
+        """
+        return self.fetch(number * self.page_size, self.page_size)
+
+    def next_page(self) -> List[Tuple[Game, float]]:
+        results = self.fetch(self.position, self.page_size)
+        self.position += len(results)
+        return results
+
+    def __iter__(self) -> Iterator[Tuple[Game, float]]:
+        offset = 0
+        while True:
+            chunk = self.fetch(offset, self.page_size)
+            if not chunk:
+                return
+            yield from chunk
+            offset += len(chunk)
@@ -0,0 +1,310 @@
+# boardka/daemon.py
+# CLI용 상주 추천 데몬 (유닉스 도메인 소켓, 카탈로그 / 인덱스 / 선호 태그를 메모리에 유지)
+#
+# 실행 예) py -m boardka.daemon --data data/GameList.xlsx
+#          py -m boardka.daemon --stop
+# recommend.py는 데몬이 떠 있으면 질의를 소켓으로 넘기고, 없으면 직접 계산한다.
+#
+# 프로토콜: 연결마다 JSON 한 줄 요청 → JSON 한 줄 응답
+#   {"op": "ping"}
+#   {"op": "recommend", "data": 엑셀 절대경로, "query": {...}, "offset": 0}
+#   {"op": "for_users", "data": 엑셀 절대경로, "users": 폴더 절대경로, "query": {...}}
+#   {"op": "like", "data": 엑셀 절대경로, "like": 게임 이름 또는 id, "query": {...}}
+#   {"op": "shutdown"}
+# 응답: {"ok": true, ...} 또는 {"ok": false, "error": "..."}
+#
+# 클라이언트 쪽(request)은 numpy / pandas / asyncio를 import하지 않으므로 CLI가 빨리 뜬다.
+
+import argparse
+import json
+import os
+import socket
+import stat
+import sys
+from typing import Optional
+
+SOCKET_ENV = "BOARDKA_SOCKET"
+MAX_REQUEST_BYTES = 1024 * 1024
+CLIENT_TIMEOUT = 30.0
+
+
+class DaemonUnavailable(Exception):
+    """
+    데몬이 없거나 응답하지 않음 (호출한 쪽은 직접 계산으로 넘어가면 된다)
+    """
+
+
+def default_socket_path() -> str:
+    """
+    BOARDKA_SOCKET 환경변수, 없으면 임시 폴더의 사용자별 소켓 경로.
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    import tempfile
+
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"boardka-{uid}.sock")
+
+
+def request(payload: dict, socket_path: Optional[str] = None, timeout: float = CLIENT_TIMEOUT) -> dict:
+    """
+    데몬에 요청 하나를 보내고 응답 dict를 반환.
+    연결할 수 없거나 응답이 끊기면 DaemonUnavailable.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("이 운영체제는 유닉스 도메인 소켓을 지원하지 않습니다.")
+    path = socket_path or default_socket_path()
+    if not os.path.exists(path):
+        raise DaemonUnavailable(f"데몬 소켓이 없습니다: {path}")
+
+    data = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(data)
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError as e:  # 연결 거부(죽은 소켓 파일), 시간 초과 등
+        raise DaemonUnavailable(str(e)) from e
+
+    try:
+        return json.loads(b"".join(chunks))
+    except ValueError as e:
+        raise DaemonUnavailable("데몬 응답을 해석할 수 없습니다.") from e
+
+
+# ----------------- 데몬 -----------------
+
+
+class RecommendationDaemon:
+    """
+    엑셀 하나를 읽어 둔 상태로 요청을 처리하는 데몬.
+    - 카탈로그는 LiveCatalog로 들고 있고, 요청마다 파일 변경을 확인해 바뀐 게임만 반영
+    - 같은 질의는 RecommendationCache의 커서를 재사용 (offset이 달라도 이미 정렬한 앞부분 재사용)
+    - 회원별 선호 태그(ProfileStore)는 폴더별로 메모리에 두고, 파일이 바뀌었을 때만 다시 읽는다
+    """
+
+    def __init__(self, data_path: str, cache_size: int = 256):
+        from .cache import RecommendationCache
+        from .reload import LiveCatalog
+
+        self.data_path = os.path.abspath(data_path)
+        self.live = LiveCatalog(self.data_path)
+        self.cache = RecommendationCache(maxsize=cache_size)
+        self._profiles: dict = {}  # 폴더 → (파일 상태, 회원별 선호 태그)
+        self.requests_total = 0
+
+    def handle(self, payload: dict) -> dict:
+        """
+        요청 dict 하나를 처리 (스레드 풀에서 호출됨).
+        """
+        from .api import query_from_dict, result_to_dict
+
+        op = payload.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "data": self.data_path, "games": len(self.live.catalog)}
+
+        if op not in ("recommend", "for_users", "like"):
+            return {"ok": False, "error": f"알 수 없는 요청입니다: {op}"}
+        if payload.get("data") != self.data_path:
+            # 다른 엑셀을 읽어 둔 데몬이면 호출한 쪽이 직접 계산하도록
+            return {"ok": False, "error": "data_mismatch", "data": self.data_path}
+
+        self.live.check()  # 파일이 바뀌었으면 바뀐 게임만 반영 (안 바뀌었으면 stat 한 번)
+        catalog = self.live.catalog
+
+        if op == "like":
+            from .similar import find_game, similar_games
+
+            # 인원은 선택 (거르는 용도로만), 시간 / 태그는 쓰지 않는다
+            raw = payload.get("query") or {}
+            players = raw.get("players")
+            game = find_game(catalog.games, payload.get("like", ""))
+            # 유사도 인덱스는 카탈로그에 붙어 있어, 파일이 바뀌지 않는 한 한 번만 만든다
+            results = similar_games(
+                catalog, game, top_k=int(raw.get("top_k", 5)),
+                players=int(players) if players is not None else None,
+            )
+            return {
+                "ok": True,
+                "game": result_to_dict(game, 1.0),
+                "results": [result_to_dict(g, s) for g, s in results],
+            }
+
+        query = query_from_dict(payload.get("query") or {})
+
+        if op == "recommend":
+            offset = max(int(payload.get("offset", 0)), 0)
+            top_k = query.pop("top_k")
+            cursor = self.cache.cursor(catalog, page_size=max(top_k, 1), **query)
+            results = cursor.fetch(offset, top_k)
+            return {
+                "ok": True,
+                "total": cursor.total,
+                "results": [result_to_dict(g, s) for g, s in results],
+            }
+
+        from .recommender import recommend_for_users
+
+        profiles = self._load_profiles(payload["users"])
+        query.pop("preferred_tags", None)
+        by_user = recommend_for_users(catalog, profiles, **query)
+        return {
+            "ok": True,
+            "users": [
+                {
+                    "id": user_id,
+                    "preferred_tags": profiles[user_id],
+                    "results": [result_to_dict(g, s) for g, s in results],
+                }
+                for user_id, results in by_user.items()
+            ],
+        }
+
+    def _load_profiles(self, folder: str) -> dict:
+        from .prefs import ProfileStore
+
+        try:
+            state = tuple(sorted(
+                (e.name, e.stat().st_size, e.stat().st_mtime_ns) for e in os.scandir(folder) if e.is_file()
+            ))
+        except OSError:
+            state = ()
+        cached = self._profiles.get(folder)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        # 읽기만 하므로 바로 닫는다 (열어 둔 저장소가 종료 시 자동 기록 목록에 쌓이지 않도록)
+        store = ProfileStore(folder)
+        try:
+            profiles = store.preferred_tags(5)
+        finally:
+            store.close()
+        self._profiles[folder] = (state, profiles)
+        return profiles
+
+    async def _on_client(self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter") -> None:
+        import asyncio
+
+        try:
+            line = await reader.readline()
+            if len(line) > MAX_REQUEST_BYTES:
+                response = {"ok": False, "error": "요청이 너무 큽니다."}
+            else:
+                self.requests_total += 1
+                try:
+                    payload = json.loads(line)
+                    if not isinstance(payload, dict):
+                        raise ValueError("요청은 JSON 객체여야 합니다.")
+                    if payload.get("op") == "shutdown":
+                        response = {"ok": True}
+                        self._stopping.set()
+                    else:
+                        loop = asyncio.get_running_loop()
+                        response = await loop.run_in_executor(None, self.handle, payload)
+                except Exception as e:  # 요청 하나의 오류로 데몬이 멈추지 않게
+                    response = {"ok": False, "error": str(e)}
+            writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path: str) -> None:
+        import asyncio
+
+        self._stopping = asyncio.Event()
+        old_umask = os.umask(0o177)  # 소켓은 실행한 사용자만 접근 가능하게
+        try:
+            server = await asyncio.start_unix_server(self._on_client, path=socket_path, limit=MAX_REQUEST_BYTES)
+        finally:
+            os.umask(old_umask)
+        print(f"총 {len(self.live.catalog)}개의 게임을 불러왔습니다. 소켓: {socket_path}")
+        try:
+            async with server:
+                await self._stopping.wait()
+        finally:
+            try:
+                os.remove(socket_path)
+            except OSError:
+                pass
+            self.live.catalog.close()
+
+
+def _check_socket_path(path: str) -> Optional[str]:
+    """
+    데몬 소켓을 만들 경로 확인. 쓸 수 있으면 None, 아니면 데몬을 띄우지 않는 이유.
+    죽은 데몬이 남긴 소켓 파일(연결이 거부되는 소켓)만 지운다. 소켓이 아닌 파일이나
+    연결은 되는(바쁜 데몬 포함) 소켓, 상태를 알 수 없는 소켓은 건드리지 않는다.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK(st.st_mode):
+        return f"소켓이 아닌 파일이 이미 있습니다: {path}"
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2.0)
+            sock.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return None
+    except OSError as e:
+        return f"소켓 상태를 확인할 수 없습니다: {path} ({e})"
+    return f"이미 데몬이 실행 중입니다: {path}"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="보드게임 추천 데몬 (유닉스 도메인 소켓)")
+    parser.add_argument("--data", default="data/GameList.xlsx", help="보드게임 카탈로그 파일 경로 (.xlsx / .csv / .parquet / .arrow)")
+    parser.add_argument("--socket", default=None, help=f"소켓 경로 (기본: ${SOCKET_ENV} 또는 임시 폴더)")
+    parser.add_argument("--cache-size", type=int, default=256, help="추천 결과 캐시 크기")
+    parser.add_argument("--stop", action="store_true", help="실행 중인 데몬을 종료")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    socket_path = args.socket or default_socket_path()
+
+    if args.stop:
+        try:
+            request({"op": "shutdown"}, socket_path, timeout=5.0)
+        except DaemonUnavailable:
+            print("실행 중인 데몬이 없습니다.", file=sys.stderr)
+            return 1
+        print("데몬을 종료했습니다.")
+        return 0
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("이 운영체제는 유닉스 도메인 소켓을 지원하지 않습니다.", file=sys.stderr)
+        return 1
+    problem = _check_socket_path(socket_path)
+    if problem is not None:
+        print(problem, file=sys.stderr)
+        return 1
+
+    import asyncio
+
+    daemon = RecommendationDaemon(args.data, cache_size=args.cache_size)
+    try:
+        asyncio.run(daemon.serve(socket_path))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# boardka/index.py
+# 인원 / 시간 조건으로 추천 후보를 미리 좁히기 위한 인덱스
+
+from typing import Optional
+
+import numpy as np
+
+# 목표 시간과 이 이상 차이나면 추천에서 제외 (분)
+TIME_TOLERANCE = 30
+
+# 이 인원수까지는 인원별 버킷을 미리 만들어 둔다
+MAX_BUCKET_PLAYERS = 12
+
+
+class IntervalTree:
+    """
+    [start, end] 구간들을 담는 centered interval tree.
+    점 q를 포함하는 구간 번호들을 O(log n + k)로 찾는다.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        self.starts = starts
+        self.ends = ends
+        # 노드: (center, 시작 오름차순 번호, 정렬된 시작값, 끝 내림차순 번호, 정렬된 끝값(내림차순), 왼쪽, 오른쪽)
+        self.root = self._build(np.arange(len(starts), dtype=np.int64))
+
+    def _build(self, idx: np.ndarray):
+        if idx.size == 0:
+            return None
+
+        s = self.starts[idx]
+        e = self.ends[idx]
+        center = float(np.median(np.concatenate([s, e])))
+
+        left = e < center
+        right = s > center
+        mid = idx[~(left | right)]
+
+        by_start = mid[np.argsort(self.starts[mid], kind="stable")]
+        by_end = mid[np.argsort(-self.ends[mid], kind="stable")]
+        return (
+            center,
+            by_start,
+            self.starts[by_start],
+            by_end,
+            self.ends[by_end],
+            self._build(idx[left]),
+            self._build(idx[right]),
+        )
+
+    def query(self, q: float) -> np.ndarray:
+        """
+        q를 포함하는 구간 번호들 (오름차순)
+        """
+        found = []
+        node = self.root
+        while node is not None:
+            center, by_start, starts, by_end, ends, left, right = node
+            if q < center:
+                found.append(by_start[: np.searchsorted(starts, q, side="right")])
+                node = left
+            elif q > center:
+                # ends는 내림차순이므로 부호를 바꿔 검색
+                found.append(by_end[: np.searchsorted(-ends, -q, side="right")])
+                node = right
+            else:
+                found.append(by_start)
+                break
+
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(found))
+
+
+class CandidateIndex:
+    """
+    인원별 버킷 + 시간 구간 트리.
+    인원 필터와 '목표 시간 ±30분' 조건을 통과할 수 있는 게임만 후보로 돌려준다.
+    시간 후보는 넉넉하게(상위집합) 잡으므로 실제 페널티 계산은 호출하는 쪽에서 한다.
+    """
+
+    def __init__(
+        self,
+        min_players: np.ndarray,
+        max_players: np.ndarray,
+        min_time: np.ndarray,
+        max_time: np.ndarray,
+    ):
+        self.min_players = min_players
+        self.max_players = max_players
+
+        # 인원수 p(1 ~ MAX_BUCKET_PLAYERS)별로 플레이 가능한 게임 번호
+        self.player_buckets = [
+            np.flatnonzero((min_players <= p) & (p <= max_players))
+            for p in range(1, MAX_BUCKET_PLAYERS + 1)
+        ]
+
+        # 시간 조건을 통과할 수 있는 목표 시간 구간
+        starts = min_time - TIME_TOLERANCE
+        ends = np.maximum(min_time, max_time) + TIME_TOLERANCE
+        self.time_tree = IntervalTree(starts, ends)
+
+    def players(self, players: int) -> np.ndarray:
+        """
+        해당 인원으로 플레이 가능한 게임 번호 (오름차순)
+        """
+        if 1 <= players <= MAX_BUCKET_PLAYERS:
+            return self.player_buckets[players - 1]
+        return np.flatnonzero((self.min_players <= players) & (players <= self.max_players))
+
+    def candidates(self, players: int, target_time: Optional[int]) -> np.ndarray:
+        """
+        인원 + 시간 조건을 모두 통과할 수 있는 게임 번호 (오름차순)
+        """
+        by_players = self.players(players)
+        if target_time is None:
+            return by_players
+        by_time = self.time_tree.query(target_time)
+        return np.intersect1d(by_players, by_time, assume_unique=True)
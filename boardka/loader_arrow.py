@@ -0,0 +1,292 @@
+# boardka/loader_arrow.py
+# Parquet / Arrow(Feather) 카탈로그 로더 (pyarrow 필요, 실제로 읽거나 쓸 때만 import)
+#
+# 엑셀과 같은 컬럼 / 같은 정리 규칙(loader_excel.clean_frame)을 Arrow 배열 연산으로 적용한다.
+# 숫자 컬럼은 Arrow 버퍼에서 바로 NumPy 배열로 만들어 GameCatalog에 그대로 넘기고,
+# 파일 자체가 빠른 바이너리 형식이라 스냅샷은 쓰지 않는다.
+#
+# pyarrow의 to_numpy() / pa.array() / 파이썬 스칼라 인자는 pandas가 설치돼 있으면 pandas를 import한다
+# (0.2초 남짓). 읽는 경로에서는 값 버퍼를 직접 보고 cast / 문자열 커널 / to_pylist()만 쓴다.
+
+import sys
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+
+from .catalog import GameCatalog
+from .cleaning import CATALOG_COLUMNS, game_to_record, to_int
+from .loader_excel import CleaningSummary, record_summary
+from .metrics import Metrics, stage
+from .models import Game
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Parquet / Arrow 파일을 읽고 쓰려면 pyarrow가 필요합니다: py -m pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def read_table(path: str) -> "pa.Table":
+    """
+    확장자에 따라 Parquet 또는 Arrow IPC(Feather) 파일을 읽는다. 쓰는 컬럼만 읽는다.
+    """
+    _import_pyarrow()
+    if path.lower().endswith(PARQUET_EXTENSIONS):
+        import pyarrow.parquet as pq
+
+        # pq.read_table()은 pandas 메타데이터를 확인하느라 pandas를 읽으므로 ParquetFile로 읽는다
+        parquet = pq.ParquetFile(path)
+        names = set(parquet.schema_arrow.names)
+        return parquet.read(columns=[c for c in CATALOG_COLUMNS if c in names], use_pandas_metadata=False)
+
+    import pyarrow.feather as feather
+
+    # 메모리 맵으로 열면 숫자 컬럼은 파일 버퍼를 그대로 쓴다
+    table = feather.read_table(path, memory_map=True)
+    return table.select([c for c in CATALOG_COLUMNS if c in table.column_names])
+
+
+def _column(table: "pa.Table", name: str) -> Optional["pa.Array"]:
+    # 같은 이름이 여러 번 나오면 첫 번째 사용
+    if name not in table.column_names:
+        return None
+    return table.column(table.column_names.index(name)).combine_chunks()
+
+
+def _values(arr: "pa.Array", to_type: "pa.DataType", dtype) -> np.ndarray:
+    """
+    고정 폭 배열을 to_type으로 바꾼 뒤 값 버퍼를 그대로 보는 NumPy 배열 (읽기 전용, 널 자리 값은 의미 없음).
+    """
+    import pyarrow.compute as pc
+
+    arr = pc.cast(arr, to_type)
+    buffer = arr.buffers()[1]
+    if buffer is None or len(arr) == 0:
+        return np.zeros(len(arr), dtype=dtype)
+    return np.frombuffer(buffer, dtype=dtype, count=arr.offset + len(arr))[arr.offset:]
+
+
+def _validity(arr: "pa.Array") -> np.ndarray:
+    """
+    값이 있는 칸이면 True (널 비트맵을 그대로 펼친다).
+    """
+    if arr.null_count == 0:
+        return np.ones(len(arr), dtype=bool)
+    if arr.null_count == len(arr):
+        return np.zeros(len(arr), dtype=bool)
+    bits = np.frombuffer(arr.buffers()[0], dtype=np.uint8)
+    return np.unpackbits(bits, bitorder="little")[arr.offset: arr.offset + len(arr)].astype(bool)
+
+
+def _coerce_int(table: "pa.Table", name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    loader_excel._coerce_int과 같은 규칙: (값 배열, 변환 성공 여부 배열).
+    숫자 컬럼은 Arrow 버퍼에서 바로 변환하고, 문자열 등은 셀 단위로 int() 시도.
+    """
+    import pyarrow as pa
+
+    n = table.num_rows
+    col = _column(table, name)
+    if col is None:
+        return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=bool)
+
+    valid = _validity(col)
+    if pa.types.is_integer(col.type) or pa.types.is_boolean(col.type):
+        # 버퍼를 그대로 본 배열은 읽기 전용이라, 기본값을 채울 수 있게 배열 단위로 한 번 복사
+        values = np.where(valid, _values(col, pa.int64(), np.int64), 0)
+        return values, valid
+    if pa.types.is_floating(col.type):
+        # NaN / inf만 빼고 소수점 아래 버림 (int()와 동일)
+        arr = _values(col, pa.float64(), np.float64)
+        valid = valid & np.isfinite(arr)
+        values = np.zeros(n, dtype=np.int64)
+        values[valid] = np.trunc(arr[valid])
+        return values, valid
+
+    converted = [to_int(v) for v in col.to_pylist()]
+    valid = np.array([v is not None for v in converted], dtype=bool)
+    values = np.zeros(n, dtype=np.int64)
+    values[valid] = [v for v in converted if v is not None]
+    return values, valid
+
+
+def _string_column(table: "pa.Table", name: str) -> Optional["pa.Array"]:
+    """
+    컬럼을 Arrow 문자열 배열로 (빈 칸은 null 그대로). 문자열이 아닌 값은 str()로 바꾼다
+    (문자열이 아닌 컬럼은 드물어서 이때만 pa.array()를 쓴다).
+    """
+    import pyarrow as pa
+
+    col = _column(table, name)
+    if col is None:
+        return None
+    if pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+        return col
+    return pa.array([None if v is None else str(v) for v in col.to_pylist()], type=pa.string())
+
+
+def clean_table(table: "pa.Table") -> Tuple[List[Game], dict, CleaningSummary]:
+    """
+    loader_excel.clean_frame과 같은 규칙을 Arrow 테이블에 적용.
+    (Game 목록, GameCatalog용 정수 배열 컬럼, 규칙별 요약)을 반환.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    n = table.num_rows
+    summary = CleaningSummary(total_rows=n)
+
+    # 1) 이름 없으면 제외
+    names_col = _string_column(table, "이름")
+    names = np.full(n, "", dtype=object)
+    if names_col is not None:
+        names[:] = ["" if v is None else v for v in pc.utf8_trim_whitespace(names_col).to_pylist()]
+    has_name = names != ""
+    summary.dropped_no_name = int((~has_name).sum())
+
+    # 2) 난이도 없는(또는 이상한) 게임 제외
+    difficulty, has_diff = _coerce_int(table, "난이도")
+    summary.dropped_no_difficulty = int((has_name & ~has_diff).sum())
+    keep = has_name & has_diff
+
+    # 3) 인원 정보 (최소 없으면 1, 최대 없으면 최소와 같게)
+    min_players, ok = _coerce_int(table, "최소인원")
+    min_players[~ok] = 1
+    summary.default_min_players = int((keep & ~ok).sum())
+
+    max_players, ok = _coerce_int(table, "최대인원")
+    max_players[~ok] = min_players[~ok]
+    summary.default_max_players = int((keep & ~ok).sum())
+
+    # 4) 시간 정보 (최소 없으면 0, 최대 없으면 최소와 같게)
+    min_time, ok = _coerce_int(table, "최소 플레이타임")
+    min_time[~ok] = 0
+    summary.default_min_time = int((keep & ~ok).sum())
+
+    max_time, ok = _coerce_int(table, "최대 플레이타임")
+    max_time[~ok] = min_time[~ok]
+    summary.default_max_time = int((keep & ~ok).sum())
+
+    # 6) id: 'id' 컬럼 값이 있으면 사용, 없으면 행 번호 기반으로 1부터
+    ids, ok = _coerce_int(table, "id")
+    row_numbers = np.arange(1, n + 1, dtype=np.int64)
+    ids[~ok] = row_numbers[~ok]
+    summary.default_id = int((keep & ~ok).sum())
+
+    # 5) 태그: 남은 행만 쉼표 기준으로 한 번에 쪼개고 공백 제거
+    rows = np.flatnonzero(keep)
+    tag_lists: List[list] = [[] for _ in range(rows.size)]
+    tags_col = _string_column(table, "tags")
+    if tags_col is not None and rows.size:
+        split = pc.split_pattern(tags_col, pattern=",")
+        parents = _values(pc.list_parent_indices(split), pa.int64(), np.int64)
+        flat = pc.utf8_trim_whitespace(pc.list_flatten(split))
+        # 남은 행의 빈 문자열이 아닌 태그만
+        use = keep[parents] & (_values(pc.utf8_length(flat), pa.int64(), np.int64) > 0)
+        if use.any():
+            # 같은 태그 문자열은 모든 게임이 한 객체를 공유하도록 (종류별로 한 번만) intern
+            encoded = flat.dictionary_encode()
+            shared = np.array([sys.intern(t) for t in encoded.dictionary.to_pylist()], dtype=object)
+            tags = shared[_values(encoded.indices, pa.int64(), np.int64)[use]]
+            parents = parents[use]
+            # parents는 오름차순이므로 행이 바뀌는 위치에서 자른다
+            starts = np.flatnonzero(np.r_[True, parents[1:] != parents[:-1]])
+            positions = np.searchsorted(rows, parents[starts]).tolist()
+            bounds = starts.tolist() + [parents.size]
+            tags = tags.tolist()
+            for k, pos in enumerate(positions):
+                tag_lists[pos] = tags[bounds[k]: bounds[k + 1]]
+
+    columns = {
+        "min_players": min_players[rows],
+        "max_players": max_players[rows],
+        "min_time": min_time[rows],
+        "max_time": max_time[rows],
+        "difficulty": difficulty[rows],
+    }
+    games = [
+        Game(
+            id=gid,
+            name_ko=name_ko,
+            min_players=min_p,
+            max_players=max_p,
+            min_time=min_t,
+            max_time=max_t,
+            difficulty=diff,
+            tags=tags,
+        )
+        for gid, name_ko, min_p, max_p, min_t, max_t, diff, tags in zip(
+            ids[rows].tolist(),
+            names[rows].tolist(),
+            columns["min_players"].tolist(),
+            columns["max_players"].tolist(),
+            columns["min_time"].tolist(),
+            columns["max_time"].tolist(),
+            columns["difficulty"].tolist(),
+            tag_lists,
+        )
+    ]
+    return games, columns, summary
+
+
+def _parse(path: str, metrics: Optional[Metrics] = None) -> Tuple[List[Game], dict]:
+    with stage(metrics, "import_pyarrow"):
+        _import_pyarrow()
+    with stage(metrics, "read_table"):
+        table = read_table(path)
+    with stage(metrics, "clean"):
+        games, columns, summary = clean_table(table)
+    record_summary(metrics, summary)
+    return games, columns
+
+
+def load_games_from_arrow(path: str, metrics: Optional[Metrics] = None, **_cache_options) -> List[Game]:
+    """
+    Parquet / Arrow 파일에서 Game 목록을 읽어온다.
+    스냅샷 옵션(cache_path 등)은 다른 로더와 인자를 맞추기 위해 받기만 하고 쓰지 않는다.
+    """
+    games, _ = _parse(path, metrics)
+    return games
+
+
+def load_catalog_from_arrow(path: str, metrics: Optional[Metrics] = None, **_cache_options) -> GameCatalog:
+    """
+    Parquet / Arrow 파일을 읽어 GameCatalog로 만든다 (숫자 컬럼은 Game에서 다시 모으지 않는다).
+    """
+    games, columns = _parse(path, metrics)
+    with stage(metrics, "catalog"):
+        return GameCatalog(games, columns=columns)
+
+
+def write_arrow(path: str, games: List[Game]) -> None:
+    """
+    Game 목록을 CATALOG_COLUMNS 스키마로 저장 (.parquet / .pq는 Parquet, 나머지는 Arrow IPC).
+    """
+    pa = _import_pyarrow()
+    records = [game_to_record(g) for g in games]
+    columns = {c: [r[c] for r in records] for c in CATALOG_COLUMNS}
+    types = {c: pa.string() if c in ("이름", "tags") else pa.int64() for c in CATALOG_COLUMNS}
+    if not all(isinstance(v, int) for v in columns["id"]):
+        # 숫자가 아닌 id가 섞여 있으면 문자열로 저장 (읽을 때 clean_row와 같이 int() 시도)
+        columns["id"] = [str(v) for v in columns["id"]]
+        types["id"] = pa.string()
+    table = pa.table(columns, schema=pa.schema([pa.field(c, types[c]) for c in CATALOG_COLUMNS]))
+    if path.lower().endswith(PARQUET_EXTENSIONS):
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path)
+    else:
+        import pyarrow.feather as feather
+
+        # 압축하지 않으면 읽을 때 메모리 맵 그대로 쓸 수 있다
+        feather.write_feather(table, path, compression="uncompressed")
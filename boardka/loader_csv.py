@@ -0,0 +1,54 @@
+# boardka/loader_csv.py
+# CSV 카탈로그 로더 (엑셀과 같은 컬럼 / 같은 정리 규칙, pandas는 실제로 파싱할 때만 import)
+
+import csv
+from typing import List, Optional
+
+from .cleaning import CATALOG_COLUMNS, game_to_record
+from .loader_excel import clean_frame, record_summary
+from .metrics import Metrics, stage
+from .models import Game
+from .snapshot import load_cached
+
+# 엑셀에서 "CSV UTF-8"로 저장하면 BOM이 붙고, 그냥 "CSV"로 저장하면 cp949로 저장된다
+CSV_ENCODINGS = ("utf-8-sig", "cp949")
+
+
+def load_games_from_csv(
+    path: str,
+    cache_path: Optional[str] = None,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    metrics: Optional[Metrics] = None,
+) -> list[Game]:
+    """
+    CSV 파일에서 Game 목록을 읽어온다. 스냅샷 / metrics 옵션은 load_games_from_excel과 같다.
+    """
+    return load_cached(path, _parse_csv, cache_path, use_cache, rebuild_cache, metrics)
+
+
+def _parse_csv(path: str, metrics: Optional[Metrics] = None) -> list[Game]:
+    with stage(metrics, "import_pandas"):
+        import pandas as pd
+    with stage(metrics, "read_csv"):
+        for encoding in CSV_ENCODINGS:
+            try:
+                df = pd.read_csv(path, encoding=encoding)
+                break
+            except UnicodeDecodeError:
+                if encoding == CSV_ENCODINGS[-1]:
+                    raise
+    with stage(metrics, "clean"):
+        games, summary = clean_frame(df)
+    record_summary(metrics, summary)
+    return games
+
+
+def write_csv(path: str, games: List[Game]) -> None:
+    """
+    Game 목록을 CATALOG_COLUMNS 헤더의 CSV로 저장 (엑셀에서 바로 열리도록 UTF-8 BOM).
+    """
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CATALOG_COLUMNS)
+        writer.writeheader()
+        writer.writerows(game_to_record(g) for g in games)
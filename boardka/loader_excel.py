@@ -1,96 +1,219 @@
 # boardka/loader_excel.py
+# pandas(+ 엑셀 엔진)는 실제로 엑셀을 파싱할 때만 import한다.
+# 스냅샷이 유효하면 pandas를 전혀 읽지 않으므로 CLI / GUI 시작이 빠르다.
 
-import pandas as pd
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import numpy as np
 from .models import Game
+from .catalog import GameCatalog
+from .cleaning import to_int
+from .metrics import Metrics, stage
+from .snapshot import load_cached
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def load_games_from_excel(
+    path: str,
+    cache_path: Optional[str] = None,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    metrics: Optional[Metrics] = None,
+) -> list[Game]:
+    """
+    엑셀 파일에서 Game 목록을 읽어온다.
+    - 원본과 일치하는 스냅샷(기본: 엑셀 옆 *.snapshot)이 있으면 파싱 없이 그대로 사용
+    - 없거나 원본이 바뀌었으면 다시 파싱하고 스냅샷을 새로 저장
+    - cache_path: 스냅샷 위치 지정, rebuild_cache: 스냅샷 무시하고 강제 재생성
+    - metrics: 넘기면 단계별 시간 / 행 개수를 기록
+    """
+    return load_cached(path, _parse_excel, cache_path, use_cache, rebuild_cache, metrics)
+
+
+def _parse_excel(path: str, metrics: Optional[Metrics] = None) -> list[Game]:
+    with stage(metrics, "import_pandas"):
+        import pandas as pd
+    with stage(metrics, "read_excel"):
+        df = pd.read_excel(path)
+    with stage(metrics, "clean"):
+        games, summary = clean_frame(df)
+    record_summary(metrics, summary)
+    return games
 
 
-def load_games_from_excel(path: str) -> list[Game]:
-    df = pd.read_excel(path)
-
-    games: list[Game] = []
-
-    for idx, row in df.iterrows():
-        # 1) 이름 없으면 스킵
-        name_ko = str(row.get("이름", "")).strip()
-        if not name_ko:
-            continue
-
-        # 2) 난이도 없는 게임은 아예 로딩 단계에서 제외
-        raw_diff = row.get("난이도", None)
-        if pd.isna(raw_diff):
-            continue
-
-        try:
-            difficulty = int(raw_diff)
-        except (TypeError, ValueError):
-            # 이상한 값이면 그냥 버림
-            continue
-
-        # 3) 인원 정보
-        raw_min_players = row.get("최소인원", 1)
-        raw_max_players = row.get("최대인원", raw_min_players)
-
-        try:
-            min_players = int(raw_min_players)
-        except (TypeError, ValueError):
-            min_players = 1
-
-        try:
-            max_players = int(raw_max_players)
-        except (TypeError, ValueError):
-            max_players = min_players
-
-        # 4) 시간 정보
-        raw_min_time = row.get("최소 플레이타임", 0)
-        raw_max_time = row.get("최대 플레이타임", raw_min_time)
-
-        if pd.isna(raw_min_time):
-            min_time = 0
-        else:
-            try:
-                min_time = int(raw_min_time)
-            except (TypeError, ValueError):
-                min_time = 0
-
-        if pd.isna(raw_max_time):
-            max_time = min_time
-        else:
-            try:
-                max_time = int(raw_max_time)
-            except (TypeError, ValueError):
-                max_time = min_time
-
-        # 5) 태그
-        raw_tags = row.get("tags", "")
-        if pd.isna(raw_tags):
-            tags: list[str] = []
-        else:
-            tags = [t.strip() for t in str(raw_tags).split(",") if t.strip()]
-
-        # 6) id 설정
-        #    - 엑셀에 'id' 컬럼이 있으면 그거 사용
-        #    - 없으면 DataFrame 인덱스 기반으로 1부터 번호 매김
-        raw_id = row.get("id", None)
-        game_id: int
-        if raw_id is None or (isinstance(raw_id, float) and pd.isna(raw_id)):
-            game_id = int(idx) + 1
-        else:
-            try:
-                game_id = int(raw_id)
-            except (TypeError, ValueError):
-                game_id = int(idx) + 1
-
-        # 7) Game 인스턴스 생성
-        game = Game(
-            id=game_id,
+@dataclass
+class CleaningSummary:
+    """
+    clean_frame이 규칙별로 제외/기본값 처리한 행 수.
+    기본값 개수는 최종적으로 남은 행 기준.
+    """
+    total_rows: int = 0
+    dropped_no_name: int = 0
+    dropped_no_difficulty: int = 0
+    default_min_players: int = 0
+    default_max_players: int = 0
+    default_min_time: int = 0
+    default_max_time: int = 0
+    default_id: int = 0
+
+    @property
+    def loaded(self) -> int:
+        return self.total_rows - self.dropped_no_name - self.dropped_no_difficulty
+
+
+def record_summary(metrics: Optional[Metrics], summary: CleaningSummary) -> None:
+    """
+    정리 결과의 행 / 제외 개수를 metrics 카운터에 기록 (metrics가 None이면 무시).
+    """
+    if metrics is None:
+        return
+    metrics.count("rows", summary.total_rows)
+    metrics.count("dropped_no_name", summary.dropped_no_name)
+    metrics.count("dropped_no_difficulty", summary.dropped_no_difficulty)
+    metrics.count("loaded", summary.loaded)
+
+
+def _coerce_int(df: "pd.DataFrame", column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    컬럼 전체를 int()와 같은 규칙으로 한 번에 변환.
+    (값 배열, 변환 성공 여부 배열)을 반환. 컬럼이 없으면 전부 실패로 처리.
+    """
+    n = len(df)
+    values = np.zeros(n, dtype=np.int64)
+    valid = np.zeros(n, dtype=bool)
+    if column not in df.columns:
+        return values, valid
+
+    col = df[column]
+    if col.dtype.kind in "biuf":
+        # 숫자 컬럼: NaN / inf만 빼고 소수점 아래 버림 (int()와 동일)
+        arr = col.to_numpy(dtype=np.float64)
+        valid = np.isfinite(arr)
+        values[valid] = np.trunc(arr[valid])
+    else:
+        # 문자열 등이 섞인 컬럼만 셀 단위로 int() 시도
+        converted = [to_int(v) for v in col.to_numpy(dtype=object)]
+        valid = np.array([v is not None for v in converted], dtype=bool)
+        values[valid] = [v for v in converted if v is not None]
+    return values, valid
+
+
+def _coerce_str(df: "pd.DataFrame", column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    컬럼을 str()로 바꾼 값 배열과, 빈 칸이 아닌지 여부 배열을 반환.
+    """
+    n = len(df)
+    if column not in df.columns:
+        return np.full(n, "", dtype=object), np.zeros(n, dtype=bool)
+
+    col = df[column]
+    present = col.notna().to_numpy(copy=True)
+    text = col.astype(object).where(present, "").astype(str)
+    return text.to_numpy(dtype=object), present
+
+
+def clean_frame(df: "pd.DataFrame") -> Tuple[list[Game], CleaningSummary]:
+    """
+    cleaning.clean_row와 같은 규칙을 컬럼 단위 배열 연산으로 적용.
+    (Game 목록, 규칙별 요약)을 반환.
+    """
+    import pandas as pd
+
+    n = len(df)
+    summary = CleaningSummary(total_rows=n)
+
+    # 1) 이름 없으면 제외
+    names, has_name = _coerce_str(df, "이름")
+    names = pd.Series(names, dtype=object).str.strip().to_numpy(dtype=object)
+    has_name = has_name & (names != "")
+    summary.dropped_no_name = int((~has_name).sum())
+
+    # 2) 난이도 없는(또는 이상한) 게임 제외
+    difficulty, has_diff = _coerce_int(df, "난이도")
+    summary.dropped_no_difficulty = int((has_name & ~has_diff).sum())
+    keep = has_name & has_diff
+
+    # 3) 인원 정보 (최소 없으면 1, 최대 없으면 최소와 같게)
+    min_players, ok = _coerce_int(df, "최소인원")
+    min_players[~ok] = 1
+    summary.default_min_players = int((keep & ~ok).sum())
+
+    max_players, ok = _coerce_int(df, "최대인원")
+    max_players[~ok] = min_players[~ok]
+    summary.default_max_players = int((keep & ~ok).sum())
+
+    # 4) 시간 정보 (최소 없으면 0, 최대 없으면 최소와 같게)
+    min_time, ok = _coerce_int(df, "최소 플레이타임")
+    min_time[~ok] = 0
+    summary.default_min_time = int((keep & ~ok).sum())
+
+    max_time, ok = _coerce_int(df, "최대 플레이타임")
+    max_time[~ok] = min_time[~ok]
+    summary.default_max_time = int((keep & ~ok).sum())
+
+    # 6) id: 'id' 컬럼 값이 있으면 사용, 없으면 행 번호 기반으로 1부터
+    ids, ok = _coerce_int(df, "id")
+    row_numbers = np.arange(1, n + 1, dtype=np.int64)
+    ids[~ok] = row_numbers[~ok]
+    summary.default_id = int((keep & ~ok).sum())
+
+    # 5) 태그: 남은 행만 쉼표 기준으로 한 번에 쪼개고 공백 제거
+    rows = np.flatnonzero(keep)
+    tag_lists: dict[int, list[str]] = {}
+    if "tags" in df.columns and rows.size:
+        raw_tags, has_tags = _coerce_str(df, "tags")
+        tagged = rows[has_tags[rows]]
+        exploded = pd.Series(raw_tags[tagged], index=tagged, dtype=object).str.split(",").explode().str.strip()
+        exploded = exploded[exploded != ""]
+        if len(exploded):
+            # 같은 태그 문자열은 모든 게임이 한 객체를 공유하도록 (종류별로 한 번만) intern
+            codes, uniques = pd.factorize(exploded)
+            shared = np.array([sys.intern(t) for t in uniques], dtype=object)
+            tags = shared[codes].tolist()
+            # explode는 행 순서를 유지하므로 같은 행의 태그는 붙어 있다: 행이 바뀌는 지점에서 잘라 나눈다
+            # (groupby(...).agg(list)는 그룹마다 파이썬 호출이라 행이 많으면 느리다)
+            parents = exploded.index.to_numpy()
+            starts = np.flatnonzero(np.r_[True, parents[1:] != parents[:-1]])
+            bounds = starts.tolist() + [parents.size]
+            tag_lists = {
+                row: tags[bounds[k]: bounds[k + 1]]
+                for k, row in enumerate(parents[starts].tolist())
+            }
+
+    games = [
+        Game(
+            id=gid,
             name_ko=name_ko,
-            min_players=min_players,
-            max_players=max_players,
-            min_time=min_time,
-            max_time=max_time,
-            difficulty=difficulty,
-            tags=tags,
+            min_players=min_p,
+            max_players=max_p,
+            min_time=min_t,
+            max_time=max_t,
+            difficulty=diff,
+            tags=tag_lists.get(row, []),
         )
-        games.append(game)
-
-    return games
+        for row, gid, name_ko, min_p, max_p, min_t, max_t, diff in zip(
+            rows.tolist(),
+            ids[rows].tolist(),
+            names[rows].tolist(),
+            min_players[rows].tolist(),
+            max_players[rows].tolist(),
+            min_time[rows].tolist(),
+            max_time[rows].tolist(),
+            difficulty[rows].tolist(),
+        )
+    ]
+    return games, summary
+
+
+def load_catalog_from_excel(path: str, **kwargs) -> GameCatalog:
+    """
+    엑셀 파일을 읽어 바로 GameCatalog(배열 기반 카탈로그)로 만든다.
+    kwargs는 load_games_from_excel의 캐시 / metrics 옵션 그대로 전달.
+    """
+    games = load_games_from_excel(path, **kwargs)
+    with stage(kwargs.get("metrics"), "catalog"):
+        return GameCatalog(games)
@@ -0,0 +1,43 @@
+# boardka/loader_stream.py
+# pandas 없이 엑셀을 한 줄씩 읽어 Game을 만들어 내는 스트리밍 로더
+
+from typing import Iterator
+
+from openpyxl import load_workbook
+
+from .cleaning import clean_row
+from .models import Game
+
+
+def iter_games_from_excel(path: str) -> Iterator[Game]:
+    """
+    첫 번째 시트를 읽기 전용 모드로 열고 행을 하나씩 읽으며 Game을 yield.
+    전체 시트를 메모리에 올리지 않으므로 큰 파일도 일정한 메모리로 읽을 수 있다.
+    정리 규칙은 load_games_from_excel과 같다.
+    """
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return
+
+        # 컬럼명 → 위치 (같은 이름이 여러 번 나오면 첫 번째 사용)
+        columns: dict[str, int] = {}
+        for pos, name in enumerate(header):
+            if name is not None:
+                columns.setdefault(str(name), pos)
+
+        for idx, values in enumerate(rows):
+            def get(key, default, values=values):
+                pos = columns.get(key)
+                if pos is None:
+                    return default
+                return values[pos] if pos < len(values) else None
+
+            game = clean_row(get, idx)
+            if game is not None:
+                yield game
+    finally:
+        wb.close()
@@ -0,0 +1,94 @@
+# boardka/loaders.py
+# 카탈로그 파일 형식 등록부: --data 경로의 확장자로 로더를 고른다 (엑셀 / CSV / Parquet / Arrow)
+#
+# 형식마다 load_games(path, cache_path=, use_cache=, rebuild_cache=, metrics=)를 등록하고,
+# 배열 컬럼을 바로 만들 수 있는 형식은 load_catalog도 등록한다.
+# 새 형식은 register_format(CatalogFormat(...))으로 추가한다.
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .catalog import GameCatalog
+from .loader_arrow import (
+    ARROW_EXTENSIONS,
+    PARQUET_EXTENSIONS,
+    load_catalog_from_arrow,
+    load_games_from_arrow,
+    write_arrow,
+)
+from .loader_csv import load_games_from_csv, write_csv
+from .loader_excel import load_catalog_from_excel, load_games_from_excel
+from .metrics import stage
+from .models import Game
+
+
+@dataclass(frozen=True)
+class CatalogFormat:
+    """
+    카탈로그 파일 형식 하나.
+    - load_games: Game 목록 로더 (스냅샷 / metrics 키워드 인자를 받는다)
+    - load_catalog: 있으면 GameCatalog를 직접 만드는 로더 (없으면 load_games 결과로 만든다)
+    - write: 있으면 이 형식으로 내보낼 수 있다 (python -m boardka.convert)
+    """
+    name: str
+    extensions: Tuple[str, ...]
+    load_games: Callable[..., List[Game]]
+    load_catalog: Optional[Callable[..., GameCatalog]] = None
+    write: Optional[Callable[[str, List[Game]], None]] = None
+
+
+# 확장자(소문자, 점 포함) → 형식
+FORMATS: Dict[str, CatalogFormat] = {}
+
+
+def register_format(fmt: CatalogFormat) -> None:
+    for ext in fmt.extensions:
+        FORMATS[ext.lower()] = fmt
+
+
+register_format(CatalogFormat("excel", (".xlsx", ".xlsm"), load_games_from_excel, load_catalog_from_excel))
+register_format(CatalogFormat("csv", (".csv",), load_games_from_csv, write=write_csv))
+register_format(CatalogFormat("parquet", PARQUET_EXTENSIONS, load_games_from_arrow, load_catalog_from_arrow, write_arrow))
+register_format(CatalogFormat("arrow", ARROW_EXTENSIONS, load_games_from_arrow, load_catalog_from_arrow, write_arrow))
+
+
+def format_for(path: str) -> CatalogFormat:
+    """
+    파일 확장자로 형식을 고른다. 모르는 확장자면 ValueError.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    fmt = FORMATS.get(ext)
+    if fmt is None:
+        supported = ", ".join(sorted(FORMATS))
+        raise ValueError(f"지원하지 않는 카탈로그 형식입니다: {path} (지원: {supported})")
+    return fmt
+
+
+def load_games(path: str, **kwargs) -> List[Game]:
+    """
+    확장자에 맞는 로더로 Game 목록을 읽는다. kwargs는 load_games_from_excel의 캐시 / metrics 옵션.
+    """
+    return format_for(path).load_games(path, **kwargs)
+
+
+def load_catalog(path: str, **kwargs) -> GameCatalog:
+    """
+    확장자에 맞는 로더로 GameCatalog를 만든다. kwargs는 load_games와 같다.
+    """
+    fmt = format_for(path)
+    if fmt.load_catalog is not None:
+        return fmt.load_catalog(path, **kwargs)
+    games = fmt.load_games(path, **kwargs)
+    with stage(kwargs.get("metrics"), "catalog"):
+        return GameCatalog(games)
+
+
+def write_games(path: str, games: List[Game]) -> None:
+    """
+    확장자에 맞는 형식으로 Game 목록을 저장. 내보낼 수 없는 형식이면 ValueError.
+    """
+    fmt = format_for(path)
+    if fmt.write is None:
+        raise ValueError(f"{fmt.name} 형식으로는 내보낼 수 없습니다: {path}")
+    fmt.write(path, games)
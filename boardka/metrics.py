@@ -0,0 +1,74 @@
+# boardka/metrics.py
+# 추천 / 로딩 과정의 단계별 소요 시간과 개수 집계 (--profile)
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, List, Optional
+
+
+class Metrics:
+    """
+    단계별 벽시계 시간(초)과 카운터를 모으는 객체.
+    recommend_games / load_games_from_excel 등에 metrics=로 넘기면 채워진다.
+    넘기지 않으면(None) 계측 코드를 아예 타지 않는다.
+
+    - stage(name): with 블록 시간 누적
+    - count(name, n): 카운터 누적 (필터에서 제외된 게임 수, 점수 계산한 게임 수 등)
+    - hooks: 단계가 끝날 때마다 hook(name, seconds)를 호출 (외부 모니터링 연결용)
+    """
+
+    def __init__(self, hooks: Optional[List[Callable[[str, float], None]]] = None):
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.hooks: List[Callable[[str, float], None]] = list(hooks or [])
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+        for hook in self.hooks:
+            hook(name, seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    def reset(self) -> None:
+        self.timings.clear()
+        self.counters.clear()
+
+    def as_dict(self) -> dict:
+        return {
+            "timings_ms": {k: round(v * 1000, 3) for k, v in self.timings.items()},
+            "counters": dict(self.counters),
+        }
+
+    def report(self) -> str:
+        """
+        단계별 시간(ms, 비율)과 카운터를 사람이 읽기 좋은 표로.
+        """
+        total = sum(self.timings.values())
+        lines = ["=== 단계별 소요 시간 ==="]
+        for name, seconds in self.timings.items():
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"  {name:<24} {seconds * 1000:10.3f} ms  {share:5.1f}%")
+        lines.append(f"  {'합계':<24} {total * 1000:10.3f} ms")
+        if self.counters:
+            lines.append("=== 개수 ===")
+            for name, value in self.counters.items():
+                lines.append(f"  {name:<24} {value:>10}")
+        return "\n".join(lines)
+
+
+def stage(metrics: Optional[Metrics], name: str):
+    """
+    metrics가 None이면 아무것도 하지 않는 with 블록.
+    """
+    if metrics is None:
+        return nullcontext()
+    return metrics.stage(name)
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import List
 
-@dataclass
+# slots=True: 게임마다 __dict__를 만들지 않아 큰 카탈로그에서 메모리를 크게 줄인다
+@dataclass(slots=True)
 class Game:
     id: str
     name_ko: str
@@ -0,0 +1,186 @@
+# boardka/parallel.py
+# 아주 큰 카탈로그를 여러 프로세스로 나눠 추천 (샤드별 top_k → 전체 top_k 병합)
+
+import multiprocessing as mp
+import threading
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .catalog import GameCatalog
+from .models import Game
+
+
+def _attach(specs: dict) -> Tuple[dict, list]:
+    """
+    공유 메모리 블록에 붙어서 배열 컬럼(dict)과 블록 목록을 돌려준다.
+    """
+    arrays: dict = {}
+    blocks = []
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        blocks.append(shm)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return arrays, blocks
+
+
+def _shard_worker(conn, specs: dict, tag_index: dict, start: int, stop: int) -> None:
+    """
+    워커 프로세스: 자기 샤드 [start, stop) 구간만으로 카탈로그를 만들고
+    질의를 받을 때마다 샤드 안의 top_k (전체 기준 게임 번호, 점수)를 돌려준다.
+    """
+    arrays, blocks = _attach(specs)
+    try:
+        shard = GameCatalog.from_arrays(
+            {name: arr[start:stop] for name, arr in arrays.items()}, tag_index
+        )
+        while True:
+            query = conn.recv()
+            if query is None:
+                break
+            try:
+                players, target_time, desired_tags, desired_difficulty, top_k, preferred_tags = query
+                idx, penalty = shard.candidates(players, target_time)
+                top, scores = shard.top_indices(
+                    idx, penalty, desired_tags, desired_difficulty, top_k, preferred_tags
+                )
+                conn.send(("ok", top + start, scores))
+            except Exception as e:
+                conn.send(("error", repr(e), None))
+    finally:
+        # 배열 뷰를 먼저 지워야 공유 메모리를 닫을 수 있다
+        shard = arrays = None
+        for shm in blocks:
+            shm.close()
+        conn.close()
+
+
+class ShardedCatalog:
+    """
+    GameCatalog의 배열 컬럼을 공유 메모리에 올리고, 카탈로그를 workers개 샤드로 나눠
+    샤드마다 워커 프로세스 하나가 담당한다. 배열은 질의마다 pickle하지 않는다.
+    결과는 단일 프로세스 GameCatalog.recommend와 같다.
+    """
+
+    def __init__(self, catalog: GameCatalog, workers: int):
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+
+        self.catalog = catalog
+        self.closed = False
+        self._lock = threading.Lock()
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._conns = []
+        self._procs = []
+
+        try:
+            specs = {}
+            for name in GameCatalog.ARRAY_COLUMNS:
+                arr = np.ascontiguousarray(getattr(catalog, name))
+                shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+                self._blocks.append(shm)
+                np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+                specs[name] = (shm.name, arr.shape, arr.dtype.str)
+
+            n = len(catalog)
+            bounds = np.linspace(0, n, workers + 1).astype(int)
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                parent, child = mp.Pipe()
+                proc = mp.Process(
+                    target=_shard_worker,
+                    args=(child, specs, dict(catalog.tag_index), int(start), int(stop)),
+                    daemon=True,
+                )
+                proc.start()
+                child.close()
+                self._conns.append(parent)
+                self._procs.append(proc)
+        except Exception:
+            self._close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def top_indices(
+        self,
+        players: int,
+        target_time: Optional[int],
+        desired_tags: List[str],
+        desired_difficulty: Optional[int] = None,
+        top_k: int = 5,
+        preferred_tags: Optional[List[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        모든 샤드에 질의를 보내고, 샤드별 top_k를 모아 전체 top_k로 병합.
+        """
+        if self.closed:
+            raise RuntimeError("이미 닫힌 ShardedCatalog입니다.")
+        if top_k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+
+        query = (players, target_time, list(desired_tags), desired_difficulty, top_k, preferred_tags)
+        with self._lock:
+            for conn in self._conns:
+                conn.send(query)
+            replies = [conn.recv() for conn in self._conns]
+
+        idx_parts, score_parts = [], []
+        for status, idx, scores in replies:
+            if status != "ok":
+                raise RuntimeError(f"샤드 워커 오류: {idx}")
+            idx_parts.append(idx)
+            score_parts.append(scores)
+
+        idx = np.concatenate(idx_parts)
+        scores = np.concatenate(score_parts)
+        if idx.size == 0:
+            return idx, scores
+        return self.catalog.select_top(idx, scores, top_k)
+
+    def recommend(
+        self,
+        players: int,
+        target_time: Optional[int],
+        desired_tags: List[str],
+        desired_difficulty: Optional[int] = None,
+        top_k: int = 5,
+        preferred_tags: Optional[List[str]] = None,
+    ) -> List[Tuple[Game, float]]:
+        top, scores = self.top_indices(
+            players, target_time, desired_tags, desired_difficulty, top_k, preferred_tags
+        )
+        return self.catalog.to_results(top, scores)
+
+    def close(self) -> None:
+        """
+        워커 종료 후 공유 메모리 해제. 계산 중인 질의가 있으면 끝날 때까지 기다린다.
+        """
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (OSError, EOFError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._conns:
+            conn.close()
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+
+        self._conns, self._procs, self._blocks = [], [], []
@@ -0,0 +1,182 @@
+# boardka/plan.py
+# 질의를 한 번만 정리해 두는 "컴파일된 질의" (게임마다 질의 쪽 값을 다시 만들지 않음)
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from .index import TIME_TOLERANCE
+from .models import Game
+from .scoring import MAX_DIFF_SCORE, MAX_TAG_SCORE
+
+# 컴파일된 질의를 재사용하는 개수
+PLAN_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, eq=False)
+class QueryPlan:
+    """
+    score_game / 시간 페널티 규칙을 질의 하나에 맞춰 미리 계산해 둔 객체.
+    - desired / preferred: 공백 정리 후 중복 없는 태그 집합
+    - difficulty_scores: 게임 난이도 → 난이도 점수 표 (없는 난이도는 0점)
+    - time_low / time_high: 범위를 벗어났을 때 0.7배로 남는 한계 (target_time ∓ 30)
+    점수는 score_game × 시간 페널티와 같다 (부동소수 연산 순서까지 동일).
+    """
+    players: int
+    target_time: Optional[int]
+    desired: FrozenSet[str]
+    preferred: FrozenSet[str]
+    desired_difficulty: Optional[int]
+    difficulty_scores: Dict[int, float]
+    time_low: Optional[int]
+    time_high: Optional[int]
+
+    # ----------------- 게임 하나 -----------------
+
+    def penalty(self, game: Game) -> float:
+        """
+        인원 조건은 보지 않는 시간 페널티 (1.0 / 0.7 / 0.0=제외)
+        """
+        t = self.target_time
+        if t is None:
+            return 1.0
+        if game.min_time <= t <= game.max_time:
+            return 1.0
+        if t < game.min_time:
+            return 0.7 if game.min_time <= self.time_high else 0.0
+        return 0.7 if game.max_time >= self.time_low else 0.0
+
+    def base_score(self, game: Game) -> float:
+        """
+        score_game과 같은 기본 점수 (게임 태그 집합은 한 번만 만든다)
+        """
+        tag_score = pref_score = 0.0
+        if (self.desired or self.preferred) and game.tags:
+            actual = {t.strip() for t in game.tags}
+            if self.desired:
+                overlap = len(self.desired & actual)
+                if overlap:
+                    tag_score = MAX_TAG_SCORE * (overlap / len(self.desired))
+            if self.preferred:
+                overlap = len(self.preferred & actual)
+                if overlap:
+                    pref_score = (MAX_TAG_SCORE * (overlap / len(self.preferred))) * 0.3
+        diff_score = self.difficulty_scores.get(int(game.difficulty), 0.0) if self.difficulty_scores else 0.0
+        return tag_score + pref_score + diff_score
+
+    def score(self, game: Game) -> Optional[float]:
+        """
+        최종 점수 (기본 점수 × 시간 페널티). 인원 / 시간 조건에서 빠지면 None.
+        """
+        if not game.supports_player_count(self.players):
+            return None
+        penalty = self.penalty(game)
+        if penalty == 0.0:
+            return None
+        return self.base_score(game) * penalty
+
+    # ----------------- 여러 게임 -----------------
+
+    def score_many(self, games: Iterable[Game]) -> Iterator[Tuple[Game, float]]:
+        """
+        인원 / 시간 조건을 통과한 게임마다 (게임, 최종 점수)를 yield.
+        질의 쪽 값은 전부 지역 변수로 꺼내 두고 게임마다 필요한 연산만 한다.
+        """
+        players = self.players
+        t = self.target_time
+        low, high = self.time_low, self.time_high
+        desired, preferred = self.desired, self.preferred
+        n_desired, n_preferred = len(desired), len(preferred)
+        use_tags = bool(desired or preferred)
+        diff_table = self.difficulty_scores
+
+        for g in games:
+            # 인원 필터 (필수)
+            if not (g.min_players <= players <= g.max_players):
+                continue
+
+            # 시간 페널티
+            if t is None:
+                penalty = 1.0
+            else:
+                min_time = g.min_time
+                max_time = g.max_time
+                if min_time <= t <= max_time:
+                    penalty = 1.0
+                elif t < min_time:
+                    if min_time > high:
+                        continue
+                    penalty = 0.7
+                elif max_time < low:
+                    continue
+                else:
+                    penalty = 0.7
+
+            # 태그 점수 (선택 0~60, 선호 0~18)
+            tag_score = pref_score = 0.0
+            if use_tags and g.tags:
+                actual = {s.strip() for s in g.tags}
+                d_overlap = len(desired & actual) if n_desired else 0
+                p_overlap = len(preferred & actual) if n_preferred else 0
+                if d_overlap:
+                    tag_score = MAX_TAG_SCORE * (d_overlap / n_desired)
+                if p_overlap:
+                    pref_score = (MAX_TAG_SCORE * (p_overlap / n_preferred)) * 0.3
+
+            # 난이도 점수 (0~40)
+            diff_score = diff_table.get(int(g.difficulty), 0.0) if diff_table else 0.0
+
+            yield g, (tag_score + pref_score + diff_score) * penalty
+
+
+def _normalize_tags(tags: Optional[Iterable[str]]) -> FrozenSet[str]:
+    return frozenset(t.strip() for t in (tags or []) if t.strip())
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _build_plan(
+    players: int,
+    target_time: Optional[int],
+    desired: FrozenSet[str],
+    preferred: FrozenSet[str],
+    desired_difficulty: Optional[int],
+) -> QueryPlan:
+    difficulty_scores: Dict[int, float] = {}
+    if desired_difficulty is not None:
+        dd = int(desired_difficulty)
+        difficulty_scores = {dd - 1: MAX_DIFF_SCORE * 0.4, dd + 1: MAX_DIFF_SCORE * 0.4, dd: MAX_DIFF_SCORE}
+
+    time_low = time_high = None
+    if target_time is not None:
+        time_low = target_time - TIME_TOLERANCE
+        time_high = target_time + TIME_TOLERANCE
+
+    return QueryPlan(
+        players=players,
+        target_time=target_time,
+        desired=desired,
+        preferred=preferred,
+        desired_difficulty=desired_difficulty,
+        difficulty_scores=difficulty_scores,
+        time_low=time_low,
+        time_high=time_high,
+    )
+
+
+def compile_query(
+    players: int,
+    target_time: Optional[int],
+    desired_tags: Optional[Iterable[str]] = None,
+    desired_difficulty: Optional[int] = None,
+    preferred_tags: Optional[Iterable[str]] = None,
+) -> QueryPlan:
+    """
+    질의를 QueryPlan으로 컴파일. 태그 순서 / 공백 / 중복만 다른 질의는 같은 plan을 재사용한다.
+    """
+    return _build_plan(
+        players,
+        target_time,
+        _normalize_tags(desired_tags),
+        _normalize_tags(preferred_tags),
+        desired_difficulty,
+    )
@@ -0,0 +1,325 @@
+# boardka/prefs.py
+# 선호 태그 저장소: 변경은 로그 파일에 한 줄씩 덧붙이고, 가끔 스냅샷으로 합친다
+
+import atexit
+import heapq
+import json
+import os
+import re
+import threading
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PREFS_VERSION = 2
+LOG_SUFFIX = ".log"
+
+# 아직 닫지 않은 저장소들 (종료 시 남은 변경을 기록). 약한 참조라 다 쓴 저장소는 그대로 사라진다
+# (기록 대기 중인 변경이 있으면 타이머가 저장소를 붙잡고 있으므로 사라지지 않는다)
+_open_stores: "weakref.WeakSet[PreferenceStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_stores() -> None:
+    for store in list(_open_stores):
+        store.close()
+
+
+def _atomic_write_json(path: str, data) -> None:
+    """
+    임시 파일에 쓰고 fsync 후 교체 (중간에 꺼져도 예전 파일 아니면 새 파일 둘 중 하나만 남는다)
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class PreferenceStore:
+    """
+    태그별 선호 점수(클릭 횟수) 저장소.
+    - 스냅샷: path (JSON, {"version", "seq", "prefs": {태그: 점수}}; 예전 {태그: 점수} 형식도 읽음)
+    - 로그: path + ".log" (변경 한 건당 JSON 한 줄, 번호 seq 포함)
+    - 변경은 메모리에 바로 반영하고, 파일에는 flush_delay초 동안 모았다가 한 번에 덧붙인다
+    - 로그가 compact_every줄을 넘으면 스냅샷을 새로 쓰고 로그를 비운다
+    - 읽을 때는 스냅샷 + (스냅샷 seq보다 뒤인) 로그를 다시 적용하므로, 어느 단계에서 꺼져도 중복 / 누락이 없다
+      (마지막 줄이 쓰다 만 줄이면 버린다)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_delay: float = 1.0,
+        max_pending: int = 100,
+        compact_every: int = 500,
+    ):
+        self.path = path
+        self.log_path = path + LOG_SUFFIX
+        self.flush_delay = flush_delay
+        self.max_pending = max_pending
+        self.compact_every = compact_every
+
+        self._counts: Dict[str, int] = {}
+        self._seq = 0            # 마지막 변경 번호
+        self._log_lines = 0      # 로그 파일에 있는 줄 수
+        self._pending: List[dict] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self._top_cache: Dict[int, List[Tuple[str, int]]] = {}
+
+        self._load()
+        _open_stores.add(self)
+
+    # ----------------- 읽기 -----------------
+
+    def _load(self) -> None:
+        snapshot_seq = 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # 없거나 망가진 파일이면 빈 상태에서 시작 (로그는 그대로 적용)
+            data = {}
+
+        if isinstance(data, dict) and data.get("version") == PREFS_VERSION:
+            snapshot_seq = int(data.get("seq", 0))
+            raw = data.get("prefs", {})
+        else:
+            raw = data  # 예전 형식: {태그: 점수}
+        if not isinstance(raw, dict):
+            raw = {}
+
+        for k, v in raw.items():
+            # 값이 숫자가 아닐 수 있으니 안전하게 정수로 캐스팅
+            try:
+                self._counts[str(k)] = int(v)
+            except (TypeError, ValueError):
+                continue
+        self._seq = snapshot_seq
+
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        break  # 쓰다 만 마지막 줄
+                    self._log_lines += 1
+                    # JSON이지만 변경 이벤트가 아닌 줄(null, [] 등)은 건너뛴다
+                    if not isinstance(event, dict) or not isinstance(event.get("seq", 0), int):
+                        continue
+                    if event.get("seq", 0) > snapshot_seq:
+                        self._apply(event)
+                        self._seq = event["seq"]
+        except OSError:
+            pass
+
+    def _apply(self, event: dict) -> None:
+        if event.get("reset"):
+            self._counts.clear()
+        for tag in event.get("add", ()):
+            self._counts[tag] = self._counts.get(tag, 0) + 1
+        self._top_cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __bool__(self) -> bool:
+        return bool(self._counts)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._counts
+
+    def get(self, tag: str, default: int = 0) -> int:
+        return self._counts.get(tag, default)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def top_items(self, n: int = 5) -> List[Tuple[str, int]]:
+        """
+        선호 점수 상위 n개 (점수 내림차순, 같으면 먼저 생긴 태그 먼저).
+        전체 정렬 대신 상위 n개만 고르고, 바뀌기 전까지는 결과를 재사용한다.
+        """
+        with self._lock:
+            cached = self._top_cache.get(n)
+            if cached is None:
+                cached = heapq.nlargest(n, self._counts.items(), key=lambda item: item[1])
+                self._top_cache[n] = cached
+            return list(cached)
+
+    def top(self, n: int = 5) -> List[str]:
+        return [tag for tag, _ in self.top_items(n)]
+
+    # ----------------- 변경 -----------------
+
+    def add_tags(self, tags: Iterable[str]) -> None:
+        """
+        태그마다 선호 점수 +1
+        """
+        tags = [str(t) for t in tags]
+        if tags:
+            self._record({"add": tags})
+
+    def reset(self) -> None:
+        """
+        선호 태그 전체 초기화 (로그에 초기화 이벤트를 남기고, 다음 압축 때 스냅샷도 비워진다)
+        """
+        self._record({"reset": True})
+
+    def _record(self, event: dict) -> None:
+        with self._lock:
+            self._seq += 1
+            event = {"seq": self._seq, **event}
+            self._apply(event)
+            self._pending.append(event)
+
+            if len(self._pending) >= self.max_pending or self.flush_delay <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                # 짧은 시간에 몰린 변경은 한 번에 기록
+                self._timer = threading.Timer(self.flush_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    # ----------------- 파일 기록 -----------------
+
+    def flush(self) -> None:
+        """
+        모아 둔 변경을 로그에 덧붙인다 (필요하면 압축까지).
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        folder = os.path.dirname(self.log_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        lines = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in self._pending)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_lines += len(self._pending)
+        self._pending = []
+
+        if self._log_lines >= self.compact_every:
+            self._compact_locked()
+
+    def compact(self) -> None:
+        """
+        현재 상태를 스냅샷으로 쓰고 로그를 비운다.
+        """
+        with self._lock:
+            self._flush_locked()
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        # 1) 스냅샷(seq 포함)을 원자적으로 교체 → 2) 로그 비우기.
+        #    2) 전에 꺼지면 로그에 남은 변경은 seq가 스냅샷 이하라 다시 적용되지 않는다.
+        _atomic_write_json(self.path, {"version": PREFS_VERSION, "seq": self._seq, "prefs": self._counts})
+        with open(self.log_path, "w", encoding="utf-8"):
+            pass
+        self._log_lines = 0
+
+    def close(self) -> None:
+        """
+        남은 변경을 기록 (닫지 않은 저장소는 프로그램 종료 시 자동 호출).
+        """
+        try:
+            self.flush()
+        except OSError:
+            pass
+        _open_stores.discard(self)
+
+
+# 사용자 id로 쓸 수 있는 문자 (파일 이름이 되므로 경로 구분자 등은 막는다)
+_USER_ID_RE = re.compile(r"[\w\-]+(?:\.[\w\-]+)*")
+
+
+class ProfileStore:
+    """
+    사용자(동호회 회원)별 선호 태그 저장소 모음.
+    - folder/<사용자 id>.json (+ .log)마다 PreferenceStore 하나
+    - 처음 접근할 때 열고, 이후에는 열어 둔 저장소를 재사용한다
+    """
+
+    def __init__(self, folder: str, **store_options):
+        self.folder = folder
+        self.store_options = store_options
+        self._stores: Dict[str, PreferenceStore] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _check_id(user_id) -> str:
+        user_id = str(user_id).strip()
+        if not _USER_ID_RE.fullmatch(user_id):
+            raise ValueError(f"사용할 수 없는 사용자 id입니다: {user_id!r}")
+        return user_id
+
+    def get(self, user_id) -> PreferenceStore:
+        """
+        사용자 저장소 (없으면 빈 저장소를 만든다. 파일은 첫 변경 때 생긴다)
+        """
+        user_id = self._check_id(user_id)
+        with self._lock:
+            store = self._stores.get(user_id)
+            if store is None:
+                path = os.path.join(self.folder, user_id + ".json")
+                store = PreferenceStore(path, **self.store_options)
+                self._stores[user_id] = store
+            return store
+
+    __getitem__ = get
+
+    def user_ids(self) -> List[str]:
+        """
+        저장된(또는 이번에 연) 사용자 id 목록 (정렬)
+        """
+        ids = set(self._stores)
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            names = []
+        for name in names:
+            if name.endswith(LOG_SUFFIX):
+                name = name[: -len(LOG_SUFFIX)]
+            if name.endswith(".json") and _USER_ID_RE.fullmatch(name[:-5]):
+                ids.add(name[:-5])
+        return sorted(ids)
+
+    def __iter__(self):
+        return iter(self.user_ids())
+
+    def __len__(self) -> int:
+        return len(self.user_ids())
+
+    def preferred_tags(self, n: int = 5) -> Dict[str, List[str]]:
+        """
+        사용자 id → 선호 점수 상위 n개 태그 (GUI와 같은 기준, recommend_for_users에 바로 넘길 수 있음)
+        """
+        return {user_id: self.get(user_id).top(n) for user_id in self.user_ids()}
+
+    def flush(self) -> None:
+        for store in list(self._stores.values()):
+            store.flush()
+
+    def close(self) -> None:
+        """
+        열어 둔 저장소를 모두 닫고 잊는다 (다시 get하면 파일에서 새로 연다).
+        """
+        with self._lock:
+            stores, self._stores = list(self._stores.values()), {}
+        for store in stores:
+            store.close()
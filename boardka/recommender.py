@@ -1,59 +1,331 @@
 # boardka/recommender.py
 
-from typing import List, Tuple, Optional
+import heapq
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple, Optional, Union
 from .models import Game
-from .scoring import score_game
+from .catalog import GameCatalog
+from .cursor import ArraySource, HeapSource, ResultCursor
+from .metrics import Metrics, stage
+from .plan import compile_query
+
+# recommend_for_users: (후보 게임 × 사용자) 점수 배열 한 번에 만드는 최대 칸 수 (float64 기준 약 128MB)
+USER_SCORE_CELLS = 16_000_000
 
 
 def recommend_games(
-    games: List[Game],
+    games: Union[Iterable[Game], GameCatalog],
     players: int,
     target_time: Optional[int],
     desired_tags: List[str],
     desired_difficulty: Optional[int] = None,
     top_k: int = 5,
     preferred_tags: Optional[List[str]] = None,  # 선호 태그 (GUI에서 넘겨줄 수 있음)
+    workers: Optional[int] = None,  # 2 이상이면 카탈로그를 나눠 여러 프로세스에서 계산
+    metrics: Optional[Metrics] = None,  # 넘기면 단계별 시간 / 개수를 기록 (--profile)
 ) -> List[Tuple[Game, float]]:
 
-    # preferred_tags가 None이면 빈 리스트로 처리
-    if preferred_tags is None:
-        preferred_tags = []
+    # 여러 프로세스 사용: 카탈로그를 샤드로 나눠 계산 (워커는 카탈로그에 붙어 재사용됨)
+    # 게임 목록이 넘어와 여기서 만든 임시 카탈로그는 워커 / 공유 메모리까지 바로 정리한다
+    if workers is not None and workers > 1:
+        owned = not isinstance(games, GameCatalog)
+        if owned:
+            with stage(metrics, "catalog"):
+                games = GameCatalog(games)
+        try:
+            with stage(metrics, "sharded"):
+                results = games.sharded(workers).recommend(
+                    players,
+                    target_time,
+                    desired_tags,
+                    desired_difficulty=desired_difficulty,
+                    top_k=top_k,
+                    preferred_tags=preferred_tags,
+                )
+        finally:
+            if owned:
+                games.close()
+        if metrics is not None:
+            metrics.count("games", len(games))
+            metrics.count("returned", len(results))
+        return results
 
-    scored: List[Tuple[Game, float]] = []
+    # 카탈로그가 넘어오면 배열 연산 경로 사용
+    if isinstance(games, GameCatalog):
+        return games.recommend(
+            players,
+            target_time,
+            desired_tags,
+            desired_difficulty=desired_difficulty,
+            top_k=top_k,
+            preferred_tags=preferred_tags,
+            metrics=metrics,
+        )
 
-    for g in games:
-        # 인원 필터 (필수)
-        if not g.supports_player_count(players):
-            continue
+    # 점수 매긴 게임을 하나씩 받아 상위 top_k개만 힙으로 유지 (메모리 O(top_k))
+    if top_k <= 0:
+        return []
+    if metrics is not None:
+        return _recommend_profiled(
+            games, players, target_time, desired_tags, desired_difficulty,
+            top_k, preferred_tags, metrics,
+        )
+    scored = score_games(
+        games,
+        players=players,
+        target_time=target_time,
+        desired_tags=desired_tags,
+        desired_difficulty=desired_difficulty,
+        preferred_tags=preferred_tags,
+    )
+    return heapq.nsmallest(top_k, scored, key=rank_key)
 
-        # 시간 입력이 있을 때만 시간 조건 적용
-        if target_time is not None:
-            diff = g.time_difference(target_time)
 
-            if diff == 0:
-                penalty = 1.0
-            elif diff <= 30:
-                penalty = 0.7
-            else:
-                # 30분 이상 차이나면 제외
-                continue
+def recommend_cursor(
+    games: Union[Iterable[Game], GameCatalog],
+    players: int,
+    target_time: Optional[int],
+    desired_tags: List[str],
+    desired_difficulty: Optional[int] = None,
+    preferred_tags: Optional[List[str]] = None,
+    page_size: int = 5,
+) -> ResultCursor:
+    """
+    recommend_games와 같은 순위를 페이지 단위로 꺼내는 커서를 만든다.
+    점수는 여기서 한 번만 계산하고, 정렬은 페이지를 요청할 때 필요한 만큼만 한다.
+    cursor.fetch(0, k)는 recommend_games(..., top_k=k)와 같다.
+    """
+    if isinstance(games, GameCatalog):
+        idx, penalty = games.candidates(players, target_time)
+        if idx.size:
+            scores = games.score(desired_tags, preferred_tags or [], desired_difficulty, idx) * penalty
         else:
-            # 시간 입력이 없으면 페널티 없이 포함
-            penalty = 1.0
+            scores = penalty
+        return ResultCursor(ArraySource(games, idx, scores), page_size)
 
-        # 기본 점수 계산 (태그 + 난이도)
-        base_score = score_game(
-            g,
-            selected_tags=desired_tags,
-            preferred_tags=preferred_tags,
-            desired_difficulty=desired_difficulty,
+    scored = score_games(
+        games,
+        players=players,
+        target_time=target_time,
+        desired_tags=desired_tags,
+        desired_difficulty=desired_difficulty,
+        preferred_tags=preferred_tags,
+    )
+    return ResultCursor(HeapSource(scored), page_size)
+
+
+def _recommend_profiled(
+    games: Iterable[Game],
+    players: int,
+    target_time: Optional[int],
+    desired_tags: List[str],
+    desired_difficulty: Optional[int],
+    top_k: int,
+    preferred_tags: Optional[List[str]],
+    metrics: Metrics,
+) -> List[Tuple[Game, float]]:
+    """
+    score_games + 힙 선택과 같은 결과를 단계별로 나눠 계산하면서
+    단계별 시간과 걸러진 게임 수를 metrics에 기록한다.
+    """
+    with metrics.stage("compile"):
+        plan = compile_query(players, target_time, desired_tags, desired_difficulty, preferred_tags)
+
+    if not isinstance(games, list):
+        # 스트리밍 로더 등: 읽는 시간도 따로 기록
+        with metrics.stage("collect"):
+            games = list(games)
+    metrics.count("games", len(games))
+
+    with metrics.stage("players"):
+        passed = [g for g in games if g.supports_player_count(players)]
+    metrics.count("rejected_players", len(games) - len(passed))
+
+    with metrics.stage("time_penalty"):
+        timed = [g for g in passed if plan.penalty(g) > 0.0]
+    metrics.count("rejected_time", len(passed) - len(timed))
+
+    with metrics.stage("score"):
+        # 필터는 이미 통과했으므로 score_many에서는 점수 계산만 의미가 있다
+        scored = list(plan.score_many(timed))
+    metrics.count("scored", len(scored))
+
+    with metrics.stage("sort"):
+        results = heapq.nsmallest(top_k, scored, key=rank_key)
+    metrics.count("returned", len(results))
+    return results
+
+
+def _tag_key(tags: Optional[List[str]]) -> Tuple[str, ...]:
+    return tuple(sorted({t.strip() for t in (tags or []) if t.strip()}))
+
+
+def recommend_many(
+    catalog: Union[Iterable[Game], GameCatalog],
+    queries: Iterable[dict],
+    workers: Optional[int] = None,
+    metrics: Optional[Metrics] = None,
+) -> List[List[Tuple[Game, float]]]:
+    """
+    여러 질의를 한 번에 추천. 각 질의는 recommend_games의 키워드 인자 dict
+    (players 필수, target_time / desired_tags / desired_difficulty / top_k / preferred_tags 선택).
+    - 인원 / 시간이 같은 질의끼리는 후보 필터링을 한 번만 한다
+    - 태그 / 난이도 / top_k까지 같은 질의는 결과를 재사용한다
+    workers가 2 이상이면 질의마다 샤드 워커들이 나눠 계산한다
+    (게임 목록이 넘어오면 여기서 만든 카탈로그의 워커는 끝나면 정리한다).
+    결과는 질의 순서대로 반환.
+    """
+    owned = not isinstance(catalog, GameCatalog)
+    if owned:
+        with stage(metrics, "catalog"):
+            catalog = GameCatalog(catalog)
+
+    queries = list(queries)
+    if metrics is not None:
+        metrics.count("queries", len(queries))
+    if workers is not None and workers > 1:
+        try:
+            return _recommend_many_sharded(catalog.sharded(workers), queries, metrics)
+        finally:
+            if owned:
+                catalog.close()
+
+    results: List[List[Tuple[Game, float]]] = [[] for _ in queries]
+
+    groups: dict[tuple, List[int]] = {}
+    for i, q in enumerate(queries):
+        groups.setdefault((q["players"], q.get("target_time")), []).append(i)
+
+    for (players, target_time), members in groups.items():
+        with stage(metrics, "candidates"):
+            idx, penalty = catalog.candidates(players, target_time)
+        done: dict[tuple, List[Tuple[Game, float]]] = {}
+        for i in members:
+            q = queries[i]
+            key = (
+                _tag_key(q.get("desired_tags")),
+                _tag_key(q.get("preferred_tags")),
+                q.get("desired_difficulty"),
+                q.get("top_k", 5),
+            )
+            if key not in done:
+                with stage(metrics, "rank"):
+                    done[key] = catalog.rank(
+                        idx,
+                        penalty,
+                        q.get("desired_tags") or [],
+                        desired_difficulty=q.get("desired_difficulty"),
+                        top_k=q.get("top_k", 5),
+                        preferred_tags=q.get("preferred_tags"),
+                    )
+            results[i] = list(done[key])
+        if metrics is not None:
+            metrics.count("candidate_groups")
+            metrics.count("unique_queries", len(done))
+
+    return results
+
+
+def _recommend_many_sharded(shards, queries: List[dict], metrics: Optional[Metrics]) -> List[List[Tuple[Game, float]]]:
+    """
+    recommend_many의 여러 프로세스 경로: 같은 질의는 한 번만 샤드 워커에 보낸다.
+    """
+    done: dict[tuple, List[Tuple[Game, float]]] = {}
+    results = []
+    for q in queries:
+        key = (
+            q["players"],
+            q.get("target_time"),
+            _tag_key(q.get("desired_tags")),
+            _tag_key(q.get("preferred_tags")),
+            q.get("desired_difficulty"),
+            q.get("top_k", 5),
         )
+        if key not in done:
+            with stage(metrics, "sharded"):
+                done[key] = shards.recommend(
+                    q["players"],
+                    q.get("target_time"),
+                    q.get("desired_tags") or [],
+                    desired_difficulty=q.get("desired_difficulty"),
+                    top_k=q.get("top_k", 5),
+                    preferred_tags=q.get("preferred_tags"),
+                )
+        results.append(list(done[key]))
+    if metrics is not None:
+        metrics.count("unique_queries", len(done))
+    return results
 
-        # 최종 점수 = 기본 점수 × 시간 페널티
-        final_score = base_score * penalty
 
-        scored.append((g, final_score))
+def recommend_for_users(
+    catalog: Union[Iterable[Game], GameCatalog],
+    profiles: Dict[Hashable, List[str]],
+    players: int,
+    target_time: Optional[int],
+    desired_tags: Optional[List[str]] = None,
+    desired_difficulty: Optional[int] = None,
+    top_k: int = 5,
+    metrics: Optional[Metrics] = None,
+) -> Dict[Hashable, List[Tuple[Game, float]]]:
+    """
+    여러 사용자의 "맞춤 추천"을 한 번에 계산. profiles는 사용자 id → 선호 태그 목록
+    (ProfileStore.preferred_tags()). 인원 / 시간 / 선택 태그 / 난이도는 모두에게 같다.
+    - 후보 필터링과 선택 태그 / 난이도 점수는 한 번만 계산
+    - 선호 태그 점수는 (게임 × 태그) @ (태그 × 사용자) 행렬곱으로 사용자 전체를 한 번에
+    - 사용자가 많으면 점수 배열이 USER_SCORE_CELLS칸을 넘지 않게 나눠 계산
+    사용자마다 recommend_games(..., preferred_tags=profiles[id])와 같은 결과.
+    """
+    if not isinstance(catalog, GameCatalog):
+        with stage(metrics, "catalog"):
+            catalog = GameCatalog(catalog)
+
+    user_ids = list(profiles)
+    results: Dict[Hashable, List[Tuple[Game, float]]] = {u: [] for u in user_ids}
+    if metrics is not None:
+        metrics.count("users", len(user_ids))
+    if top_k <= 0 or not user_ids:
+        return results
+
+    with stage(metrics, "candidates"):
+        idx, penalty = catalog.candidates(players, target_time)
+    if idx.size == 0:
+        return results
+
+    block = max(1, USER_SCORE_CELLS // idx.size)
+    for start in range(0, len(user_ids), block):
+        members = user_ids[start: start + block]
+        with stage(metrics, "score_users"):
+            scores = catalog.score_users(
+                desired_tags or [], [profiles[u] for u in members], desired_difficulty, idx
+            ) * penalty[:, None]
+        with stage(metrics, "rank"):
+            for j, user_id in enumerate(members):
+                top, top_scores = catalog.select_top(idx, scores[:, j], top_k)
+                results[user_id] = catalog.to_results(top, top_scores)
+    if metrics is not None:
+        metrics.count("scored", idx.size * len(user_ids))
+    return results
+
+
+def rank_key(item: Tuple[Game, float]):
+    """
+    정렬 기준: 점수 내림차순, 동점이면 id 오름차순
+    """
+    game, score = item
+    return -score, game.id
 
-    # 점수 내림차순 정렬 후 상위 top_k개 반환
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[:top_k]
+
+def score_games(
+    games: Iterable[Game],
+    players: int,
+    target_time: Optional[int],
+    desired_tags: List[str],
+    desired_difficulty: Optional[int] = None,
+    preferred_tags: Optional[List[str]] = None,
+) -> Iterator[Tuple[Game, float]]:
+    """
+    인원 / 시간 조건을 통과한 게임마다 (게임, 최종 점수)를 yield.
+    games는 리스트뿐 아니라 스트리밍 로더의 제너레이터도 받을 수 있다.
+    점수는 scoring.score_game × 시간 페널티와 같고, 질의는 QueryPlan으로 한 번만 정리한다.
+    """
+    plan = compile_query(players, target_time, desired_tags, desired_difficulty, preferred_tags)
+    return plan.score_many(games)
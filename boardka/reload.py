@@ -0,0 +1,154 @@
+# boardka/reload.py
+# GameList.xlsx가 바뀌면 다시 읽어서 바뀐 게임만 카탈로그에 반영 (폴링 방식 감시)
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional
+
+from .catalog import GameCatalog
+from .models import Game
+
+
+@dataclass
+class CatalogDiff:
+    """
+    id 기준으로 비교한 변경 내용
+    """
+    inserted: List[Game] = field(default_factory=list)
+    updated: List[Game] = field(default_factory=list)
+    removed: list = field(default_factory=list)  # 삭제된 게임 id
+
+    @property
+    def empty(self) -> bool:
+        return not (self.inserted or self.updated or self.removed)
+
+    def __str__(self) -> str:
+        return f"추가 {len(self.inserted)}개, 수정 {len(self.updated)}개, 삭제 {len(self.removed)}개"
+
+
+def _has_duplicate_ids(games: List[Game]) -> bool:
+    return len({g.id for g in games}) != len(games)
+
+
+def diff_games(old: Iterable[Game], new: Iterable[Game]) -> CatalogDiff:
+    """
+    예전 / 새 게임 목록을 id로 맞춰 보고 추가 / 수정 / 삭제된 게임을 구한다.
+    """
+    old_by_id = {g.id: g for g in old}
+    diff = CatalogDiff()
+    seen = set()
+    for g in new:
+        seen.add(g.id)
+        before = old_by_id.get(g.id)
+        if before is None:
+            diff.inserted.append(g)
+        elif before != g:
+            diff.updated.append(g)
+    diff.removed = [gid for gid in old_by_id if gid not in seen]
+    return diff
+
+
+class LiveCatalog:
+    """
+    파일을 감시하면서 항상 최신 GameCatalog를 들고 있는 객체.
+    - 추천할 때는 live.catalog를 한 번 읽어서 그 참조로 계산하면 된다
+    - 새 카탈로그는 옆에서 완성한 뒤 참조만 바꾸므로, 계산 중인 추천은 반쯤 바뀐 카탈로그를 보지 않는다
+    - 바뀔 때마다 listeners(new_catalog, diff)를 호출한다 (감시 스레드에서 호출됨)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        load: Optional[Callable[[str], List[Game]]] = None,
+        interval: float = 2.0,
+        catalog: Optional[GameCatalog] = None,
+    ):
+        if load is None:
+            from .loaders import load_games as load  # 확장자로 형식 선택
+
+        self.path = path
+        self.load = load
+        self.interval = interval
+        self.listeners: List[Callable[[GameCatalog, CatalogDiff], None]] = []
+        self.version = 0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._stat = self._read_stat()
+        self.catalog: GameCatalog = catalog if catalog is not None else GameCatalog(self.load(path))
+
+    def _read_stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    # ----------------- 다시 읽기 -----------------
+
+    def reload(self) -> CatalogDiff:
+        """
+        파일을 다시 읽어 바뀐 게임만 반영한 새 카탈로그로 교체.
+        """
+        with self._lock:
+            new_games = self.load(self.path)
+            current = self.catalog
+            diff = diff_games(current.games, new_games)
+            if diff.empty:
+                return diff
+
+            if _has_duplicate_ids(new_games) or _has_duplicate_ids(current.games):
+                # id가 겹치면 부분 반영이 불가능하므로 통째로 다시 만든다
+                catalog = GameCatalog(new_games)
+            else:
+                catalog = current.with_changes(diff.inserted + diff.updated, diff.removed)
+
+            self.catalog = catalog
+            self.version += 1
+
+        for listener in list(self.listeners):
+            listener(catalog, diff)
+        current.close()
+        return diff
+
+    def check(self) -> Optional[CatalogDiff]:
+        """
+        파일이 바뀌었으면 다시 읽는다. 바뀌지 않았으면 None.
+        저장 도중일 수 있으므로 크기 / 수정시각이 한 번 더 같게 나올 때 읽는다.
+        """
+        stat = self._read_stat()
+        if stat is None or stat == self._stat:
+            return None
+        self._stop.wait(min(self.interval, 0.5))
+        if self._read_stat() != stat:
+            return None  # 아직 쓰는 중, 다음 폴링에서 다시 확인
+
+        try:
+            diff = self.reload()
+        except Exception:
+            # 저장 중인 파일 등으로 읽기 실패 → 다음 폴링 때 다시 시도
+            return None
+        self._stat = stat
+        return diff
+
+    # ----------------- 감시 스레드 -----------------
+
+    def start(self) -> "LiveCatalog":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="boardka-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -82,4 +82,3 @@ def score_game(
     diff_score = compute_difficulty_score(game, desired_difficulty)
 
     return tag_score + pref_score + diff_score
-
@@ -0,0 +1,314 @@
+# boardka/server.py
+# asyncio 기반 추천 HTTP 서버 (카탈로그는 시작할 때 한 번만 로딩)
+#
+# 실행 예) py -m boardka.server --data data/GameList.xlsx --port 8080
+#   GET  /recommend?players=4&time=60&tags=전략,카드&difficulty=3&top_k=5
+#   POST /recommend  {"players": 4, "time": 60, "tags": ["전략"]}
+#   GET  /health, GET /metrics
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .api import query_from_dict, result_to_dict
+from .cache import RecommendationCache
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 15.0
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class RecommendationServer:
+    """
+    추천 HTTP 서버.
+    - 점수 계산은 스레드 풀에서 실행해 이벤트 루프를 막지 않는다
+    - 동시에 계산하는 요청은 max_concurrency개로 제한
+    - 대기 + 계산 중인 요청이 max_pending개를 넘으면 바로 503으로 돌려보낸다 (backpressure)
+    """
+
+    def __init__(
+        self,
+        catalog,
+        max_concurrency: int = 4,
+        max_pending: int = 64,
+        cache_size: int = 256,
+    ):
+        self.catalog = catalog
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.cache = RecommendationCache(maxsize=cache_size)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="boardka-score")
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self._started = time.monotonic()
+
+        # 지표
+        self.requests_total = 0
+        self.rejected_total = 0
+        self.responses: dict[int, int] = {}
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.recommend_total = 0
+
+    # ----------------- 서버 시작 / 종료 -----------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.start_server(self._handle_connection, host, port, limit=MAX_HEADER_BYTES)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ----------------- HTTP 처리 -----------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HttpError as e:
+                    await self._write_json(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+
+                method, target, headers, body, keep_alive = request
+                started = time.monotonic()
+                self.requests_total += 1
+                try:
+                    status, payload = await self._dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": repr(e)}
+
+                elapsed = time.monotonic() - started
+                self.latency_sum += elapsed
+                self.latency_max = max(self.latency_max, elapsed)
+                self.responses[status] = self.responses.get(status, 0) + 1
+
+                await self._write_json(writer, status, payload, keep_alive=keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """
+        요청 하나를 읽어 (method, target, headers, body, keep_alive) 반환. 연결이 끝났으면 None.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "헤더가 너무 큽니다.")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "잘못된 요청 줄입니다.")
+        # 인코딩하지 않은 한글이 경로에 그대로 들어오는 경우 (UTF-8로 해석)
+        target = target.encode("latin-1").decode("utf-8", errors="replace")
+
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "Content-Length가 잘못되었습니다.")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "본문이 너무 큽니다.")
+        body = await reader.readexactly(length) if length else b""
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+        return method.upper(), target, headers, body, keep_alive
+
+    async def _write_json(self, writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        )
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        url = urlsplit(target)
+
+        if url.path == "/health":
+            return 200, {"status": "ok", "games": len(self.catalog)}
+        if url.path == "/metrics":
+            return 200, self.metrics()
+        if url.path != "/recommend":
+            raise HttpError(404, "없는 경로입니다.")
+
+        if method == "GET":
+            params = parse_qs(url.query, keep_blank_values=True)
+            raw: dict = {}
+            for key, values in params.items():
+                if key in ("tags", "desired_tags", "preferred_tags"):
+                    raw[key] = ",".join(values)
+                else:
+                    raw[key] = values[-1]
+        elif method == "POST":
+            try:
+                raw = json.loads(body.decode("utf-8") or "{}")
+            except (UnicodeDecodeError, ValueError):
+                raise HttpError(400, "본문이 올바른 JSON이 아닙니다.")
+        else:
+            raise HttpError(405, "GET 또는 POST만 지원합니다.")
+
+        try:
+            query = query_from_dict(raw)
+        except ValueError as e:
+            raise HttpError(400, str(e))
+
+        results = await self._recommend(query)
+        return 200, {"results": [result_to_dict(g, s) for g, s in results]}
+
+    async def _recommend(self, query: dict):
+        # 대기열이 가득 차면 바로 거절 (backpressure)
+        if self._pending >= self.max_pending:
+            self.rejected_total += 1
+            raise HttpError(503, "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+
+        self._pending += 1
+        try:
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(
+                    self._executor, lambda: self.cache.recommend(self.catalog, **query)
+                )
+            self.recommend_total += 1
+            return results
+        finally:
+            self._pending -= 1
+
+    def metrics(self) -> dict:
+        handled = sum(self.responses.values())
+        return {
+            "uptime_sec": round(time.monotonic() - self._started, 3),
+            "games": len(self.catalog),
+            "requests_total": self.requests_total,
+            "recommend_total": self.recommend_total,
+            "rejected_total": self.rejected_total,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "max_concurrency": self.max_concurrency,
+            "responses": {str(k): v for k, v in sorted(self.responses.items())},
+            "latency_avg_ms": round(self.latency_sum / handled * 1000, 3) if handled else 0.0,
+            "latency_max_ms": round(self.latency_max * 1000, 3),
+            "cache": self.cache.stats(),
+        }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="보드게임 추천 HTTP 서버")
+    parser.add_argument("--data", default="data/GameList.xlsx", help="보드게임 카탈로그 파일 경로 (.xlsx / .csv / .parquet / .arrow)")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8080, help="포트")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="동시에 계산할 최대 요청 수")
+    parser.add_argument("--max-pending", type=int, default=64, help="대기 + 계산 중 최대 요청 수 (넘으면 503)")
+    parser.add_argument("--cache-size", type=int, default=256, help="추천 결과 캐시 크기")
+    parser.add_argument(
+        "--watch",
+        type=float,
+        default=0.0,
+        metavar="SEC",
+        help="SEC초마다 엑셀 파일 변경을 확인해 바뀐 게임만 다시 반영 (0이면 끔)",
+    )
+    return parser.parse_args()
+
+
+async def serve(args) -> None:
+    from .loaders import load_catalog
+    from .reload import LiveCatalog
+
+    live = None
+    if args.watch > 0:
+        live = LiveCatalog(args.data, interval=args.watch)
+        catalog = live.catalog
+    else:
+        catalog = load_catalog(args.data)
+
+    server = RecommendationServer(
+        catalog,
+        max_concurrency=args.max_concurrency,
+        max_pending=args.max_pending,
+        cache_size=args.cache_size,
+    )
+    if live is not None:
+        # 새 카탈로그로 참조만 교체 (계산 중인 요청은 예전 카탈로그로 끝까지 계산)
+        def on_reload(new_catalog, diff):
+            server.catalog = new_catalog
+            print(f"카탈로그 갱신: {diff} (총 {len(new_catalog)}개)")
+
+        live.listeners.append(on_reload)
+        live.start()
+
+    srv = await server.start(args.host, args.port)
+    print(f"총 {len(catalog)}개의 게임을 불러왔습니다. http://{args.host}:{args.port}/recommend")
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        if live is not None:
+            live.stop()
+        server.close()
+
+
+def main():
+    try:
+        asyncio.run(serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# boardka/session.py
+# GUI용 점진 재정렬 세션: 인원 / 시간 후보와 점수 구성요소(선택 태그 / 선호 태그 / 난이도)를 들고 있다가
+# 바뀐 구성요소만 다시 계산해서 순위를 다시 매긴다
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .catalog import GameCatalog
+from .cursor import ArraySource, ResultCursor
+from .scoring import MAX_TAG_SCORE
+
+
+def _tag_set(tags: Optional[Iterable[str]]) -> frozenset:
+    return frozenset(t.strip() for t in (tags or []) if t.strip())
+
+
+class _TagComponent:
+    """
+    후보 게임마다 "태그 목록과 겹치는 개수"를 들고 있는 점수 구성요소.
+    태그가 몇 개만 바뀌면 그 태그 열만 더하고 빼서 겹치는 개수를 고친다.
+    """
+
+    def __init__(self, catalog: GameCatalog, idx: np.ndarray, preferred: bool = False):
+        self.catalog = catalog
+        self.idx = idx
+        self.preferred = preferred  # True면 선호 태그 점수 (0.3배)
+        self.tags: frozenset = frozenset()
+        self.overlap = np.zeros(len(idx), dtype=np.int64)
+        self.score = np.zeros(len(idx), dtype=np.float64)
+
+    def _column(self, tag: str) -> Optional[np.ndarray]:
+        col = self.catalog.tag_index.get(tag)
+        if col is None:
+            return None  # 카탈로그에 없는 태그: 개수에만 들어가고 겹치는 게임은 없다
+        return self.catalog.tag_matrix[self.idx, col]
+
+    def update(self, tags: frozenset) -> bool:
+        """
+        태그 집합을 바꾸고 점수를 다시 만든다. 바뀐 게 없으면 False.
+        """
+        if tags == self.tags:
+            return False
+        added, removed = tags - self.tags, self.tags - tags
+        if len(added) + len(removed) > len(tags):
+            # 많이 바뀌었으면 처음부터 세는 쪽이 싸다
+            overlap, _ = self.catalog._overlap(list(tags), self.idx)
+            self.overlap = overlap.astype(np.int64, copy=True)
+        else:
+            for tag in added:
+                column = self._column(tag)
+                if column is not None:
+                    self.overlap += column
+            for tag in removed:
+                column = self._column(tag)
+                if column is not None:
+                    self.overlap -= column
+        self.tags = tags
+
+        # GameCatalog.score와 같은 식 (결과가 비트 단위로 같도록 연산 순서도 같게)
+        size = len(tags)
+        if not size:
+            self.score = np.zeros(len(self.idx), dtype=np.float64)
+        elif self.preferred:
+            self.score = (MAX_TAG_SCORE * (self.overlap / size)) * 0.3   # 0.3배 반영
+        else:
+            self.score = MAX_TAG_SCORE * (self.overlap / size)
+        return True
+
+
+class RankingSession:
+    """
+    같은 카탈로그에서 조건을 조금씩 바꿔 가며 추천을 다시 받을 때 쓰는 세션 (GUI 태그 탐색용).
+    - 인원 / 시간이 같으면 후보(게임 번호)와 시간 페널티를 재사용
+    - 선택 태그 / 선호 태그는 게임별 겹치는 개수를 들고 있다가, 추가 / 제거된 태그 열만 반영
+    - 난이도 점수는 난이도가 바뀔 때만 다시 계산
+    - 조건이 하나도 안 바뀌면 이전 커서를 그대로 돌려준다 (이미 정렬한 앞부분 재사용)
+    update()의 결과 커서는 recommend_cursor(catalog, ...)와 같은 순위 / 점수.
+    한 세션은 한 스레드(GUI 작업 스레드)에서만 쓴다.
+    """
+
+    def __init__(self, catalog: GameCatalog):
+        self.catalog = catalog
+        self._candidates_key: Optional[tuple] = None
+        self._idx = np.zeros(0, dtype=np.int64)
+        self._penalty = np.zeros(0, dtype=np.float64)
+        self._selected: Optional[_TagComponent] = None
+        self._preferred: Optional[_TagComponent] = None
+        self._difficulty: Optional[int] = None
+        self._diff_score = np.zeros(0, dtype=np.float64)
+        self._cursor: Optional[ResultCursor] = None
+        self._cursor_key: Optional[tuple] = None
+        # 마지막 update()에서 다시 계산한 구성요소 이름 (확인 / 상태 표시용)
+        self.recomputed: Tuple[str, ...] = ()
+
+    @property
+    def total(self) -> int:
+        """
+        지금 후보(인원 / 시간 조건을 통과한 게임) 수
+        """
+        return int(self._idx.size)
+
+    def update(
+        self,
+        players: int,
+        target_time: Optional[int],
+        desired_tags: Optional[List[str]] = None,
+        desired_difficulty: Optional[int] = None,
+        preferred_tags: Optional[List[str]] = None,
+        page_size: int = 5,
+    ) -> ResultCursor:
+        """
+        조건을 바꾸고 결과 커서를 돌려준다. 바뀐 구성요소만 다시 계산한다.
+        """
+        selected, preferred = _tag_set(desired_tags), _tag_set(preferred_tags)
+        key = (players, target_time, selected, preferred, desired_difficulty)
+        if key == self._cursor_key and self._cursor is not None:
+            self.recomputed = ()
+            return self._cursor
+
+        recomputed = []
+        if (players, target_time) != self._candidates_key:
+            self._idx, self._penalty = self.catalog.candidates(players, target_time)
+            self._candidates_key = (players, target_time)
+            self._selected = _TagComponent(self.catalog, self._idx)
+            self._preferred = _TagComponent(self.catalog, self._idx, preferred=True)
+            self._difficulty = None
+            self._diff_score = self.catalog._difficulty_score(None, self._idx)
+            recomputed.append("candidates")
+
+        if self._selected.update(selected):
+            recomputed.append("tags")
+        if self._preferred.update(preferred):
+            recomputed.append("preferred")
+        if desired_difficulty != self._difficulty:
+            self._diff_score = self.catalog._difficulty_score(desired_difficulty, self._idx)
+            self._difficulty = desired_difficulty
+            recomputed.append("difficulty")
+
+        if self._idx.size:
+            scores = (self._selected.score + self._preferred.score + self._diff_score) * self._penalty
+        else:
+            scores = self._penalty
+        self._cursor = ResultCursor(ArraySource(self.catalog, self._idx, scores), page_size)
+        self._cursor_key = key
+        self.recomputed = tuple(recomputed)
+        return self._cursor
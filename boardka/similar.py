@@ -0,0 +1,245 @@
+# boardka/similar.py
+# "이 게임과 비슷한 게임" 검색: 태그 / 난이도 / 시간대 특징의 MinHash 서명 + LSH 인덱스
+
+import zlib
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .models import Game
+
+# MinHash 서명 길이 = LSH 밴드 수 × 밴드당 행 수
+NUM_BANDS = 16
+BAND_ROWS = 4
+
+# 시간대 특징 경계(분): [0,15) [15,30) ... [240, ∞) 중 게임 시간 범위가 걸친 구간마다 특징 하나
+TIME_BUCKETS = (15, 30, 45, 60, 90, 120, 180, 240)
+
+# 게임 수가 이보다 적으면 LSH 후보 대신 전체를 정확히 비교 (그쪽이 더 싸고 놓치는 게임도 없음)
+EXACT_SCAN_GAMES = 2_000
+
+# 서명 계산 시 한 번에 처리할 게임 수 (게임 × 특징 × 해시 배열 크기 제한)
+SIGNATURE_CHUNK = 50_000
+
+_PRIME = (1 << 31) - 1          # 해시 (a·x + b) mod p
+_EMPTY = np.uint64(_PRIME)      # 특징 없는 게임의 서명 값 (어떤 해시보다 큼)
+
+
+def game_features(game: Game) -> frozenset:
+    """
+    유사도 비교에 쓰는 특징 집합.
+    - tag:<태그>
+    - diff:<난이도>, 이웃 난이도와 겹치는 diff:<d>-<d+1> 두 개 (난이도 1 차이도 일부 겹치게)
+    - time:<구간> (최소~최대 플레이타임이 걸친 시간대 구간 전부)
+    """
+    features = {f"tag:{t.strip()}" for t in game.tags if t.strip()}
+
+    d = int(game.difficulty)
+    features.add(f"diff:{d}")
+    features.add(f"diff:{d - 1}-{d}")
+    features.add(f"diff:{d}-{d + 1}")
+
+    low = bisect_right(TIME_BUCKETS, int(game.min_time))
+    high = bisect_right(TIME_BUCKETS, max(int(game.min_time), int(game.max_time)))
+    features.update(f"time:{k}" for k in range(low, high + 1))
+    return frozenset(features)
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _feature_hash(feature: str) -> int:
+    # 실행할 때마다 달라지는 hash() 대신 고정 해시 (같은 데이터면 항상 같은 서명)
+    return zlib.crc32(feature.encode("utf-8")) % _PRIME
+
+
+class SimilarityIndex:
+    """
+    게임 목록의 MinHash 서명과 LSH 밴드 인덱스.
+    - 서명: 특징마다 NUM_BANDS × BAND_ROWS개의 해시 중 최솟값 (두 게임 서명이 같은 비율 ≈ 특징 Jaccard)
+    - LSH: 서명을 밴드로 나눠, 밴드 하나라도 통째로 같은 게임만 후보로 본다 (전체 쌍 비교 없이)
+    - query(): 후보를 실제 특징 Jaccard로 다시 정렬 (유사도 내림차순, 같으면 id 오름차순)
+    """
+
+    def __init__(
+        self,
+        games: Iterable[Game],
+        bands: int = NUM_BANDS,
+        rows: int = BAND_ROWS,
+        seed: int = 1,
+    ):
+        self.games: List[Game] = list(games)
+        self.bands = bands
+        self.rows = rows
+
+        rng = np.random.default_rng(seed)
+        n_hash = bands * rows
+        self._a = rng.integers(1, _PRIME, size=n_hash, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=n_hash, dtype=np.uint64)
+        # 밴드의 행들을 키 하나로 합칠 때 쓰는 곱 (uint64 범위에서 넘침은 그대로 둔다)
+        self._mix = rng.integers(1, 1 << 62, size=rows, dtype=np.uint64) | np.uint64(1)
+
+        self._features = [game_features(g) for g in self.games]
+        self.signatures = self._signatures(self._features)
+        n = len(self.games)
+        self._min_players = np.fromiter((int(g.min_players) for g in self.games), dtype=np.int64, count=n)
+        self._max_players = np.fromiter((int(g.max_players) for g in self.games), dtype=np.int64, count=n)
+
+        # 밴드별로 키를 정렬해 두고 searchsorted로 같은 키 구간을 찾는다
+        self._band_order: List[np.ndarray] = []
+        self._band_keys: List[np.ndarray] = []
+        for band in range(bands):
+            keys = self._band_key(self.signatures, band)
+            order = np.argsort(keys, kind="stable")
+            self._band_order.append(order)
+            self._band_keys.append(keys[order])
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    # ----------------- 서명 -----------------
+
+    def _hash_values(self, hashes: np.ndarray) -> np.ndarray:
+        return (hashes[:, None] * self._a + self._b) % np.uint64(_PRIME)
+
+    def _signatures(self, feature_sets: Sequence[frozenset]) -> np.ndarray:
+        n_hash = self.bands * self.rows
+        out = np.full((len(feature_sets), n_hash), _EMPTY, dtype=np.uint64)
+
+        # 특징 문자열 → 번호 (특징별 해시값 표는 한 번만 계산)
+        ids: dict = {}
+        per_game = [[ids.setdefault(f, len(ids)) for f in fs] for fs in feature_sets]
+        if not ids:
+            return out
+        hashes = np.fromiter((_feature_hash(f) for f in ids), dtype=np.uint64, count=len(ids))
+        table = self._hash_values(hashes)
+
+        for start in range(0, len(per_game), SIGNATURE_CHUNK):
+            chunk = per_game[start: start + SIGNATURE_CHUNK]
+            sizes = np.fromiter((len(f) for f in chunk), dtype=np.int64, count=len(chunk))
+            filled = np.flatnonzero(sizes)
+            if filled.size == 0:
+                continue
+            flat = np.fromiter((i for f in chunk for i in f), dtype=np.int64, count=int(sizes.sum()))
+            offsets = np.concatenate(([0], np.cumsum(sizes[filled])[:-1]))
+            out[start + filled] = np.minimum.reduceat(table[flat], offsets, axis=0)
+        return out
+
+    def _band_key(self, signatures: np.ndarray, band: int) -> np.ndarray:
+        part = signatures[..., band * self.rows: (band + 1) * self.rows]
+        return (part * self._mix).sum(axis=-1, dtype=np.uint64)
+
+    # ----------------- 검색 -----------------
+
+    def candidates(self, game: Game) -> np.ndarray:
+        """
+        LSH 밴드 중 하나라도 같은 게임 번호들 (오름차순, 자기 자신 포함 가능)
+        """
+        signature = self._signatures([game_features(game)])[0]
+        found = []
+        for band in range(self.bands):
+            key = self._band_key(signature, band)
+            keys = self._band_keys[band]
+            lo = np.searchsorted(keys, key, side="left")
+            hi = np.searchsorted(keys, key, side="right")
+            if hi > lo:
+                found.append(self._band_order[band][lo:hi])
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
+
+    def query(
+        self,
+        game: Game,
+        top_k: int = 5,
+        players: Optional[int] = None,
+        fallback: bool = True,
+    ) -> List[Tuple[Game, float]]:
+        """
+        game과 비슷한 게임 상위 top_k개의 (게임, 특징 Jaccard 유사도).
+        - game 자신(같은 id)은 빼고, players를 주면 그 인원을 지원하는 게임만
+        - 게임이 EXACT_SCAN_GAMES개 미만이면 LSH 없이 전체를 비교
+        - LSH 후보만으로 top_k개가 안 되면(fallback) 서명 일치율로 전체에서 후보를 더 뽑는다
+        """
+        if top_k <= 0 or not self.games:
+            return []
+
+        features = game_features(game)
+        exact = len(self.games) < EXACT_SCAN_GAMES
+        if exact:
+            picked = self._filter(np.arange(len(self.games)), game, players)
+        else:
+            picked = self._filter(self.candidates(game), game, players)
+
+        # 전체를 비교했으면 더 보충할 후보가 없다
+        if fallback and not exact and len(picked) < top_k:
+            # 전체 게임의 서명 일치율(유사도 추정치) 상위에서 후보를 보충 (드문 경우만, 배열 연산 한 번)
+            signature = self._signatures([features])[0]
+            estimate = (self.signatures == signature).mean(axis=1)
+            estimate[picked] = -1.0
+            order = np.argsort(-estimate, kind="stable")
+            order = order[estimate[order] >= 0]  # 이미 뽑은 게임은 다시 넣지 않는다
+            more = self._filter(order, game, players)
+            picked = np.concatenate([picked, more[: top_k * 4]])
+
+        scored = [(self.games[i], jaccard(features, self._features[i])) for i in picked.tolist()]
+        scored.sort(key=lambda item: (-item[1], item[0].id))
+        return scored[:top_k]
+
+    def _filter(self, idx: np.ndarray, game: Game, players: Optional[int]) -> np.ndarray:
+        """
+        인원 조건을 통과하고 game 자신(같은 id)이 아닌 게임 번호만 남긴다.
+        """
+        if players is not None:
+            idx = idx[(self._min_players[idx] <= players) & (players <= self._max_players[idx])]
+        keep = [i for i in idx.tolist() if self.games[i].id != game.id]
+        return np.asarray(keep, dtype=np.int64)
+
+
+def find_game(games: Iterable[Game], key: Union[str, int]) -> Game:
+    """
+    id 또는 이름으로 게임 하나를 찾는다.
+    - id가 같은 게임 → 이름이 정확히 같은 게임 → (공백 / 대소문자 무시) 이름에 key가 들어간 게임이 하나뿐일 때
+    못 찾거나 여러 개면 ValueError.
+    """
+    text = str(key).strip()
+    games = list(games)
+
+    for g in games:
+        if str(g.id) == text:
+            return g
+    for g in games:
+        if g.name_ko.strip() == text:
+            return g
+
+    folded = text.replace(" ", "").lower()
+    matches = [g for g in games if folded and folded in g.name_ko.replace(" ", "").lower()]
+    if len(matches) == 1:
+        return matches[0]
+    if not matches:
+        raise ValueError(f"'{text}'에 해당하는 게임을 찾을 수 없습니다.")
+    names = ", ".join(g.name_ko for g in matches[:10])
+    raise ValueError(f"'{text}'에 해당하는 게임이 여러 개입니다: {names}")
+
+
+def similar_games(
+    games,
+    like: Union[Game, str, int],
+    top_k: int = 5,
+    players: Optional[int] = None,
+    index: Optional[SimilarityIndex] = None,
+) -> List[Tuple[Game, float]]:
+    """
+    like(게임, 이름 또는 id)와 비슷한 게임 상위 top_k개.
+    games가 GameCatalog면 카탈로그에 붙은 인덱스를 재사용하고, 아니면 index를 주거나 새로 만든다.
+    """
+    if index is None:
+        similarity_index = getattr(games, "similarity_index", None)
+        index = similarity_index() if similarity_index is not None else SimilarityIndex(games)
+    if not isinstance(like, Game):
+        like = find_game(index.games, like)
+    return index.query(like, top_k=top_k, players=players)
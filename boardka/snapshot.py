@@ -0,0 +1,149 @@
+# boardka/snapshot.py
+# 엑셀 / CSV에서 정리된 Game 목록을 바이너리 스냅샷으로 저장/복원
+
+import hashlib
+import os
+import pickle
+from typing import Callable, List, Optional, Tuple
+
+from .metrics import Metrics, stage
+from .models import Game
+
+SNAPSHOT_VERSION = 5
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+def default_snapshot_path(source_path: str) -> str:
+    """
+    원본 파일 옆에 두는 기본 스냅샷 경로 (예: data/GameList.xlsx.snapshot)
+    """
+    return source_path + SNAPSHOT_SUFFIX
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def source_key(path: str, digest: Optional[str] = None) -> Tuple[int, int, str]:
+    """
+    원본 파일의 (크기, 수정시각, 내용 해시) 키
+    """
+    st = os.stat(path)
+    if digest is None:
+        digest = _file_digest(path)
+    return st.st_size, st.st_mtime_ns, digest
+
+
+def _game_to_row(g: Game) -> tuple:
+    return (g.id, g.name_ko, g.min_players, g.max_players,
+            g.min_time, g.max_time, g.difficulty, tuple(g.tags), g.rating)
+
+
+def _row_to_game(row: tuple) -> Game:
+    gid, name_ko, min_p, max_p, min_t, max_t, diff, tags, rating = row
+    # 로더가 태그 문자열을 intern해 두므로 pickle memo 덕분에 같은 태그는 복원 후에도 한 객체를 공유
+    return Game(
+        id=gid,
+        name_ko=name_ko,
+        min_players=min_p,
+        max_players=max_p,
+        min_time=min_t,
+        max_time=max_t,
+        difficulty=diff,
+        tags=list(tags),
+        rating=rating,
+    )
+
+
+def read_snapshot(snapshot_path: str, source_path: str) -> Optional[List[Game]]:
+    """
+    스냅샷이 원본 파일과 일치하면 Game 목록을, 아니면 None을 반환.
+    - 크기가 다르면 바로 무효
+    - 수정시각이 같으면 유효, 다르면 내용 해시로 다시 확인
+    """
+    if not os.path.exists(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, "rb") as f:
+            header = pickle.load(f)
+            if header.get("version") != SNAPSHOT_VERSION:
+                return None
+
+            size, mtime_ns, digest = header["key"]
+            st = os.stat(source_path)
+            if st.st_size != size:
+                return None
+            if st.st_mtime_ns != mtime_ns and _file_digest(source_path) != digest:
+                return None
+
+            rows = pickle.load(f)
+    except Exception:
+        # 망가진 스냅샷이면 그냥 무시하고 다시 만든다
+        return None
+
+    return [_row_to_game(r) for r in rows]
+
+
+def write_snapshot(snapshot_path: str, key: Tuple[int, int, str], games: List[Game]) -> bool:
+    """
+    Game 목록을 스냅샷으로 저장. key는 파싱 직전에 구한 source_key 값.
+    임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 안전.
+    저장에 실패하면 False (읽기 전용 폴더 등).
+    """
+    header = {"version": SNAPSHOT_VERSION, "key": key}
+    tmp_path = snapshot_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump([_game_to_row(g) for g in games], f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load_cached(
+    path: str,
+    parse: Callable[[str, Optional[Metrics]], List[Game]],
+    cache_path: Optional[str] = None,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    metrics: Optional[Metrics] = None,
+) -> List[Game]:
+    """
+    parse(path, metrics)로 읽는 원본 파일 앞에 스냅샷을 둔다.
+    - 원본과 일치하는 스냅샷(기본: 원본 옆 *.snapshot)이 있으면 파싱 없이 그대로 사용
+    - 없거나 원본이 바뀌었으면 다시 파싱하고 스냅샷을 새로 저장
+    - cache_path: 스냅샷 위치 지정, rebuild_cache: 스냅샷 무시하고 강제 재생성
+    """
+    if not use_cache:
+        return parse(path, metrics)
+
+    if cache_path is None:
+        cache_path = default_snapshot_path(path)
+
+    if not rebuild_cache:
+        with stage(metrics, "snapshot_read"):
+            cached = read_snapshot(cache_path, path)
+        if cached is not None:
+            if metrics is not None:
+                metrics.count("snapshot_hit")
+                metrics.count("loaded", len(cached))
+            return cached
+
+    # 파싱 도중 파일이 바뀌어도 어긋나지 않게 키를 먼저 구해 둔다
+    with stage(metrics, "source_key"):
+        key = source_key(path)
+    games = parse(path, metrics)
+    with stage(metrics, "snapshot_write"):
+        write_snapshot(cache_path, key, games)
+    return games
@@ -0,0 +1,85 @@
+# boardka/tags.py
+# 태그 사전: 태그 문자열을 정수 번호로 바꾸고 게임 태그를 비트마스크로 만든다
+
+from typing import Iterable, List
+
+from .models import Game
+
+
+class TagVocabulary:
+    """
+    로딩 시점에 한 번 만드는 태그 사전.
+    각 태그에 번호를 매기고, 게임 태그를 그 번호의 비트마스크로 만들어 준다.
+    비트 번호는 사전마다 다르므로 마스크는 Game에 적지 않고 사전을 가진 쪽(GameCatalog의
+    태그 행렬)이 들고 있는다. 태그별 게임 수도 같이 세어 둔다.
+    """
+
+    def __init__(self, games: Iterable[Game] = ()):
+        self.ids: dict[str, int] = {}
+        self.names: List[str] = []
+        self.counts: List[int] = []
+        for g in games:
+            self.add_game(g)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self.ids
+
+    def intern(self, tag: str) -> int:
+        tag_id = self.ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self.names)
+            self.ids[tag] = tag_id
+            self.names.append(tag)
+            self.counts.append(0)
+        return tag_id
+
+    def add_game(self, game: Game) -> int:
+        """
+        게임 태그를 사전에 등록(태그별 게임 수 +1)하고 태그 비트마스크를 반환.
+        """
+        mask = 0
+        for t in {t.strip() for t in (game.tags or []) if t.strip()}:
+            tag_id = self.intern(t)
+            self.counts[tag_id] += 1
+            mask |= 1 << tag_id
+        return mask
+
+    def mask_of(self, game: Game) -> int:
+        """
+        게임 태그의 비트마스크 (사전에 없는 태그는 빠진다). 사전은 바꾸지 않는다.
+        """
+        mask = 0
+        for t in {t.strip() for t in (game.tags or []) if t.strip()}:
+            tag_id = self.ids.get(t)
+            if tag_id is not None:
+                mask |= 1 << tag_id
+        return mask
+
+    def remove_game(self, game: Game) -> None:
+        """
+        게임이 빠질 때 태그별 게임 수를 줄인다 (태그 번호는 그대로 유지).
+        """
+        mask = self.mask_of(game)
+        while mask:
+            low = mask & -mask
+            self.counts[low.bit_length() - 1] -= 1
+            mask ^= low
+
+    def copy(self) -> "TagVocabulary":
+        """
+        같은 번호 체계를 가진 사본 (사본에 게임을 넣고 빼도 원본은 그대로).
+        """
+        vocab = TagVocabulary()
+        vocab.ids = dict(self.ids)
+        vocab.names = list(self.names)
+        vocab.counts = list(self.counts)
+        return vocab
+
+    def tag_counts(self) -> dict[str, int]:
+        """
+        태그별 게임 수 (태그 → 개수)
+        """
+        return {t: c for t, c in zip(self.names, self.counts) if c}
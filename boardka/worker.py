@@ -0,0 +1,106 @@
+# boardka/worker.py
+# GUI용 백그라운드 작업 스레드 (마지막 요청만 실행 / 결과는 메인 스레드에서 poll()로 전달)
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+
+class BackgroundWorker:
+    """
+    오래 걸리는 작업(카탈로그 로딩, 추천 계산)을 스레드 하나에서 차례로 실행한다.
+    - 아직 시작하지 않은 작업은 새 작업이 들어오면 버린다 (연속 클릭은 마지막 것만 계산)
+    - 실행 중에 새 작업이 들어오거나 cancel()하면, 끝난 결과를 버린다 (화면에는 최신 요청 결과만)
+    - 완료 / 오류 콜백은 작업 스레드가 아니라 poll()을 부른 스레드(Tk 메인 스레드)에서 실행된다
+      (Tk 위젯은 메인 스레드에서만 건드려야 하므로 root.after로 poll()을 주기적으로 부른다)
+    """
+
+    def __init__(self, name: str = "boardka-worker"):
+        self.name = name
+        self._cond = threading.Condition()
+        self._generation = 0          # 가장 최근 요청 번호
+        self._pending: Optional[tuple] = None
+        self._running = False
+        self._stopped = False
+        self._done: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def busy(self) -> bool:
+        """
+        실행 중이거나 기다리는 작업이 있으면 True
+        """
+        with self._cond:
+            return self._running or self._pending is not None
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> int:
+        """
+        fn()을 작업 스레드에서 실행하고, 결과를 on_done(result)로 넘긴다 (예외면 on_error(exc)).
+        앞서 넣은 작업은 취소된다. 요청 번호를 반환.
+        """
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("이미 종료된 작업 스레드입니다.")
+            self._generation += 1
+            self._pending = (self._generation, fn, on_done, on_error)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+            return self._generation
+
+    def cancel(self) -> None:
+        """
+        기다리는 작업은 버리고, 실행 중인 작업의 결과도 전달하지 않는다.
+        """
+        with self._cond:
+            self._generation += 1
+            self._pending = None
+
+    def stop(self) -> None:
+        self.cancel()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                generation, fn, on_done, on_error = self._pending
+                self._pending = None
+                self._running = True
+
+            try:
+                result = fn()
+            except Exception as e:  # 오류도 메인 스레드로 넘겨서 보여준다
+                self._done.put((generation, on_error, e))
+            else:
+                self._done.put((generation, on_done, result))
+            finally:
+                with self._cond:
+                    self._running = False
+
+    def poll(self) -> int:
+        """
+        끝난 작업 중 아직 최신인 것의 콜백을 실행 (메인 스레드에서 호출). 실행한 콜백 수를 반환.
+        """
+        handled = 0
+        while True:
+            try:
+                generation, callback, value = self._done.get_nowait()
+            except queue.Empty:
+                return handled
+            # 결과를 꺼내는 사이에 새 요청이 들어왔을 수도 있으므로 여기서 한 번 더 확인
+            if generation != self._generation or callback is None:
+                continue
+            callback(value)
+            handled += 1
@@ -3,14 +3,18 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
-import os
+import queue
 
-from boardka.loader_excel import load_games_from_excel
-from boardka.recommender import recommend_games
+from boardka.prefs import PreferenceStore
+from boardka.reload import LiveCatalog
+from boardka.session import RankingSession
+from boardka.worker import BackgroundWorker
 
 DATA_PATH = "data/GameList.xlsx"
-PREF_PATH = "data/user_prefs.json"  # 선호 태그 저장용
+PREF_PATH = "data/user_prefs.json"  # 선호 태그 저장용 (변경 로그는 user_prefs.json.log)
+RELOAD_INTERVAL = 2.0  # 엑셀 변경 확인 주기(초)
+PAGE_SIZE = 5  # 한 번에 보여줄 추천 개수 ("더 보기"마다 이만큼 추가)
+WORKER_POLL_MS = 50  # 백그라운드 작업 결과 확인 주기(ms)
 
 
 class BoardGameRecommenderGUI:
@@ -18,25 +22,26 @@ class BoardGameRecommenderGUI:
         self.root = root
         self.root.title("보드카 보드게임 추천기 (GUI)")
 
-        # 게임 데이터 로드
-        try:
-            self.games = load_games_from_excel(DATA_PATH)
-        except FileNotFoundError:
-            messagebox.showerror(
-                "오류",
-                f"데이터 파일을 찾을 수 없습니다:\n{DATA_PATH}\n"
-                "data 폴더 안에 GameList.xlsx가 있는지 확인해주세요.",
-            )
-            self.root.destroy()
-            return
+        # 유저 선호 태그 로드 (더블클릭마다 파일 전체를 다시 쓰지 않고 로그에 모아서 기록)
+        self.prefs = PreferenceStore(PREF_PATH)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self._closed = False  # on_close 이후에는 주기 작업(after)을 다시 걸지 않는다
 
-        # 유저 선호 태그 로드
-        self.user_prefs: dict[str, int] = self._load_user_prefs()
+        # 게임 데이터는 창을 먼저 띄운 뒤 백그라운드에서 로드 (_on_catalog_loaded에서 채움)
+        self.live = None
+        self.games = None
+        self.vocab = None
+        self.session = None  # 점진 재정렬 세션 (카탈로그가 바뀌면 새로 만든다)
+        self.tag_counts: dict[str, int] = {}
+
+        # 오래 걸리는 작업은 작업 스레드에서 실행하고, 결과는 Tk 메인 스레드에서 받는다
+        # (추천은 연속 클릭 시 마지막 요청만 계산 / 표시)
+        self.loader = BackgroundWorker("boardka-loader")
+        self.worker = BackgroundWorker("boardka-recommend")
 
-        # 태그별 게임 개수 계산
-        self.tag_counts = self._build_tag_counts(self.games)
         self.tag_vars: dict[str, tk.BooleanVar] = {}
-        self.last_results: list[tuple] = []  # (game, score) 목록
+        self.last_results: list[tuple] = []  # (game, score) 목록 (지금까지 보여준 순서대로)
+        self.result_cursor = None  # 마지막 추천의 결과 커서 ("더 보기"용)
 
         # --- 메인 프레임 설정 ---
         main_frame = ttk.Frame(self.root, padding=10)
@@ -61,38 +66,14 @@ class BoardGameRecommenderGUI:
             row=1, column=2, sticky="w", pady=2
         )
 
-        # 태그 선택 영역 (체크박스)
-        tags_frame = ttk.LabelFrame(main_frame, text="선호 태그 선택", padding=8)
-        tags_frame.grid(row=2, column=0, columnspan=3, sticky="we", pady=(8, 4))
-        tags_frame.columnconfigure(0, weight=1)
-        tags_frame.columnconfigure(1, weight=1)
-        tags_frame.columnconfigure(2, weight=1)
-
-        # 태그 체크박스 생성 (게임 개수 포함)
-        # 1) 태그 빈도 필터링: 게임이 3개 이하인 태그는 숨김
-        filtered_tags = {tag: count for tag, count in self.tag_counts.items() if count > 3}
-
-        # 2) 정렬: 게임 개수 많은 순 → 이름순
-        sorted_tags = sorted(
-            filtered_tags.items(),
-            key=lambda item: (-item[1], item[0])
-        )
-
-        for idx, (tag, count) in enumerate(sorted_tags):
-            var = tk.BooleanVar(value=False)
-            self.tag_vars[tag] = var
-            text = f"{tag} ({count})"
-            cb = ttk.Checkbutton(tags_frame, text=text, variable=var)
-            # 3열 그리드 배치
-            row = idx // 3
-            col = idx % 3
-            cb.grid(row=row, column=col, sticky="w", padx=2, pady=2)
-
-        if not sorted_tags:
-            ttk.Label(tags_frame, text="등록된 태그가 없습니다.").grid(
-                row=0, column=0, sticky="w"
-            )
-
+        # 태그 선택 영역 (체크박스는 게임 목록을 불러온 뒤 만든다)
+        self.tags_frame = ttk.LabelFrame(main_frame, text="선호 태그 선택", padding=8)
+        self.tags_frame.grid(row=2, column=0, columnspan=3, sticky="we", pady=(8, 4))
+        self.tags_frame.columnconfigure(0, weight=1)
+        self.tags_frame.columnconfigure(1, weight=1)
+        self.tags_frame.columnconfigure(2, weight=1)
+        self.tags_loading_label = ttk.Label(self.tags_frame, text="게임 목록을 불러오는 중...")
+        self.tags_loading_label.grid(row=0, column=0, sticky="w")
         # 난이도
         ttk.Label(main_frame, text="원하는 난이도").grid(row=3, column=0, sticky="w", pady=2)
         self.difficulty_var = tk.StringVar()
@@ -125,10 +106,16 @@ class BoardGameRecommenderGUI:
 
         # 추천 버튼
         self.recommend_button = ttk.Button(
-            main_frame, text="추천 받기", command=self.on_recommend
+            main_frame, text="추천 받기", command=self.on_recommend, state="disabled"
         )
         self.recommend_button.grid(row=4, column=0, columnspan=3, sticky="we", pady=10)
 
+        # 더 보기 버튼 (다음 순위 PAGE_SIZE개를 이어서 표시)
+        self.more_button = ttk.Button(
+            main_frame, text="더 보기", command=self.on_more, state="disabled"
+        )
+        self.more_button.grid(row=4, column=3, sticky="we", padx=10, pady=10)
+
         # 결과 영역
         result_frame = ttk.LabelFrame(main_frame, text="추천 결과", padding=8)
         result_frame.grid(row=5, column=0, columnspan=3, sticky="nsew", pady=(5, 0))
@@ -167,7 +154,65 @@ class BoardGameRecommenderGUI:
         )
         self.reset_pref_button.grid(row=1, column=1, sticky="e", padx=5, pady=(5, 0))
 
-        # 초기 안내 메시지
+        # 초기 안내 메시지 (로딩이 끝나면 바뀜)
+        self.result_text.insert("1.0", "게임 목록을 불러오는 중입니다. 잠시만 기다려주세요...\n")
+        self.result_text.configure(state="disabled")
+
+        # 선호 태그 Top5 표시 갱신
+        self._update_pref_summary()
+
+        # 상태 표시줄 (로딩 / 추천 계산 / 데이터 갱신 안내) + 진행 표시
+        self.status_label = ttk.Label(main_frame, text="", foreground="#666666")
+        self.status_label.grid(row=7, column=0, columnspan=3, sticky="w", pady=(5, 0))
+        self.progress = ttk.Progressbar(main_frame, mode="indeterminate", length=120)
+        self.progress.grid(row=7, column=3, sticky="e", padx=10, pady=(5, 0))
+        self.progress.grid_remove()
+
+        # 게임 데이터 로드 (파일이 바뀌면 바뀐 게임만 다시 반영)
+        self._reload_queue: queue.Queue = queue.Queue()
+        self._set_busy("게임 목록을 불러오는 중...")
+        self.loader.submit(
+            lambda: LiveCatalog(DATA_PATH, interval=RELOAD_INTERVAL),
+            self._on_catalog_loaded,
+            self._on_load_error,
+        )
+        self.root.after(WORKER_POLL_MS, self._poll_workers)
+
+    # ----------------- 백그라운드 작업 -----------------
+
+    def _poll_workers(self) -> None:
+        """
+        작업 스레드에서 끝난 결과를 메인 스레드에서 화면에 반영.
+        """
+        self.loader.poll()
+        self.worker.poll()
+        # 결과 처리 중 창이 닫혔으면(로딩 실패 등) 더 걸지 않는다
+        if not self._closed:
+            self.root.after(WORKER_POLL_MS, self._poll_workers)
+
+    def _set_busy(self, message: str) -> None:
+        self.status_label.config(text=message)
+        self.progress.grid()
+        self.progress.start(15)
+
+    def _set_idle(self, message: str = "") -> None:
+        self.progress.stop()
+        self.progress.grid_remove()
+        self.status_label.config(text=message)
+
+    def _on_catalog_loaded(self, live: LiveCatalog) -> None:
+        # 카탈로그 + 태그 사전 (태그 번호 + 태그별 게임 수, 게임별 태그는 카탈로그의 태그 행렬)
+        self.live = live
+        self.games = live.catalog
+        self.vocab = self.games.vocab
+        self.session = RankingSession(self.games)
+
+        # 태그별 게임 개수 계산
+        self.tag_counts = self._build_tag_counts()
+        self._build_tag_checkboxes()
+
+        self.result_text.configure(state="normal")
+        self.result_text.delete("1.0", "end")
         self.result_text.insert(
             "1.0",
             f"총 {len(self.games)}개의 게임을 불러왔습니다.\n"
@@ -176,56 +221,84 @@ class BoardGameRecommenderGUI:
             "그 게임의 태그가 나의 선호 태그로 조금씩 반영됩니다.",
         )
         self.result_text.configure(state="disabled")
+        self.recommend_button.configure(state="normal")
+        self._set_idle()
 
-        # 선호 태그 Top5 표시 갱신
-        self._update_pref_summary()
+        # 엑셀 변경 감시: 감시 스레드는 큐에 넣기만 하고, 실제 교체는 Tk 메인 스레드에서
+        self.live.listeners.append(lambda catalog, diff: self._reload_queue.put((catalog, diff)))
+        self.live.start()
+        self.root.after(500, self._poll_reload)
+
+    def _on_load_error(self, error: BaseException) -> None:
+        if isinstance(error, FileNotFoundError):
+            messagebox.showerror(
+                "오류",
+                f"데이터 파일을 찾을 수 없습니다:\n{DATA_PATH}\n"
+                "data 폴더 안에 GameList.xlsx가 있는지 확인해주세요.",
+            )
+        else:
+            messagebox.showerror("오류", f"게임 목록을 불러오지 못했습니다:\n{error}")
+        self.on_close()
 
     # ----------------- 내부 헬퍼 메서드들 -----------------
 
-    def _load_user_prefs(self) -> dict[str, int]:
+    def _build_tag_checkboxes(self) -> None:
         """
-        이전에 클릭해서 쌓아둔 선호 태그 정보를 JSON에서 읽어온다.
-        없으면 빈 dict 반환.
+        태그 체크박스 생성 (게임 개수 포함)
         """
-        if not os.path.exists(PREF_PATH):
-            return {}
-        try:
-            with open(PREF_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # 값이 숫자가 아닐 수 있으니 안전하게 정수로 캐스팅
-            prefs: dict[str, int] = {}
-            for k, v in data.items():
-                try:
-                    prefs[str(k)] = int(v)
-                except (TypeError, ValueError):
-                    continue
-            return prefs
-        except Exception:
-            # 망가진 파일이면 그냥 무시하고 새로 시작
-            return {}
-
-    def _save_user_prefs(self) -> None:
+        self.tags_loading_label.destroy()
+        tags_frame = self.tags_frame
+
+        # 1) 태그 빈도 필터링: 게임이 3개 이하인 태그는 숨김
+        filtered_tags = {tag: count for tag, count in self.tag_counts.items() if count > 3}
+
+        # 2) 정렬: 게임 개수 많은 순 → 이름순
+        sorted_tags = sorted(
+            filtered_tags.items(),
+            key=lambda item: (-item[1], item[0])
+        )
+
+        for idx, (tag, count) in enumerate(sorted_tags):
+            var = tk.BooleanVar(value=False)
+            self.tag_vars[tag] = var
+            text = f"{tag} ({count})"
+            cb = ttk.Checkbutton(tags_frame, text=text, variable=var)
+            # 3열 그리드 배치
+            row = idx // 3
+            col = idx % 3
+            cb.grid(row=row, column=col, sticky="w", padx=2, pady=2)
+
+        if not sorted_tags:
+            ttk.Label(tags_frame, text="등록된 태그가 없습니다.").grid(
+                row=0, column=0, sticky="w"
+            )
+
+
+    def _poll_reload(self) -> None:
         """
-        현재까지 쌓인 선호 태그 정보를 JSON 파일로 저장.
+        새 카탈로그가 들어왔으면 참조를 교체하고 상태 표시줄에 알린다.
+        (새로 생긴 태그의 체크박스는 다시 실행할 때 나타난다)
         """
-        os.makedirs(os.path.dirname(PREF_PATH), exist_ok=True)
-        with open(PREF_PATH, "w", encoding="utf-8") as f:
-            json.dump(self.user_prefs, f, ensure_ascii=False, indent=2)
+        try:
+            while True:
+                catalog, diff = self._reload_queue.get_nowait()
+                self.games = catalog
+                self.vocab = catalog.vocab
+                self.session = RankingSession(catalog)
+                self.tag_counts = self._build_tag_counts()
+                self.status_label.config(
+                    text=f"게임 목록이 갱신되었습니다: {diff} (총 {len(self.games)}개)"
+                )
+        except queue.Empty:
+            pass
+        self.root.after(500, self._poll_reload)
 
-    def _build_tag_counts(self, games) -> dict[str, int]:
+    def _build_tag_counts(self) -> dict[str, int]:
         """
-        게임 목록에서 태그별로 몇 개의 게임이 있는지 세어 반환.
+        태그별로 몇 개의 게임이 있는지 반환.
+        (로딩 때 만든 태그 사전의 개수를 그대로 사용)
         """
-        counts: dict[str, int] = {}
-        for g in games:
-            if not getattr(g, "tags", None):
-                continue
-            for t in g.tags:
-                tag = t.strip()
-                if not tag:
-                    continue
-                counts[tag] = counts.get(tag, 0) + 1
-        return counts
+        return self.vocab.tag_counts()
 
     def _get_selected_tags(self) -> list[str]:
         """
@@ -241,11 +314,10 @@ class BoardGameRecommenderGUI:
         """
         선호 태그 상위 5개를 라벨에 표시.
         """
-        if not self.user_prefs:
+        top5 = self.prefs.top(5)
+        if not top5:
             text = "선호 태그 상위 5개: (없음)"
         else:
-            pref_sorted = sorted(self.user_prefs.items(), key=lambda x: -x[1])
-            top5 = [t for t, _ in pref_sorted[:5]]
             text = "선호 태그 상위 5개: " + ", ".join(top5)
         self.pref_info_label.config(text=text)
 
@@ -273,23 +345,20 @@ class BoardGameRecommenderGUI:
             messagebox.showinfo("선호 반영", f"'{game.name_ko}'에는 태그가 없어 저장할 정보가 없습니다.")
             return
 
-        for tag in game.tags:
-            self.user_prefs[tag] = self.user_prefs.get(tag, 0) + 1
-
-        self._save_user_prefs()
+        self.prefs.add_tags(game.tags)
         self._update_pref_summary()
 
         messagebox.showinfo(
             "선호 반영",
             f"'{game.name_ko}'의 태그가 선호 태그로 조금 더 반영되었습니다.\n"
-            f"(현재 선호 태그 예: {', '.join(list(self.user_prefs.keys())[:5])})"
+            f"(현재 선호 태그 예: {', '.join(self.prefs.top(5))})"
         )
 
     def on_reset_prefs(self):
         """
         선호 태그 전체 초기화.
         """
-        if not self.user_prefs:
+        if not self.prefs:
             messagebox.showinfo("초기화", "현재 저장된 선호 태그가 없습니다.")
             return
 
@@ -300,12 +369,28 @@ class BoardGameRecommenderGUI:
         if not ans:
             return
 
-        self.user_prefs.clear()
-        self._save_user_prefs()
+        self.prefs.reset()
         self._update_pref_summary()
         messagebox.showinfo("초기화 완료", "선호 태그가 모두 초기화되었습니다.")
 
+    def on_close(self):
+        """
+        창을 닫을 때 모아 둔 선호 태그 변경을 기록하고 감시 스레드를 멈춘다.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.loader.stop()
+        self.worker.stop()
+        self.prefs.close()
+        if self.live is not None:
+            self.live.stop()
+        self.root.destroy()
+
     def on_recommend(self):
+        if self.games is None:
+            return  # 아직 로딩 중
+
         # 플레이어 수
         players_str = self.players_var.get().strip()
         if not players_str:
@@ -337,9 +422,8 @@ class BoardGameRecommenderGUI:
         # 선택 태그
         selected_tags = self._get_selected_tags()
 
-        # 선호 태그 상위 5개 계산
-        pref_sorted = sorted(self.user_prefs.items(), key=lambda x: -x[1])
-        preferred_tags = [t for t, _ in pref_sorted[:5]]
+        # 선호 태그 상위 5개 (저장소가 상위 n개만 골라 캐시해 둔다)
+        preferred_tags = self.prefs.top(5)
 
         # 선호태그 반영 안 함 체크 시 preferred 제거
         if self.use_pref_var.get() is False:
@@ -356,45 +440,108 @@ class BoardGameRecommenderGUI:
                 messagebox.showwarning("입력 오류", "난이도는 1~5 중 하나여야 합니다.")
                 return
 
-        # 추천 호출 (5개 고정)
-        results = recommend_games(
-            self.games,
-            players=players,
-            target_time=target_time,
-            desired_tags=selected_tags,       # 선택 태그
-            preferred_tags=preferred_tags,    # 선호 태그
-            desired_difficulty=desired_difficulty,
-            top_k=5,
-        )
+        # 추천 호출: 세션이 바뀐 조건(태그 / 선호 태그 / 난이도)의 점수만 다시 계산해 첫 페이지만 정렬
+        # (인원 / 시간이 같으면 후보를 재사용하고, 조건이 같으면 커서를 그대로 재사용)
+        # 계산은 작업 스레드에서 하고, 그 사이 다시 누르면 이전 요청은 버린다
+        session = self.session
+        pref_ignored = bool(self.prefs) and self.use_pref_var.get() is False
+
+        def job():
+            cursor = session.update(
+                players=players,
+                target_time=target_time,
+                desired_tags=selected_tags,       # 선택 태그
+                preferred_tags=preferred_tags,    # 선호 태그
+                desired_difficulty=desired_difficulty,
+                page_size=PAGE_SIZE,
+            )
+            return cursor, cursor.fetch(0, PAGE_SIZE)
+
+        def done(out):
+            cursor, results = out
+            self._show_results(players, target_time, selected_tags, preferred_tags, pref_ignored, cursor, results)
+
+        self.more_button.configure(state="disabled")
+        self._set_busy("추천 계산 중...")
+        self.worker.submit(job, done, self._on_recommend_error)
+
+    def _on_recommend_error(self, error: BaseException) -> None:
+        self._set_idle()
+        messagebox.showerror("오류", f"추천 계산 중 오류가 발생했습니다:\n{error}")
+
+    def _show_results(
+        self,
+        players: int,
+        target_time,
+        selected_tags: list[str],
+        preferred_tags: list[str],
+        pref_ignored: bool,
+        cursor,
+        results: list[tuple],
+    ) -> None:
+        self._set_idle()
+        self.result_cursor = cursor
 
         # 결과 출력
         self.result_text.configure(state="normal")
         self.result_text.delete("1.0", "end")
 
         if target_time is None:
-            header = f"인원 {players}명 기준 추천 결과 (최대 5개)\n\n"
+            header = f"인원 {players}명 기준 추천 결과 (조건에 맞는 게임 {cursor.total}개)\n\n"
         else:
-            header = f"인원 {players}명, 목표 시간 {target_time}분 기준 추천 결과 (최대 5개)\n\n"
+            header = f"인원 {players}명, 목표 시간 {target_time}분 기준 추천 결과 (조건에 맞는 게임 {cursor.total}개)\n\n"
 
         if selected_tags:
             header += "선택 태그: " + ", ".join(selected_tags) + "\n"
         if preferred_tags:
             header += "선호 태그: " + ", ".join(preferred_tags) + "\n"
-        elif self.user_prefs and self.use_pref_var.get() is False:
+        elif pref_ignored:
             header += "선호 태그: 반영 안 함\n"
 
         header += "\n"
         self.result_text.insert("1.0", header)
 
+        # 리스트박스는 추천 결과 제목만 따로 보여주기 (클릭용)
+        self.last_results = []
+        self.like_listbox.delete(0, "end")
+
         if not results:
             self.result_text.insert("end", "조건에 맞는 게임이 없습니다.\n")
             self.result_text.configure(state="disabled")
-            # 추천 결과가 없으면 리스트박스도 비움
-            self.like_listbox.delete(0, "end")
-            self.last_results = []
+            self.more_button.configure(state="disabled")
             return
 
-        for rank, (game, score) in enumerate(results, start=1):
+        self._append_results(results)
+
+    def on_more(self):
+        """
+        같은 조건의 다음 순위 PAGE_SIZE개를 이어서 보여준다 (점수는 다시 계산하지 않음).
+        """
+        cursor = self.result_cursor
+        if cursor is None:
+            return
+        offset = len(self.last_results)
+
+        def done(results):
+            if cursor is not self.result_cursor:
+                return
+            self._set_idle()
+            if not results:
+                self.more_button.configure(state="disabled")
+                return
+            self.result_text.configure(state="normal")
+            self._append_results(results)
+            self.result_text.see("end")
+
+        self._set_busy("다음 순위 계산 중...")
+        self.worker.submit(lambda: cursor.fetch(offset, PAGE_SIZE), done, self._on_recommend_error)
+
+    def _append_results(self, results: list[tuple]) -> None:
+        """
+        결과 텍스트 / 리스트박스 끝에 결과를 덧붙이고 "더 보기" 버튼 상태를 맞춘다.
+        """
+        start = len(self.last_results) + 1
+        for rank, (game, score) in enumerate(results, start=start):
             tags_str = ", ".join(game.tags) if game.tags else "(태그 없음)"
             self.result_text.insert(
                 "end",
@@ -405,15 +552,15 @@ class BoardGameRecommenderGUI:
                 f"    태그: {tags_str}\n"
                 f"    점수: {score:.3f}\n\n",
             )
-
         self.result_text.configure(state="disabled")
 
-        # 리스트박스에 추천 결과 제목만 따로 보여주기 (클릭용)
-        self.last_results = results
-        self.like_listbox.delete(0, "end")
+        self.last_results.extend(results)
         for game, score in results:
             self.like_listbox.insert("end", game.name_ko)
 
+        has_more = len(self.last_results) < self.result_cursor.total
+        self.more_button.configure(state="normal" if has_more else "disabled")
+
 
 def main():
     root = tk.Tk()
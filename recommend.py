@@ -1,6 +1,17 @@
 import argparse
-from boardka.loader_excel import load_games_from_excel
-from boardka.recommender import recommend_games
+import cProfile
+import json
+import os
+import sys
+from boardka.api import query_from_dict, result_from_dict, result_to_dict
+from boardka.daemon import DaemonUnavailable, request as daemon_request
+from boardka.metrics import Metrics, stage
+
+# 카탈로그 로딩 / 추천 계산 모듈(numpy 등)은 실제로 직접 계산할 때만 import한다.
+# 데몬(py -m boardka.daemon)이 떠 있으면 질의만 소켓으로 넘기므로 시작이 빠르다.
+
+# 배치 모드에서 한 번에 묶어 처리할 질의 수
+BATCH_CHUNK = 1000
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -9,19 +20,19 @@ def parse_args():
     parser.add_argument(
         "--data",
         default="data/GameList.xlsx",
-        help="보드게임 엑셀 파일 경로",
+        help="보드게임 카탈로그 파일 경로 (확장자로 형식 결정: .xlsx / .csv / .parquet / .arrow)",
     )
     parser.add_argument(
         "--players",
         type=int,
-        required=True,
-        help="플레이어 수",
+        default=None,
+        help="플레이어 수 (--batch가 아니면 필수)",
     )
     parser.add_argument(
         "--time",
         type=int,
-        required=True,
-        help="목표 플레이 시간(분 단위)",
+        default=None,
+        help="목표 플레이 시간(분 단위, --batch가 아니면 필수)",
     )
     parser.add_argument(
         "--difficulty",
@@ -41,28 +52,389 @@ def parse_args():
         default=5,
         help="추천 게임 개수",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="앞에서부터 건너뛸 순위 수 (예: --offset 5 --top-k 5 → 6~10위)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help="파싱된 게임 목록 스냅샷 경로 (기본: 엑셀 / CSV 파일 옆 *.snapshot)",
+    )
+    parser.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="스냅샷을 무시하고 원본 파일을 다시 읽어 새로 저장",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="스냅샷을 사용하지 않음",
+    )
+    parser.add_argument(
+        "--batch",
+        default=None,
+        metavar="QUERIES.jsonl",
+        help="질의를 한 줄에 하나씩 담은 JSONL 파일('-'이면 표준입력). 결과도 한 줄에 하나씩 JSON으로 출력",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="2 이상이면 카탈로그를 나눠 여러 프로세스에서 추천 계산 (아주 큰 카탈로그용)",
+    )
+    parser.add_argument(
+        "--users",
+        default=None,
+        metavar="DIR",
+        help="회원별 선호 태그 폴더 (<회원 id>.json). 회원마다 선호 태그를 반영한 맞춤 추천을 한 번에 출력",
+    )
+    parser.add_argument(
+        "--like",
+        default=None,
+        metavar="NAME|ID",
+        help="이 게임과 비슷한 게임 찾기 (태그 / 난이도 / 시간대 기준, --players를 주면 그 인원으로 거름)",
+    )
+    parser.add_argument(
+        "--daemon-socket",
+        default=None,
+        metavar="PATH",
+        help="추천 데몬 소켓 경로 (기본: $BOARDKA_SOCKET 또는 임시 폴더의 boardka-<uid>.sock)",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="추천 데몬이 떠 있어도 사용하지 않고 직접 계산",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="로딩 / 인원 필터 / 시간 페널티 / 점수 계산 / 정렬 단계별 시간과 개수를 출력 (표준에러)",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        default=None,
+        metavar="FILE.prof",
+        help="cProfile 결과를 파일로 저장 (--profile 포함, snakeviz 등으로 확인)",
+    )
+    args = parser.parse_args()
+    if args.profile_dump:
+        args.profile = True
+    if args.offset < 0:
+        parser.error("--offset은 0 이상이어야 합니다.")
+    if args.top_k < 1:
+        parser.error("--top-k는 1 이상이어야 합니다.")
+    if args.batch is None and args.like is None and (args.players is None or args.time is None):
+        parser.error("--players와 --time은 필수입니다 (--batch / --like 사용 시 제외)")
+    return args
+
+
+def run_batch(args, metrics: Metrics | None = None) -> None:
+    """
+    카탈로그를 한 번만 읽고, 질의 파일을 BATCH_CHUNK개씩 묶어 recommend_many로 처리.
+    입력 순서대로 한 줄씩 JSON 결과를 출력한다.
+    """
+    from boardka.loaders import load_catalog
+
+    catalog = load_catalog(
+        args.data,
+        cache_path=args.cache,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        metrics=metrics,
+    )
+
+    src = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+    try:
+        chunk: list[tuple[int, str]] = []
+        for line_no, line in enumerate(src, start=1):
+            if line.strip():
+                chunk.append((line_no, line))
+            if len(chunk) >= BATCH_CHUNK:
+                _write_batch(catalog, chunk, args.workers, metrics)
+                chunk = []
+        if chunk:
+            _write_batch(catalog, chunk, args.workers, metrics)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        catalog.close()
+
+
+def _write_batch(
+    catalog,
+    chunk: list[tuple[int, str]],
+    workers: int | None = None,
+    metrics: Metrics | None = None,
+) -> None:
+    parsed: list[tuple[int, dict, dict]] = []  # (줄 번호, 원본 JSON, 질의)
+    out: dict[int, dict] = {}
+
+    for line_no, line in chunk:
+        try:
+            raw = json.loads(line)  # 한 줄은 한 번만 해석하고, 출력용 id도 여기서 꺼낸다
+            query = query_from_dict(raw)
+        except (ValueError, TypeError) as e:
+            out[line_no] = {"line": line_no, "error": str(e)}
+            continue
+        parsed.append((line_no, raw, query))
+
+    from boardka.recommender import recommend_many
+
+    results = recommend_many(catalog, [q for _, _, q in parsed], workers=workers, metrics=metrics)
+    for (line_no, raw, _), result in zip(parsed, results):
+        record = {"line": line_no}
+        if "id" in raw:
+            record["id"] = raw["id"]
+        record["results"] = [result_to_dict(g, s) for g, s in result]
+        out[line_no] = record
+
+    for line_no, _ in chunk:
+        sys.stdout.write(json.dumps(out[line_no], ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
 
 def main():
     args = parse_args()
-    games = load_games_from_excel(args.data)
+    metrics = Metrics() if args.profile else None
+    profiler = cProfile.Profile() if args.profile_dump else None
 
-    results = recommend_games(
-        games,
-        players=args.players,
-        target_time=args.time,
-        desired_tags=args.tags,
-        desired_difficulty=args.difficulty,  
-        top_k=5,
+    if profiler is not None:
+        profiler.enable()
+    try:
+        if args.batch is not None:
+            run_batch(args, metrics)
+        elif args.like is not None:
+            run_like(args, metrics)
+        elif args.users is not None:
+            run_users(args, metrics)
+        else:
+            run_single(args, metrics)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile_dump)
+        if metrics is not None:
+            print(metrics.report(), file=sys.stderr)
+            if profiler is not None:
+                print(f"cProfile 결과 저장: {args.profile_dump}", file=sys.stderr)
+
+
+def _can_forward(args, metrics: Metrics | None) -> bool:
+    """
+    데몬에 넘겨도 결과가 같은 실행인지 (계측 / 샤드 / 캐시 옵션은 직접 계산할 때만 의미가 있다)
+    """
+    return not (
+        args.no_daemon
+        or metrics is not None
+        or (args.workers and args.workers > 1)
+        or args.cache is not None
+        or args.no_cache
+        or args.rebuild_cache
     )
 
 
+def forward_to_daemon(args, op: str, top_k: int, **extra) -> dict | None:
+    """
+    데몬에 질의를 넘긴다. 데몬이 없거나, 다른 엑셀을 읽어 둔 데몬이거나, 오류면 None (직접 계산).
+    """
+    payload = {
+        "op": op,
+        "data": os.path.abspath(args.data),
+        "query": {
+            "players": args.players,
+            "time": args.time,
+            "tags": args.tags,
+            "difficulty": args.difficulty,
+            "top_k": top_k,
+        },
+        **extra,
+    }
+    try:
+        reply = daemon_request(payload, args.daemon_socket)
+    except DaemonUnavailable:
+        return None
+    return reply if reply.get("ok") else None
+
+
+def run_single(args, metrics: Metrics | None = None) -> None:
+    if _can_forward(args, metrics):
+        reply = forward_to_daemon(args, "recommend", args.top_k, offset=args.offset)
+        if reply is not None:
+            print_single(args, [result_from_dict(r) for r in reply["results"]], reply["total"])
+            return
+
+    from boardka.loaders import load_catalog, load_games
+    from boardka.recommender import recommend_cursor, recommend_games
+
+    load = load_catalog if args.workers and args.workers > 1 else load_games
+    games = load(
+        args.data,
+        cache_path=args.cache,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        metrics=metrics,
+    )
+
+    total = None
+    try:
+        if (args.workers and args.workers > 1) or metrics is not None:
+            # 샤드 / 계측 경로는 offset까지 포함해 한 번에 계산
+            results = recommend_games(
+                games,
+                players=args.players,
+                target_time=args.time,
+                desired_tags=args.tags,
+                desired_difficulty=args.difficulty,
+                top_k=args.offset + args.top_k,
+                workers=args.workers,
+                metrics=metrics,
+            )[args.offset:]
+        else:
+            cursor = recommend_cursor(
+                games,
+                players=args.players,
+                target_time=args.time,
+                desired_tags=args.tags,
+                desired_difficulty=args.difficulty,
+                page_size=args.top_k,
+            )
+            results = cursor.fetch(args.offset, args.top_k)
+            total = cursor.total
+    finally:
+        if hasattr(games, "close"):
+            games.close()
+
+    print_single(args, results, total)
+
+
+def print_single(args, results, total: int | None) -> None:
     print("\n=== 추천 결과 ===")
+    if not results:
+        if total:
+            # 조건에 맞는 게임은 있지만 --offset이 그보다 크다
+            print(f"조건에 맞는 게임은 {total}개입니다 ({args.offset + 1}위부터는 없음).")
+        else:
+            print("조건에 맞는 게임이 없습니다.")
+        return
+    if total is not None:
+        print(f"(조건에 맞는 {total}개 중 {args.offset + 1}~{args.offset + len(results)}위)\n")
+
+    print_results(results, start=args.offset + 1)
+
+
+def run_users(args, metrics: Metrics | None = None) -> None:
+    """
+    회원별 선호 태그(상위 5개)를 반영한 맞춤 추천을 회원 전체에 대해 한 번에 계산.
+    """
+    if _can_forward(args, metrics):
+        reply = forward_to_daemon(
+            args, "for_users", args.offset + args.top_k, users=os.path.abspath(args.users)
+        )
+        if reply is not None:
+            profiles = {u["id"]: u["preferred_tags"] for u in reply["users"]}
+            by_user = {u["id"]: [result_from_dict(r) for r in u["results"]] for u in reply["users"]}
+            print_users(args, profiles, by_user)
+            return
+
+    from boardka.loaders import load_catalog
+    from boardka.prefs import ProfileStore
+    from boardka.recommender import recommend_for_users
+
+    store = ProfileStore(args.users)
+    try:
+        profiles = store.preferred_tags(5)
+    finally:
+        store.close()
+    if not profiles:
+        print(f"{args.users}에 회원 선호 태그 파일이 없습니다.")
+        return
+
+    catalog = load_catalog(
+        args.data,
+        cache_path=args.cache,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        metrics=metrics,
+    )
+    try:
+        by_user = recommend_for_users(
+            catalog,
+            profiles,
+            players=args.players,
+            target_time=args.time,
+            desired_tags=args.tags,
+            desired_difficulty=args.difficulty,
+            top_k=args.offset + args.top_k,
+            metrics=metrics,
+        )
+    finally:
+        catalog.close()
+
+    print_users(args, profiles, by_user)
+
+
+def print_users(args, profiles: dict, by_user: dict) -> None:
+    if not by_user:
+        print(f"{args.users}에 회원 선호 태그 파일이 없습니다.")
+        return
+    for user_id, results in by_user.items():
+        pref = ", ".join(profiles[user_id]) if profiles[user_id] else "(선호 태그 없음)"
+        print(f"\n=== {user_id} 님 맞춤 추천 (선호: {pref}) ===")
+        results = results[args.offset:]
+        if not results:
+            print("조건에 맞는 게임이 없습니다.")
+            continue
+        print_results(results, start=args.offset + 1)
+
+
+def run_like(args, metrics: Metrics | None = None) -> None:
+    """
+    --like로 지정한 게임과 특징(태그 / 난이도 / 시간대)이 비슷한 게임을 유사도 순으로 출력.
+    """
+    if _can_forward(args, metrics):
+        reply = forward_to_daemon(args, "like", args.offset + args.top_k, like=args.like)
+        if reply is not None:
+            print_like(args, result_from_dict(reply["game"])[0], [result_from_dict(r) for r in reply["results"]])
+            return
+
+    from boardka.loaders import load_catalog
+    from boardka.similar import find_game, similar_games
+
+    catalog = load_catalog(
+        args.data,
+        cache_path=args.cache,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        metrics=metrics,
+    )
+    try:
+        try:
+            game = find_game(catalog.games, args.like)
+        except ValueError as e:
+            print(e)
+            return
+        with stage(metrics, "similar"):
+            results = similar_games(catalog, game, top_k=args.offset + args.top_k, players=args.players)
+    finally:
+        catalog.close()
+
+    print_like(args, game, results)
+
+
+def print_like(args, game, results) -> None:
+    print(f"\n=== '{game.name_ko}'와(과) 비슷한 게임 ===")
+    results = results[args.offset:]
     if not results:
         print("조건에 맞는 게임이 없습니다.")
         return
+    print_results(results, start=args.offset + 1, label="유사도")
+
 
-    for rank, (game, score) in enumerate(results, start=1):
+def print_results(results, start: int = 1, label: str = "점수") -> None:
+    for rank, (game, score) in enumerate(results, start=start):
         tags_str = ", ".join(game.tags) if game.tags else "(태그 없음)"
         print(f"[{rank}] {game.name_ko}")
         print(
@@ -71,7 +443,7 @@ def main():
             f"난이도: {game.difficulty}/5"
         )
         print(f"    태그: {tags_str}")
-        print(f"    점수: {score:.3f}")
+        print(f"    {label}: {score:.3f}")
         print()
 
 
@@ -0,0 +1,19 @@
+# tests/conftest.py
+# 테스트 공통 픽스처: 합성 카탈로그 (bench.synthetic과 같은 분포)
+
+import pytest
+
+from bench.synthetic import generate_games
+
+
+@pytest.fixture(scope="session")
+def synthetic_games():
+    """
+    합성 게임 3,000개 (seed 고정). 테스트마다 목록을 복사해서 쓴다.
+    """
+    return list(generate_games(3_000, seed=7))
+
+
+@pytest.fixture
+def games(synthetic_games):
+    return list(synthetic_games)
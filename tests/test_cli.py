@@ -0,0 +1,44 @@
+# tests/test_cli.py
+# recommend.py 인자 확인 / 출력 (데몬 없이 새 프로세스에서 실행)
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(*argv):
+    return subprocess.run(
+        [sys.executable, "recommend.py", "--no-daemon", *argv],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+
+
+def test_top_k_must_be_positive():
+    out = _run("--players", "4", "--time", "60", "--top-k", "0")
+    assert out.returncode == 2
+    assert "--top-k" in out.stderr
+
+
+def test_offset_past_end_reports_count():
+    out = _run("--players", "4", "--time", "60", "--offset", "100000")
+    assert out.returncode == 0
+    assert "조건에 맞는 게임이 없습니다" not in out.stdout
+    assert "100001위부터는 없음" in out.stdout
+
+
+def test_batch_keeps_line_order_ids_and_errors(tmp_path):
+    path = tmp_path / "queries.jsonl"
+    path.write_text(
+        '{"players": 4, "time": 60, "id": "a"}\n[]\nnot json\n\n{"players": 2, "top_k": 2}\n',
+        encoding="utf-8",
+    )
+    out = _run("--batch", str(path))
+    assert out.returncode == 0
+    records = [json.loads(line) for line in out.stdout.splitlines()]
+    assert [r["line"] for r in records] == [1, 2, 3, 5]
+    assert records[0]["id"] == "a" and len(records[0]["results"]) == 5
+    assert "error" in records[1] and "error" in records[2]
+    assert "id" not in records[3] and len(records[3]["results"]) == 2
@@ -0,0 +1,45 @@
+# tests/test_daemon.py
+# 데몬 시작 전 소켓 경로 확인: 죽은 소켓 파일만 지우고, 다른 파일이나 살아 있는 소켓은 그대로 둔다
+
+import os
+import socket
+
+import pytest
+
+from boardka.daemon import _check_socket_path
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="유닉스 도메인 소켓 없음")
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "boardka.sock")
+
+
+def test_missing_path_is_free(socket_path):
+    assert _check_socket_path(socket_path) is None
+
+
+def test_regular_file_is_kept(socket_path):
+    with open(socket_path, "w", encoding="utf-8") as f:
+        f.write("메모")
+    assert _check_socket_path(socket_path) is not None
+    with open(socket_path, encoding="utf-8") as f:
+        assert f.read() == "메모"
+
+
+def test_stale_socket_is_removed(socket_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(socket_path)
+    sock.close()  # 파일만 남은 죽은 소켓
+    assert os.path.exists(socket_path)
+    assert _check_socket_path(socket_path) is None
+    assert not os.path.exists(socket_path)
+
+
+def test_live_socket_is_kept(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(socket_path)
+        sock.listen(1)  # 요청에 답하지 않는(바쁜) 데몬이라도 연결은 된다
+        assert _check_socket_path(socket_path) is not None
+        assert os.path.exists(socket_path)
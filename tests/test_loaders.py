@@ -0,0 +1,112 @@
+# tests/test_loaders.py
+# 카탈로그 형식 등록부: 엑셀을 CSV / Parquet / Arrow로 바꿔 읽어도 같은 Game 목록 / 배열 컬럼이 되는지 확인
+
+import os
+import random
+import shutil
+
+import numpy as np
+import pytest
+
+from boardka.catalog import GameCatalog
+from boardka.loaders import format_for, load_catalog, load_games, write_games
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("openpyxl")
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def xlsx_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("data") / "GameList.xlsx")
+    shutil.copy(os.path.join(ROOT, "data", "GameList.xlsx"), path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def xlsx_games(xlsx_path):
+    return load_games(xlsx_path, use_cache=False)
+
+
+def _assert_same_catalog(catalog, games):
+    expected = GameCatalog(games)
+    assert catalog.games == expected.games
+    for name in GameCatalog.INT_COLUMNS:
+        assert np.array_equal(getattr(catalog, name), getattr(expected, name)), name
+    assert catalog.tag_index == expected.tag_index
+    assert np.array_equal(catalog.tag_matrix, expected.tag_matrix)
+
+
+@pytest.mark.parametrize("ext", [".csv", ".parquet", ".arrow", ".feather"])
+def test_converted_catalog_round_trip(tmp_path, xlsx_games, ext):
+    path = str(tmp_path / ("GameList" + ext))
+    write_games(path, xlsx_games)
+    assert load_games(path, use_cache=False) == xlsx_games
+    _assert_same_catalog(load_catalog(path, use_cache=False), xlsx_games)
+
+
+@pytest.mark.parametrize("ext", [".csv", ".parquet", ".arrow"])
+def test_raw_sheet_gets_same_cleaning(tmp_path, xlsx_path, xlsx_games, ext):
+    # 정리하지 않은 원본 시트를 그대로 저장해도 엑셀과 같은 정리 규칙이 적용된다
+    df = pd.read_excel(xlsx_path)
+    # Arrow 컬럼은 타입이 하나라서, 숫자 / 문자열이 섞인 열(숫자 이름의 게임 등)은 문자열로 저장된다
+    for name in df.columns:
+        if df[name].dtype == object:
+            df[name] = df[name].map(lambda v: v if v is None or v != v else str(v))
+    path = str(tmp_path / ("raw" + ext))
+    if ext == ".csv":
+        df.to_csv(path, index=False, encoding="cp949")  # 엑셀의 "CSV" 저장 형식
+    elif ext == ".parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path)
+    else:
+        from pyarrow import feather
+
+        feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), path)
+    assert load_games(path, use_cache=False) == xlsx_games
+
+
+def test_clean_table_matches_clean_frame():
+    from boardka.loader_arrow import clean_table
+    from boardka.loader_excel import clean_frame
+
+    rng = random.Random(5)
+
+    def number():
+        return rng.choice([None, float("nan"), 1, 2.7, -3, 5, 120, float("inf")])
+
+    def text_number():
+        return rng.choice([None, "3", " 4 ", "x", "2.5", "7"])
+
+    for _ in range(100):
+        n = rng.randint(0, 30)
+        columns = {}
+        for name in ["id", "난이도", "최소인원", "최대인원", "최소 플레이타임", "최대 플레이타임"]:
+            r = rng.random()
+            if r < 0.1:
+                continue
+            if r < 0.4:
+                columns[name] = pa.array([text_number() for _ in range(n)], pa.string())
+            elif r < 0.7:
+                columns[name] = pa.array([number() for _ in range(n)], pa.float64())
+            else:
+                columns[name] = pa.array([rng.choice([None, 1, 2, 3, 60]) for _ in range(n)], pa.int64())
+        columns["이름"] = pa.array([rng.choice([None, "", "  ", " 카탄 ", "a", "b b"]) for _ in range(n)], pa.string())
+        if rng.random() < 0.9:
+            columns["tags"] = pa.array(
+                [rng.choice([None, "", "a, b", " ,c,, d ", "전략", "x,x"]) for _ in range(n)], pa.string()
+            )
+        table = pa.table(columns)
+
+        frame_games, frame_summary = clean_frame(table.to_pandas())
+        table_games, _, table_summary = clean_table(table)
+        assert table_games == frame_games
+        assert table_summary == frame_summary
+
+
+def test_unknown_extension_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        format_for(str(tmp_path / "GameList.txt"))
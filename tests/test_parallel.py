@@ -0,0 +1,43 @@
+# tests/test_parallel.py
+# 여러 프로세스(샤드) 추천이 한 프로세스 결과와 같고, 임시 카탈로그의 워커 / 공유 메모리를 남기지 않는지 확인
+
+import multiprocessing
+import os
+
+from boardka.catalog import GameCatalog
+from boardka.recommender import recommend_games, recommend_many
+
+QUERY = dict(players=4, target_time=60, desired_tags=["전략", "카드"], desired_difficulty=3, top_k=10)
+
+
+def _ids(results):
+    return [(g.id, round(s, 9)) for g, s in results]
+
+
+def _shm_entries():
+    try:
+        return set(os.listdir("/dev/shm"))
+    except OSError:
+        return set()
+
+
+def test_sharded_matches_single_process(games):
+    catalog = GameCatalog(games)
+    try:
+        expected = _ids(recommend_games(catalog, **QUERY))
+        assert _ids(recommend_games(catalog, workers=2, **QUERY)) == expected
+    finally:
+        catalog.close()
+
+
+def test_sharded_list_input_cleans_up(games):
+    before_shm = _shm_entries()
+    expected = _ids(recommend_games(games, **QUERY))
+    for _ in range(3):
+        assert _ids(recommend_games(games, workers=2, **QUERY)) == expected
+    queries = [QUERY, dict(QUERY, players=2), QUERY]
+    many = recommend_many(games, queries, workers=2)
+    assert [_ids(r) for r in many] == [_ids(recommend_games(games, **q)) for q in queries]
+
+    assert multiprocessing.active_children() == []
+    assert _shm_entries() - before_shm == set()
@@ -0,0 +1,82 @@
+# tests/test_prefs.py
+# 선호 태그 저장소: 로그 / 스냅샷 복원, 망가진 줄 건너뛰기, 다 쓴 저장소가 종료 때까지 남지 않는지 확인
+
+import gc
+import json
+import weakref
+
+from boardka import prefs
+from boardka.prefs import LOG_SUFFIX, PreferenceStore, ProfileStore
+
+
+def test_log_and_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "prefs.json")
+    store = PreferenceStore(path, flush_delay=0, compact_every=3)
+    store.add_tags(["전략", "카드"])
+    store.add_tags(["전략"])
+    store.reset()
+    store.add_tags(["협력"])
+    store.add_tags(["협력", "전략"])
+    store.close()
+
+    reopened = PreferenceStore(path)
+    assert reopened.as_dict() == {"협력": 2, "전략": 1}
+    reopened.close()
+
+
+def test_non_object_log_lines_are_skipped(tmp_path):
+    path = str(tmp_path / "prefs.json")
+    lines = [
+        json.dumps({"seq": 1, "add": ["전략"]}, ensure_ascii=False),
+        "null",
+        "[]",
+        '"전략"',
+        json.dumps({"seq": "2", "add": ["카드"]}, ensure_ascii=False),
+        json.dumps({"seq": 3, "add": ["협력"]}, ensure_ascii=False),
+    ]
+    with open(path + LOG_SUFFIX, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    store = PreferenceStore(path)
+    assert store.as_dict() == {"전략": 1, "협력": 1}
+    store.close()
+
+
+def test_non_object_prefs_snapshot_is_empty(tmp_path):
+    path = str(tmp_path / "prefs.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": prefs.PREFS_VERSION, "seq": 0, "prefs": ["전략"]}, f)
+    store = PreferenceStore(path)
+    assert store.as_dict() == {}
+    store.close()
+
+
+def test_unused_stores_are_not_kept_until_exit(tmp_path):
+    folder = str(tmp_path / "users")
+    writer = ProfileStore(folder, flush_delay=0)
+    writer.get("a").add_tags(["전략"])
+    writer.get("b").add_tags(["카드"])
+    writer.close()
+
+    refs = []
+    for _ in range(5):
+        profiles = ProfileStore(folder)
+        assert profiles.preferred_tags(5) == {"a": ["전략"], "b": ["카드"]}
+        refs.extend(weakref.ref(s) for s in profiles._stores.values())
+        del profiles
+    gc.collect()
+    assert all(r() is None for r in refs)
+    assert not any(s.path.startswith(folder) for s in prefs._open_stores)
+
+
+def test_pending_changes_are_flushed_at_exit(tmp_path):
+    path = str(tmp_path / "prefs.json")
+    store = PreferenceStore(path, flush_delay=60)
+    store.add_tags(["전략"])
+    del store
+    gc.collect()  # 기록 대기 중인 저장소는 타이머가 붙잡고 있다
+
+    prefs._close_open_stores()
+    reopened = PreferenceStore(path)
+    assert reopened.as_dict() == {"전략": 1}
+    reopened.close()
@@ -0,0 +1,52 @@
+# tests/test_session.py
+# GUI 점진 재정렬 세션: 조건을 조금씩 바꿔도 매번 recommend_cursor와 같은 순위 / 점수인지 확인
+
+import random
+
+import pytest
+
+from boardka.catalog import GameCatalog
+from boardka.recommender import recommend_cursor
+from boardka.session import RankingSession
+
+
+@pytest.fixture(scope="module")
+def catalog(synthetic_games):
+    return GameCatalog(synthetic_games)
+
+
+def _page(cursor):
+    return [(g.id, s) for g, s in cursor.fetch(0, 30)]
+
+
+def test_session_matches_recommend_cursor(catalog):
+    tags = sorted(catalog.tag_index)
+    rng = random.Random(3)
+    session = RankingSession(catalog)
+    for _ in range(300):
+        players = rng.choice([2, 3, 4, 4, 5])
+        target_time = rng.choice([None, 60, 60, 90])
+        selected = rng.sample(tags, rng.randint(0, 4)) + (["없는태그"] if rng.random() < 0.1 else [])
+        preferred = rng.sample(tags, rng.randint(0, 5))
+        difficulty = rng.choice([None, 1, 2, 3, 4, 5])
+
+        got = session.update(players, target_time, selected, difficulty, preferred)
+        expected = recommend_cursor(catalog, players, target_time, selected, difficulty, preferred)
+        assert got.total == expected.total
+        assert _page(got) == _page(expected)
+
+
+def test_session_recomputes_only_changed_parts(catalog):
+    session = RankingSession(catalog)
+    session.update(4, 60, ["전략"], 3, ["카드"])
+    assert session.recomputed == ("candidates", "tags", "preferred", "difficulty")
+
+    session.update(4, 60, ["전략", "협력"], 3, ["카드"])
+    assert session.recomputed == ("tags",)
+
+    cursor = session.update(4, 60, ["협력", "전략"], 3, ["카드"])
+    assert session.recomputed == ()
+    assert session.update(4, 60, ["전략", "협력"], 3, ["카드"]) is cursor
+
+    session.update(4, 60, ["전략", "협력"], 2, ["카드"])
+    assert session.recomputed == ("difficulty",)
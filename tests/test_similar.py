@@ -0,0 +1,47 @@
+# tests/test_similar.py
+# "비슷한 게임" 검색: 전체 비교와 같은 결과인지, 후보가 모자랄 때 같은 게임이 두 번 나오지 않는지 확인
+
+from boardka.catalog import GameCatalog
+from boardka.similar import EXACT_SCAN_GAMES, game_features, jaccard, similar_games
+
+
+def _brute_force(games, like, top_k, players=None):
+    features = game_features(like)
+    scored = [
+        (g, jaccard(features, game_features(g)))
+        for g in games
+        if g.id != like.id and (players is None or g.min_players <= players <= g.max_players)
+    ]
+    scored.sort(key=lambda item: (-item[1], item[0].id))
+    return [(g.id, s) for g, s in scored[:top_k]]
+
+
+def _eligible(games, like, players):
+    return [g for g in games if g.id != like.id and g.min_players <= players <= g.max_players]
+
+
+def test_exact_scan_matches_brute_force(games):
+    small = games[: EXACT_SCAN_GAMES // 2]
+    like = small[0]
+    results = similar_games(small, like, top_k=10)
+    assert [(g.id, s) for g, s in results] == _brute_force(small, like, 10)
+
+    # 조건을 통과하는 게임이 top_k개보다 적어도 중복 없이 전부
+    players = max(g.max_players for g in small)
+    eligible = _eligible(small, like, players)
+    results = similar_games(small, like, top_k=len(eligible) + 3, players=players)
+    assert [(g.id, s) for g, s in results] == _brute_force(small, like, len(eligible) + 3, players)
+
+
+def test_lsh_fallback_has_no_duplicates(games):
+    assert len(games) >= EXACT_SCAN_GAMES
+    catalog = GameCatalog(games)
+    like = games[0]
+    players = max(g.max_players for g in games)
+    eligible = _eligible(games, like, players)
+    top_k = len(eligible) + 3
+
+    results = similar_games(catalog, like, top_k=top_k, players=players)
+    ids = [g.id for g, _ in results]
+    assert len(ids) == len(set(ids)) == len(eligible)
+    assert set(ids) == {g.id for g in eligible}
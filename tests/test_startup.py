@@ -0,0 +1,36 @@
+# tests/test_startup.py
+# 스냅샷이 있으면 CLI / GUI 시작 경로가 pandas / openpyxl을 읽지 않는지 (새 프로세스에서) 확인
+# 시간 목표(STARTUP_TARGET_S)는 벤치마크(py -m bench.startup)에서만 잰다
+
+import os
+import shutil
+
+import pytest
+
+from bench.startup import ROOT, _CLI_CHECK, _GUI_CHECK, _run
+from boardka.loader_excel import load_games_from_excel
+
+
+@pytest.fixture(scope="module")
+def data_path(tmp_path_factory):
+    """
+    임시 폴더에 복사한 GameList.xlsx (옆에 유효한 스냅샷을 만들어 둔다)
+    """
+    path = str(tmp_path_factory.mktemp("data") / "GameList.xlsx")
+    shutil.copy(os.path.join(ROOT, "data", "GameList.xlsx"), path)
+    load_games_from_excel(path)
+    assert os.path.exists(path + ".snapshot")
+    return path
+
+
+def test_cli_skips_pandas_with_snapshot(data_path):
+    argv = ["--data", data_path, "--players", "4", "--time", "60", "--no-daemon"]
+    line = _run(_CLI_CHECK.format(argv=argv))
+    assert line.split()[1:] == []
+
+
+def test_gui_loading_skips_pandas_with_snapshot(data_path):
+    line = _run(_GUI_CHECK.format(data=data_path))
+    if line.startswith("SKIP"):
+        pytest.skip(line)
+    assert line.split()[1:] == []
@@ -0,0 +1,62 @@
+# tests/test_tags.py
+# 태그 사전 / 카탈로그 태그 행렬이 같은 게임으로 다른 사전이나 카탈로그를 만들어도 깨지지 않는지 확인
+
+import numpy as np
+
+from boardka.catalog import GameCatalog
+from boardka.models import Game
+from boardka.recommender import recommend_games
+from boardka.tags import TagVocabulary
+
+
+def _games():
+    tags = [["전략"], ["협력", "전략"], ["파티"], ["전략", "카드"], ["협력"], ["카드", "파티", "협력"]]
+    return [
+        Game(
+            id=i + 1,
+            name_ko=f"게임{i + 1}",
+            min_players=2,
+            max_players=5,
+            min_time=30,
+            max_time=90,
+            difficulty=2 + i % 3,
+            tags=t,
+        )
+        for i, t in enumerate(tags)
+    ]
+
+
+def _scores(results):
+    return [(g.id, round(s, 6)) for g, s in results]
+
+
+def test_catalog_survives_other_vocabularies():
+    games = _games()
+    query = dict(players=4, target_time=60, desired_tags=["전략", "협력"], top_k=6)
+    expected = _scores(recommend_games(games, **query))
+
+    catalog = GameCatalog(games)
+    # 같은 게임으로 번호 체계가 다른 사전 / 카탈로그를 또 만들어도 (역순이라 태그 번호가 다르다)
+    other = GameCatalog(list(reversed(games)))
+    TagVocabulary(games[::-1])
+
+    assert _scores(recommend_games(catalog, **query)) == expected
+    assert _scores(recommend_games(other, **query)) == expected
+    assert not hasattr(games[0], "tag_mask")
+
+
+def test_tag_matrix_rows_are_vocab_masks():
+    games = _games()
+    catalog = GameCatalog(games)
+    for row, g in zip(catalog.tag_matrix, games):
+        mask = catalog.vocab.mask_of(g)
+        assert np.flatnonzero(row).tolist() == [i for i in range(len(catalog.vocab)) if mask >> i & 1]
+
+
+def test_copy_counts_are_independent():
+    games = _games()
+    vocab = TagVocabulary(games[:4])
+    copy = vocab.copy()
+    copy.remove_game(games[0])
+    assert vocab.tag_counts()["전략"] == 3
+    assert copy.tag_counts()["전략"] == 2